@@ -2,6 +2,7 @@ import pygame
 import random
 from aliens import AlienShip
 from constants import *
+from timers import every
 
 class AlienField(pygame.sprite.Sprite):
     """ Manages the spawning and timing of alien ships in the game.
@@ -10,12 +11,13 @@ class AlienField(pygame.sprite.Sprite):
     along the edges of the screen. Each alien ship targets the player and avoids asteroids. The class
     maintains a reference to the player and the asteroid objects to ensure proper interaction between
     the aliens and other game elements. """
-    
+    archetype = 'spawner'           # Registry table of spawn fields
+
     def __init__(self, player, asteroids):
         pygame.sprite.Sprite.__init__(self)
         self.player = player        # Reference to the player object
         self.asteroids = asteroids  # Reference to the asteroid list
-        self.spawn_timer = 0.0      # Timer to control spawn intervals
+        self.spawn_timer = every(ALIEN_SPAWN_RATE, self.spawn)  # Spawn on the simulation clock
 
     def spawn(self): # Choose a random spawn position along the screen edges
         edges = [
@@ -28,9 +30,7 @@ class AlienField(pygame.sprite.Sprite):
         alien_ship = AlienShip(position.x, position.y, ALIEN_RADIUS, self.player, self.asteroids,) # Create an alien ship
         return alien_ship
 
-    def update(self, dt):
-        self.spawn_timer += dt                      # Update the spawn timer
-        if self.spawn_timer > ALIEN_SPAWN_RATE:     # Check if it's time to spawn a new alien
-            self.spawn_timer = 0
-            alien = self.spawn()
+    def kill(self):
+        self.spawn_timer.cancel()       # Stop spawning with the field
+        super().kill()
 
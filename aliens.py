@@ -4,10 +4,13 @@ from constants import *
 from circle_shape import CircleShape
 from shot import Shot
 from floating_text import FloatingText
-from circle_shape import Shrapnel
 from text_lists import alien_screams
 from loot import LootSpawner
 from explosion import Explosion
+from collision_layers import ALIEN
+from timestep import scaled_friction
+from particles import emit
+from render_scale import view
 
 class AlienShip(CircleShape):
     class AlienShip(CircleShape):
@@ -23,19 +26,20 @@ class AlienShip(CircleShape):
             triangle(): Calculates the points of the triangle used to represent the alien ship on screen.
             draw(screen): Renders the alien ship as a triangle on the screen.
             update(dt): Updates the alien ship's position, rotation, and behavior each frame.
-            avoid_asteroids(dt): Adjusts the alien's movement to avoid nearby asteroids.
+            avoid_asteroids(dt): Adjusts the alien's movement to avoid asteroids found through the neighbour index.
             move_towards_player(dt): Moves the alien towards the player's position.
             move(force_magnitude): Moves the alien in the direction it is facing by applying a force.
             apply_torque(torque): Changes the alien's angular velocity by applying a rotational force.
-            shoot_if_in_range(): Shoots at the player or nearby asteroids if within range and facing them.
+            shoot_if_in_range(): Shoots at the player, or the nearest asteroid in range that it is facing.
             shoot_at(target): Fires a shot at the specified target if the alien is facing it.
             death(): Handles the alien's death, including visual effects, spawning shrapnel, and dropping loot.
         """
-
+    collision_kind = ALIEN                                              # Collision layer for alien ships
+    archetype = 'alien'                                                 # Registry table of alien ships
+    neighbors = None                                                    # NeighborIndex over the asteroids, rebuilt every step by the Game
 
     def __init__(self, x, y, ALIEN_RADIUS, player_target, asteroids):
         super().__init__(x, y, ALIEN_RADIUS)
-        self.isalien =          True                            # Flag to mark this object as an alien ship
         self.color =            ALIEN_COLOR                     # The color of the alien ship for rendering
         self.move_speed =       ALIEN_MOVE_SPEED                # Speed at which the alien ship moves
         self.turn_speed =       ALIEN_TURN_SPEED                # Speed at which the alien ship turns/rotates
@@ -45,13 +49,9 @@ class AlienShip(CircleShape):
         self.max_speed =        ALIEN_MAX_SPEED                 # Maximum speed the alien ship can reach
         self.max_ang_velocity = ALIEN_MAX_ANGULAR_VELOCITY      # Maximum rotational speed for the alien
         self.target = player_target                             # Reference to the player object
-        self.asteroids = asteroids                              # List of asteroid objects in the game
+        self.asteroids = asteroids                              # Asteroid group, queried through `neighbors`
         self.timer = 0                                          # Shooting cooldown timer
         self.angular_velocity = 0                               # Initial angular velocity (rotation speed)
-        self.forward_velocity = 0                               # Initial forward velocity of the alien ship
-        self.right_velocity = 0                                 # Initial rightward velocity of the alien ship
-        self.forward_direction = pygame.Vector2(0, 1).rotate(self.rotation)
-        self.right_direction = self.forward_direction.rotate(90)
         self.stabiliser_str = ALIEN_STABILISER_STRENGTH         # Strength of stabilisation
         self.score =0
         self.velocity_threshold = STABILISER_VELOSITY_THRESHOLD
@@ -66,18 +66,12 @@ class AlienShip(CircleShape):
 
     def draw(self, screen):
         points = self.triangle()                                      # Draw the alien ship as a triangle
-        pygame.draw.polygon(screen, self.color, points)
+        return pygame.draw.polygon(screen, self.color, view.points(points))   # Area drawn, for the dirty-rect renderer
 
     def update(self, dt):
-        # Update the forward and right directions based on current rotation
-        self.forward_direction = pygame.Vector2(0, 1).rotate(self.rotation)   # Update forward direction based on rotation
-        self.right_direction = self.forward_direction.rotate(90)              # Right direction is perpendicular to forward
         # Apply friction to linear and angular velocities
-        self.velocity *= self.friction                                      # Apply friction to the linear velocity
-        self.angular_velocity *= self.angular_friction                      # Apply friction to the angular velocity
-        # Calculate velocities relative to the ship's facing direction
-        self.forward_velocity = self.velocity.dot(self.forward_direction)   # Calculate forward velocity component
-        self.right_velocity = self.velocity.dot(self.right_direction)       # Calculate rightward velocity component
+        self.velocity *= scaled_friction(self.friction, dt)                 # Apply friction to the linear velocity
+        self.angular_velocity *= scaled_friction(self.angular_friction, dt) # Apply friction to the angular velocity
         # Clamp velocities to maximum values
         if self.velocity.length() > self.max_speed:                         # Ensure velocity doesn't exceed max speed
             self.velocity.scale_to_length(self.max_speed)                   # Scale velocity to max speed if necessary
@@ -99,16 +93,15 @@ class AlienShip(CircleShape):
     def stabilise(self, dt):
         """ Applies stabilisers to reduce small movements and rotational drifts if enabled.
         Args: dt (float): The time delta for frame-based updates."""
-        if abs(self.forward_velocity) < self.velocity_threshold:                    # Stop forward movement if below threshold
-            self.forward_velocity = 0
-        if abs(self.right_velocity) < self.velocity_threshold:                      # Stop rightward movement if below threshold
-            self.right_velocity = 0
+        forward_velocity = self.forward_velocity                                    # Derived from the velocity, read once
+        if abs(forward_velocity) < self.velocity_threshold:                         # Ignore forward movement below threshold
+            forward_velocity = 0
         if abs(self.angular_velocity) < self.velocity_threshold:                    # Stop angular movement if below threshold
             self.angular_velocity = 0
         if not self.is_moving_forward:                                              # If not actively moving forward
-            if self.forward_velocity > 0:
+            if forward_velocity > 0:
                 self.move(-self.move_speed * dt * self.stabiliser_str)              # Stabilise forward movement
-            elif self.forward_velocity < 0:
+            elif forward_velocity < 0:
                 self.move(self.move_speed * dt * self.stabiliser_str)               # Stabilise backward movement
         if not self.is_rotating:                                                    # If not actively rotating
             if self.angular_velocity > 0:
@@ -118,17 +111,18 @@ class AlienShip(CircleShape):
 
 
     def avoid_asteroids(self, dt):
-        for asteroid in self.asteroids:                                                     # Loop through nearby asteroids
-            distance_to_asteroid = self.position.distance_to(asteroid.position)             # Calculate distance to each asteroid
-            if distance_to_asteroid < 150:                                                  # If asteroid is within avoidance range
-                direction_away = (self.position - asteroid.position).normalize()            # Get direction away from the asteroid
-                angle_away = self.forward_direction.angle_to(direction_away)                # Calculate angle to turn away
-                max_torque = self.turn_speed * dt                                           # Calculate max torque for turning
-                torque = max(-max_torque, min(max_torque, (angle_away / 180) * max_torque)) # Apply limited torque to turn
-                self.apply_torque(torque)                                                   # Apply torque to avoid asteroid
-                self.is_rotating = True                                                     # Mark alien as rotating to avoid
-                self.move(-self.move_speed * dt)                                            # Move backward to increase distance
-                self.is_moving_forward = True                                               # Mark alien as moving backward
+        for asteroid in self.neighbors.within(self.position, ALIEN_AVOID_RANGE):            # Loop through asteroids within avoidance range
+            offset = self.position - asteroid.position
+            if offset.length_squared() == 0:
+                continue                                                                    # No direction away from an asteroid at the same spot
+            direction_away = offset.normalize()                                             # Get direction away from the asteroid
+            angle_away = self.forward_direction.angle_to(direction_away)                    # Calculate angle to turn away
+            max_torque = self.turn_speed * dt                                               # Calculate max torque for turning
+            torque = max(-max_torque, min(max_torque, (angle_away / 180) * max_torque))     # Apply limited torque to turn
+            self.apply_torque(torque)                                                       # Apply torque to avoid asteroid
+            self.is_rotating = True                                                         # Mark alien as rotating to avoid
+            self.move(-self.move_speed * dt)                                                # Move backward to increase distance
+            self.is_moving_forward = True                                                   # Mark alien as moving backward
 
 
     def move_towards_player(self, dt):
@@ -145,42 +139,46 @@ class AlienShip(CircleShape):
             self.is_moving_forward = False                                        # Alien is at max speed, no further acceleration
 
     def move(self, force_magnitude):
-        force = self.forward_direction * force_magnitude                    # Calculate force in the forward direction
+        forward = self.forward_direction
+        force = forward * force_magnitude                                   # Calculate force in the forward direction
         self.velocity += force                                              # Apply the force to the ship's velocity
         right = self.right_direction * self.radius / 1.5                    # Calculate the right direction for visual effect
-        b = self.position - self.forward_direction * self.radius - right    # Left trail position for visual effect
-        c = self.position - self.forward_direction * self.radius + right    # Right trail position for visual effect
-        FloatingText(b.x, b.y, "^", self.color, 50)                         # Create floating text visual effect on the left side
-        FloatingText(c.x, c.y, "^", self.color, 50)                        # Create floating text visual effect on the right side
+        b = self.position - forward * self.radius - right                   # Left trail position for visual effect
+        c = self.position - forward * self.radius + right                   # Right trail position for visual effect
+        emit('thruster', b.x, b.y, "^", self.color)                         # Create exhaust particle on the left side
+        emit('thruster', c.x, c.y, "^", self.color)                         # Create exhaust particle on the right side
 
 
     def shoot_if_in_range(self):
         distance_to_player = self.position.distance_to(self.target.position)                # Calculate the distance to the player
         if distance_to_player < self.shooting_range and self.timer <= 0:                    # Check if player is within shooting range and cooldown is over
             self.shoot_at(self.target)                                                      # Shoot at the player if conditions are met
-        for asteroid in self.asteroids:                                                     # Loop through nearby asteroids
-            distance_to_asteroid = self.position.distance_to(asteroid.position)             # Calculate distance to each asteroid
-            if distance_to_asteroid < self.shooting_range and self.timer <= 0:              # Check if asteroid is within range and cooldown is over
-                self.shoot_at(asteroid)                                                     # Shoot at the asteroid if conditions are met
+        if self.timer > 0:
+            return                                                                          # Still cooling down, no need to look for targets
+        for asteroid in self.neighbors.nearest(self.position, radius=self.shooting_range):  # Asteroids within range, nearest first
+            self.shoot_at(asteroid)                                                         # Shoot at the asteroid if it is in the firing arc
+            if self.timer > 0:
+                break                                                                       # Fired, the cooldown has started
 
     def shoot_at(self, target):
         direction_to_target = (target.position - self.position).normalize()                 # Calculate the normalized direction to the target
         angle_diff = self.forward_direction.angle_to(direction_to_target)                   # Calculate the angle difference to the target
         if abs(angle_diff) < 30:                                                            # Check if target is within a 30-degree arc in front
             shot_position = self.position + self.forward_direction * (self.radius + 10)     # Position the shot in front of the alien ship
-            new_shot = Shot(shot_position.x, shot_position.y, SHOT_RADIUS, self)            # Create and fire a new shot
-            new_shot.velocity = ALIEN_SHOT_SPEED * self.forward_direction + self.velocity   # Set shot velocity based on alien's forward direction
-            if new_shot.velocity.length() < PLAYER_SHOT_SPEED:                              # Ensure shot has a minimum speed
-                new_shot.velocity.scale_to_length(PLAYER_SHOT_SPEED)                        # Adjust shot velocity to at least PLAYER_SHOT_SPEED
-            FloatingText(shot_position.x, shot_position.y, "ø", (ALIEN_COLOR), 40)          # Create a visual effect for the shot
+            new_shot = Shot.spawn(shot_position.x, shot_position.y, SHOT_RADIUS, self)      # Create and fire a new shot
+            shot_velocity = ALIEN_SHOT_SPEED * self.forward_direction + self.velocity       # Set shot velocity based on alien's forward direction
+            if shot_velocity.length() < PLAYER_SHOT_SPEED:                                  # Ensure shot has a minimum speed
+                shot_velocity.scale_to_length(PLAYER_SHOT_SPEED)                            # Adjust shot velocity to at least PLAYER_SHOT_SPEED
+            new_shot.velocity = shot_velocity                                               # Apply the velocity to the shot
+            emit('muzzle', shot_position.x, shot_position.y, "ø", ALIEN_COLOR)              # Create a visual effect for the shot
             self.timer = ALIEN_SHOOT_COOLDOWN                                               # Reset shooting cooldown timer
 
     def death(self):
         scream = random.choice(alien_screams)                                       # Choose a random alien scream
-        FloatingText(self.position.x, self.position.y, scream, ALIEN_COLOR, 3000)   # Display scream as floating text
-        explosion = Explosion(self.position.x, self.position.y, 7)                  # Create an explosion at the alien's position
+        FloatingText.spawn(self.position.x, self.position.y, scream, ALIEN_COLOR, 3000)  # Display scream as floating text
+        explosion = Explosion.spawn(self.position.x, self.position.y, 7)            # Create an explosion at the alien's position
         if random.random() < LOOT_DROP_CHANCE:                                      # Spawn loot based on a random chance
-            new_loot = LootSpawner(self, self.position.x, self.position.y, 20, 1)   # Spawn loot with a 1s delay
+            new_loot = LootSpawner(self, self.position.x, self.position.y, LOOT_RADIUS, 1)   # Spawn loot with a 1s delay
         self.kill()                                                                 # Remove the alien from the game
     
     def shrapnel_obj(self, mass):
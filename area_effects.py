@@ -0,0 +1,77 @@
+"""
+Area-of-effect pass for force fields (explosions and black holes).
+
+Fields do not take part in pairwise collision. Once the collision grid is filled for the step, each field
+looks up every object within its far radius with a single `SpatialHash.query`, and the near, mid and far
+force bands are worked out for all of them in one NumPy pass by `band_forces`. The resulting forces are
+written straight into the `PhysicsWorld` velocity array for attached bodies and through `apply_force()`
+for the rest. Each field then gets the objects it affected, so an explosion can expire and a black hole
+can swallow whatever reached its core.
+"""
+
+import numpy as np
+import pygame
+from collision_layers import FIELD_TARGETS
+from physics_world import gather
+
+def band_forces(center, positions, radii, bands, strengths):
+    """
+    Computes the force a field applies to many objects at once.
+
+    Args:
+        center (tuple): Position of the field.
+        positions (ndarray): (m, 2) array of object positions.
+        radii (ndarray): (m,) array of object radii.
+        bands (tuple): (near, mid, far) band radii of the field.
+        strengths (tuple): (near, mid, far) force along the direction away from the field, negative to pull.
+
+    Returns:
+        tuple: (forces, distances, affected) where `forces` is the (m, 2) force on each object,
+        `distances` its distance to the field and `affected` marks objects reaching into the far band.
+    """
+    offsets = positions - np.asarray(center, dtype=float)
+    distances = np.hypot(offsets[:, 0], offsets[:, 1])
+    near, mid, far = bands
+    affected = distances <= far + radii                                     # Objects touching the far band
+    strength = np.select([distances <= near, distances <= mid], strengths[:2], strengths[2])
+    directions = np.zeros_like(offsets)
+    away = distances > 0
+    directions[away] = offsets[away] / distances[away, None]                # Unit vector away from the field
+    forces = directions * strength[:, None]
+    forces[~affected] = 0
+    return forces, distances, affected
+
+def apply_fields(fields, grid, dt, world=None):
+    """
+    Applies every field in `fields` to the objects registered with `grid` within its far radius, for a
+    step of `dt` seconds.
+
+    Returns the number of objects affected.
+    """
+    total = 0
+    for field in fields:
+        others = [obj for obj in grid.query(field.position, field.far_radius)
+                  if obj.collision_kind in FIELD_TARGETS]
+        if not others:
+            field.field_applied([], np.empty(0))
+            continue
+        positions = gather(others, 'position', world)
+        radii = gather(others, 'radius', world)
+        bands = (field.near, field.mid_radius, field.far_radius)
+        forces, distances, affected = band_forces(tuple(field.position), positions, radii, bands,
+                                                  field.field_strengths(dt))
+        hits = np.flatnonzero(affected).tolist()
+        rows = []
+        row_forces = []
+        for k in hits:
+            obj = others[k]
+            if world is not None and getattr(obj, 'world_row', None) is not None:
+                rows.append(obj.world_row)                                  # Written to the world arrays in one go
+                row_forces.append(k)
+            else:
+                obj.apply_force(pygame.Vector2(forces[k].tolist()))
+        if rows:
+            world.velocity[rows] += forces[row_forces]
+        field.field_applied([others[k] for k in hits], distances[hits])
+        total += len(hits)
+    return total
@@ -1,24 +1,28 @@
-import pygame                                  # Import the Pygame library for graphics
 import random                                  # Import the random library for generating random values
 from circle_shape import CircleShape            # Import the CircleShape base class for asteroid inheritance
-from floating_text import FloatingText         # Import for displaying floating text in the game
 from constants import *                        # Import game constants used for configuration
+from physics_world import WorldBody            # Mixin that lets the physics world integrate the asteroid
+from timestep import scaled_friction           # Keeps friction independent of the simulation tick rate
+from asteroid_textures import asteroid_texture # Shared, pre-baked asteroid textures
+from render_scale import view                # Maps positions and textures to the render scale
 
-class Asteroid(CircleShape):
+class Asteroid(WorldBody, CircleShape):
     """Class representing an asteroid that can split into smaller pieces or create shrapnel upon destruction."""
+    archetype = 'asteroid'                            # Registry table of asteroids
 
-    def __init__(self, x, y, radius, RGB=(150, 150, 150), ):
+    def __init__(self, x, y, radius, RGB=ASTEROID_COLOR, ):
         super().__init__(x, y, radius)             # Initialize base CircleShape with position and radius
         self.color = RGB                           # Set the color of the asteroid
         self.angular_velocity = 0                  # Disable angular velocity
         self.radius = radius                       # Set the asteroid's radius
-        self.texture = generate_circular_texture(self.radius, self.color)  # Generate a texture based on the radius and color
+        self.texture = asteroid_texture(self.radius, self.color)  # Look up a pre-baked texture for the radius and color
         self.image = self.texture                  # Set the texture as the asteroid's image
         self.rect = self.image.get_rect(center=(int(self.position.x), int(self.position.y)))  # Get rectangle around the image
 
     def update(self, dt):
-        self.position += self.velocity * dt        # Update position based on velocity and delta time
-        self.velocity *= self.friction             # Apply friction to gradually slow down movement
+        if self.world_row is None:                 # Attached asteroids are moved by the physics world
+            self.position += self.velocity * dt    # Update position based on velocity and delta time
+            self.velocity *= scaled_friction(self.friction, dt)  # Apply friction to gradually slow down movement
         self.rect = self.image.get_rect(center=(int(self.position.x), int(self.position.y)))  # Update image rectangle position
 
     def shrapnel_obj(self, mass):
@@ -47,27 +51,6 @@ class Asteroid(CircleShape):
 
     def draw(self, screen):
         """Draw the asteroid on the screen."""
-        screen.blit(self.image, self.rect.topleft)                                  # Draw the asteroid image at the updated position
-
-def generate_circular_texture(radius, base_color):
-    """Generate a circular texture with noise for the asteroid."""
-    texture_size = radius * 2                                                       # Texture size is based on diameter of the asteroid
-    texture = pygame.Surface((texture_size, texture_size), pygame.SRCALPHA)         # Create a surface with transparency
-    texture.fill((0, 0, 0, 0))                                                      # Fill the surface with a transparent background
-    center = pygame.Vector2(radius, radius)                                         # Define the center of the texture
-    pygame.draw.circle(texture, base_color, (int(center.x), int(center.y)), radius) # Draw the main circle for the asteroid
-
-    for _ in range(1000):                                                           # Add random noise to the texture for a more natural look
-        rand_x = random.randint(0, texture_size - 1)                                # Random X coordinate within the texture
-        rand_y = random.randint(0, texture_size - 1)                                # Random Y coordinate within the texture
-        distance = pygame.Vector2(rand_x, rand_y).distance_to(center)               # Calculate distance from the center
-        if distance <= radius:                                                      # Only apply noise within the circular boundary
-            brightness = random.randint(-50, 50)                                    # Random brightness variation
-            random_color = (
-                max(0, min(255, base_color[0] + brightness)),                       # Adjust red channel
-                max(0, min(255, base_color[1] + brightness)),                       # Adjust green channel
-                max(0, min(255, base_color[2] + brightness)),                       # Adjust blue channel
-                255                                                                 # Keep fully opaque
-            )
-            texture.set_at((rand_x, rand_y), random_color)                          # Apply the random color to the texture
-    return texture                                                                  # Return the generated texture for use
+        position = self.position                                                    # May be an interpolated position between steps
+        image = view.surface(self.image)                                            # Texture resized to the render scale
+        return screen.blit(image, image.get_rect(center=view.point((int(position.x), int(position.y)))))  # Draw the asteroid image centred on it
@@ -0,0 +1,105 @@
+"""
+Baked, cached asteroid textures.
+
+A texture is a filled circle sprinkled with brightness noise. `bake_texture` draws all the noise in one
+NumPy pass through `pygame.surfarray` instead of one `set_at` per pixel. `TextureCache` keeps a few
+pre-baked variants for every (radius, color) in use, so spawning an asteroid, a split child or a piece of
+loot only looks a texture up. The cache holds at most `ASTEROID_TEXTURE_CACHE_SIZE` keys, evicting the
+least recently used, and `prewarm` bakes every size the game spawns before the first frame.
+
+Textures are shared between asteroids and must only be blitted, never drawn on.
+"""
+
+import random
+from collections import OrderedDict
+import numpy as np
+import pygame
+from constants import *
+
+NOISE_POINTS = 1000                                         # Noise pixels scattered over each texture
+NOISE_BRIGHTNESS = 50                                       # Largest brightness change of a noise pixel
+
+def bake_texture(radius, base_color):
+    """Generates a circular texture with noise, like a rough rock surface."""
+    texture_size = int(radius * 2)                                                  # Texture size is based on diameter of the asteroid
+    texture = pygame.Surface((texture_size, texture_size), pygame.SRCALPHA)         # Create a surface with transparency
+    texture.fill((0, 0, 0, 0))                                                      # Fill the surface with a transparent background
+    pygame.draw.circle(texture, base_color, (int(radius), int(radius)), radius)     # Draw the main circle for the asteroid
+    if texture_size == 0:
+        return texture
+    xs = np.random.randint(0, texture_size, NOISE_POINTS)                           # Random noise coordinates within the texture
+    ys = np.random.randint(0, texture_size, NOISE_POINTS)
+    inside = np.hypot(xs - radius, ys - radius) <= radius                           # Only apply noise within the circular boundary
+    xs, ys = xs[inside], ys[inside]
+    brightness = np.random.randint(-NOISE_BRIGHTNESS, NOISE_BRIGHTNESS + 1, len(xs))
+    colors = np.clip(np.array(base_color[:3])[None, :] + brightness[:, None], 0, 255)  # Brightness variation per noise pixel
+    pixels = pygame.surfarray.pixels3d(texture)                                     # Direct views on the texture, locked until deleted
+    alpha = pygame.surfarray.pixels_alpha(texture)
+    pixels[xs, ys] = colors
+    alpha[xs, ys] = 255                                                             # Keep noise fully opaque
+    del pixels, alpha                                                               # Unlock the surface
+    return texture
+
+class TextureCache():
+    """
+    Bounded cache of pre-baked texture variants per (radius, color).
+
+    Attributes:
+        variants (int): Textures baked per key, one is picked at random for each asteroid.
+        max_keys (int): Keys kept before the least recently used one is evicted.
+        hits (int): Lookups served from baked textures.
+        misses (int): Lookups that had to bake a texture.
+    """
+
+    def __init__(self, variants=ASTEROID_TEXTURE_VARIANTS, max_keys=ASTEROID_TEXTURE_CACHE_SIZE):
+        self.variants = variants
+        self.max_keys = max_keys
+        self.textures = OrderedDict()                       # (radius, color) -> list of baked variants
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, radius, color):
+        """Returns a texture for an asteroid of `radius` and `color`, baking variants on first use."""
+        key = (radius, tuple(color))
+        baked = self.textures.get(key)
+        if baked is None:
+            baked = []
+            self.textures[key] = baked
+            while len(self.textures) > self.max_keys:
+                self.textures.popitem(last=False)           # Drop the least recently used size and color
+        else:
+            self.textures.move_to_end(key)
+        if len(baked) < self.variants:
+            self.misses += 1
+            baked.append(bake_texture(radius, color))       # Fill up the variants as asteroids spawn
+            return baked[-1]
+        self.hits += 1
+        return random.choice(baked)
+
+    def prewarm(self, keys):
+        """Bakes every variant of each (radius, color) in `keys` ahead of time."""
+        for radius, color in keys:
+            baked = self.textures.setdefault((radius, tuple(color)), [])
+            while len(baked) < self.variants:
+                baked.append(bake_texture(radius, color))
+
+def spawned_texture_keys():
+    """Returns the (radius, color) of every asteroid and loot the game spawns, split children included."""
+    radii = set()
+    for kind in range(1, ASTEROID_KINDS + 1):
+        radius = ASTEROID_MIN_RADIUS * kind
+        radii.add(radius)
+        while radius > ASTEROID_MIN_RADIUS:                 # Asteroids above the minimum split in halves
+            radius /= 2
+            radii.add(radius)
+    keys = [(radius, ASTEROID_COLOR) for radius in sorted(radii)]
+    loot_colors = (LOOT_COLOR_HEALTH, LOOT_COLOR_SPEED, LOOT_COLOR_SCORE, LOOT_COLOR_FIRE,
+                   LOOT_COLOR_ROTATION, LOOT_COLOR_STABILISERS, LOOT_COLOR_DMG)
+    keys += [(LOOT_RADIUS, color) for color in loot_colors]
+    return keys
+
+textures = TextureCache()                                   # Shared by every Asteroid and Loot
+
+def asteroid_texture(radius, color):
+    """Returns a shared texture for an asteroid, see `TextureCache.get()`."""
+    return textures.get(radius, color)
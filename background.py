@@ -1,59 +1,171 @@
-import pygame                                      # Pygame library for rendering and surface manipulation
-import random                                      # Random library for generating random positions and sizes
-from PIL import Image, ImageFilter                 # PIL for applying Gaussian blur to planet textures
+"""
+Starfield and planet background generation.
 
-def generate_star_and_planet_background(screen_width, screen_height, num_stars, num_planets, color_range):
+The background is built as NumPy pixel layers: every star is stamped in one vectorized pass, each planet is
+drawn and Gaussian-blurred inside its own bounding box only, and the blurred planets are alpha-blended onto
+the stars. The result depends only on the seed and the settings, so `BackgroundLoader` keeps generated
+backgrounds on disk keyed by seed and resolution, and generates new ones on a worker thread while the
+previous background stays on screen.
+"""
+
+import os
+import threading
+import numpy as np
+import pygame
+from constants import BACKGROUND_BLUR_SIGMA, BACKGROUND_CACHE_DIR
+
+SPACE_COLOR = (8, 8, 20)                           # Dark background for space
+PLANET_RADII = (30, 100)                           # Smallest and largest planet radius
+PLANET_NOISE_SIZE = 5                              # Largest noise blob on a planet
+
+def generate_star_and_planet_background(screen_width, screen_height, num_stars, num_planets, color_range, seed=None):
     """Generates a space-themed background with stars and planets, including Gaussian blur on planets."""
-    stars_surface = generate_stars(screen_width, screen_height, num_stars, color_range)                # Step 1: Generate stars
-    planets_surface = generate_planets(screen_width, screen_height, num_planets, color_range)          # Step 2: Generate planets
-    blurred_planets_surface = apply_blur_to_planets(planets_surface)                                   # Step 3: Apply Gaussian blur
-    final_background = combine_stars_and_planets(stars_surface, blurred_planets_surface)               # Step 4: Combine stars and planets
-    return final_background
-
-def generate_stars(screen_width, screen_height, num_stars, color_range):
-    """Generates a surface with random stars."""
-    stars_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)  # Create a transparent surface
-    stars_surface.fill((8, 8, 20))                                                  # Dark background for space
-    for _ in range(num_stars):
-        x = random.randint(0, screen_width)                                         # Random X position for star
-        y = random.randint(0, screen_height)                                        # Random Y position for star
-        star_size = random.randint(1, 2)                                            # Random star size (1-2 pixels)
-        star_color = (random.randint(*color_range),                                 # Random star color
-                      random.randint(*color_range), 
-                      random.randint(*color_range))
-        pygame.draw.circle(stars_surface, star_color, (x, y), star_size)            # Draw the star as a small circle
-    return stars_surface
-
-def generate_planets(screen_width, screen_height, num_planets, color_range):
-    """Generates a surface with random planets."""
-    planets_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)  # Create transparent surface for planets
+    rng = np.random.default_rng(seed)                                                                  # Same seed, same background
+    pixels = generate_stars(screen_width, screen_height, num_stars, color_range, rng)                   # Step 1: Generate stars
+    for x0, y0, planet in generate_planets(screen_width, screen_height, num_planets, color_range, rng): # Step 2: Generate planets
+        planet = apply_blur_to_planet(planet)                                                           # Step 3: Blur the planet's box
+        combine_stars_and_planet(pixels, x0, y0, planet)                                                # Step 4: Blend it onto the stars
+    return pygame.surfarray.make_surface(pixels)
+
+def generate_stars(screen_width, screen_height, num_stars, color_range, rng):
+    """Returns a (width, height, 3) pixel array of random stars of radius 1-2 pixels on dark space."""
+    pixels = np.empty((screen_width, screen_height, 3), dtype=np.uint8)
+    pixels[:] = SPACE_COLOR
+    xs = rng.integers(0, screen_width, num_stars)                                   # Random positions for the stars
+    ys = rng.integers(0, screen_height, num_stars)
+    sizes = rng.integers(1, 3, num_stars)                                           # Random star radius (1-2 pixels)
+    colors = rng.integers(color_range[0], color_range[1] + 1, (num_stars, 3), dtype=np.uint8)  # Random star colors
+    for size in (1, 2):
+        chosen = sizes == size
+        span = np.arange(-size, size)
+        for dx in span:                                                             # Stamp the pixels pygame.draw.circle fills:
+            for dy in span:                                                         # a 2x2 block, or 4x4 without its corners
+                if (2 * dx + 1) ** 2 + (2 * dy + 1) ** 2 > 4 * size * size:         # Pixel centre outside the radius
+                    continue
+                px = np.clip(xs[chosen] + dx, 0, screen_width - 1)
+                py = np.clip(ys[chosen] + dy, 0, screen_height - 1)
+                pixels[px, py] = colors[chosen]
+    return pixels
+
+def generate_planets(screen_width, screen_height, num_planets, color_range, rng):
+    """
+    Returns every planet as (x0, y0, patch), where `patch` is a float RGBA array of the planet's bounding
+    box, padded so the blur has room, and (x0, y0) is the screen position of the patch's top-left corner.
+    """
+    margin = PLANET_NOISE_SIZE + blur_radius()                                      # Noise and blur spill past the planet
+    planets = []
     for _ in range(num_planets):
-        x = random.randint(0, screen_width)                                           # Random X position for planet
-        y = random.randint(0, screen_height)                                          # Random Y position for planet
-        planet_radius = random.randint(30, 100)                                       # Random radius for planet
-        planet_color = (random.randint(*color_range),                                 # Random planet color
-                        random.randint(*color_range), 
-                        random.randint(*color_range))
-        pygame.draw.circle(planets_surface, planet_color, (x, y), planet_radius)      # Draw planet as a large circle
-        for _ in range(random.randint(20, 50)):                                       # Add random noise/texture
-            noise_x = x + random.randint(-planet_radius, planet_radius)               # Random noise position near planet
-            noise_y = y + random.randint(-planet_radius, planet_radius)
-            noise_size = random.randint(1, 5)                                         # Random noise size
-            noise_color = (random.randint(50, 100), random.randint(50, 150), random.randint(50, 100))  # Noise color
-            pygame.draw.circle(planets_surface, noise_color, (noise_x, noise_y), noise_size)           # Draw noise
-    return planets_surface
-
-def apply_blur_to_planets(planets_surface):
-    """Applies Gaussian blur to the planet surface using Pillow."""
-    str_format = pygame.image.tostring(planets_surface, "RGBA")                       # Convert Pygame surface to Pillow image
-    img = Image.frombytes("RGBA", planets_surface.get_size(), str_format)             # Create Pillow image
-    img = img.filter(ImageFilter.GaussianBlur(radius=2))                              # Apply Gaussian blur with radius 2
-    blurred_str = img.tobytes()                                                       # Convert back to Pygame surface
-    blurred_planets_surface = pygame.image.fromstring(blurred_str, planets_surface.get_size(), "RGBA")
-    return blurred_planets_surface
-
-def combine_stars_and_planets(stars_surface, planets_surface):
-    """Combines the star and planet surfaces into a final background."""
-    final_surface = stars_surface.copy()                                              # Copy star surface as base
-    final_surface.blit(planets_surface, (0, 0))                                       # Overlay planets onto the stars
-    return final_surface
\ No newline at end of file
+        x = int(rng.integers(0, screen_width + 1))                                  # Random position for planet
+        y = int(rng.integers(0, screen_height + 1))
+        planet_radius = int(rng.integers(PLANET_RADII[0], PLANET_RADII[1] + 1))     # Random radius for planet
+        planet_color = rng.integers(color_range[0], color_range[1] + 1, 3)          # Random planet color
+        extent = planet_radius + margin
+        size = extent * 2 + 1
+        patch = np.zeros((size, size, 4), dtype=np.float32)                         # Transparent box around the planet
+        px, py = np.ogrid[-extent:extent + 1, -extent:extent + 1]                   # Patch coordinates relative to the centre
+        paint_disc(patch, px, py, 0, 0, planet_radius, planet_color)                # Draw planet as a large circle
+        for _ in range(int(rng.integers(20, 51))):                                  # Add random noise/texture
+            noise_x, noise_y = rng.integers(-planet_radius, planet_radius + 1, 2)   # Random noise position near planet
+            noise_size = int(rng.integers(1, PLANET_NOISE_SIZE + 1))                # Random noise size
+            noise_color = (rng.integers(50, 101), rng.integers(50, 151), rng.integers(50, 101))
+            paint_disc(patch, px, py, noise_x, noise_y, noise_size, noise_color)    # Draw noise
+        planets.append((x - extent, y - extent, patch))
+    return planets
+
+def paint_disc(patch, px, py, cx, cy, radius, color):
+    """Paints an opaque disc of `radius` centred on (cx, cy) into an RGBA patch."""
+    inside = (px - cx) ** 2 + (py - cy) ** 2 < radius * radius
+    patch[inside] = (color[0], color[1], color[2], 255)
+
+def blur_radius():
+    return int(3 * BACKGROUND_BLUR_SIGMA)                                           # Gaussian taps beyond 3 sigma are negligible
+
+def apply_blur_to_planet(patch):
+    """Applies a separable Gaussian blur to a planet's RGBA patch."""
+    radius = blur_radius()
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-offsets ** 2 / (2 * BACKGROUND_BLUR_SIGMA ** 2))
+    kernel /= kernel.sum()
+    for axis in (0, 1):
+        padding = [(0, 0)] * 3
+        padding[axis] = (radius, radius)
+        padded = np.pad(patch, padding)
+        length = patch.shape[axis]
+        blurred = np.zeros_like(patch)
+        for tap, weight in enumerate(kernel):                                       # Sum the shifted, weighted copies
+            blurred += weight * np.take(padded, np.arange(tap, tap + length), axis=axis)
+        patch = blurred
+    return patch
+
+def combine_stars_and_planet(pixels, x0, y0, patch):
+    """Alpha-blends a planet patch onto the star pixels, clipped to the screen."""
+    width, height = pixels.shape[:2]
+    x1, y1 = x0 + patch.shape[0], y0 + patch.shape[1]
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x1, width), min(y1, height)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return                                                                      # Planet entirely off screen
+    planet = patch[cx0 - x0:cx1 - x0, cy0 - y0:cy1 - y0]
+    alpha = planet[:, :, 3:] / 255
+    region = pixels[cx0:cx1, cy0:cy1]
+    region[:] = np.clip(region * (1 - alpha) + planet[:, :, :3] * alpha, 0, 255)   # Overlay planets onto the stars
+
+class BackgroundLoader():
+    """
+    Produces backgrounds from a seed, from the disk cache when possible, optionally on a worker thread.
+
+    Attributes:
+        size (tuple): Width and height of the backgrounds in pixels.
+        cache_dir (str): Directory holding generated backgrounds, None disables the disk cache.
+        worker (Thread): Worker generating the requested background, None when idle.
+    """
+
+    def __init__(self, width, height, num_stars, num_planets, color_range, cache_dir=BACKGROUND_CACHE_DIR):
+        self.size = (width, height)
+        self.settings = (num_stars, num_planets, tuple(color_range))
+        self.cache_dir = cache_dir
+        self.worker = None
+        self.result = None                                                          # Finished background waiting for poll()
+        self.lock = threading.Lock()
+
+    def cache_path(self, seed):
+        """Returns the disk cache file for a seed; the settings are part of the name so stale files never match."""
+        num_stars, num_planets, color_range = self.settings
+        name = f"background_{seed}_{self.size[0]}x{self.size[1]}_{num_stars}_{num_planets}_{color_range[0]}-{color_range[1]}.png"
+        return os.path.join(self.cache_dir, name)
+
+    def load(self, seed):
+        """Returns the background for `seed`, read from the disk cache or generated and cached."""
+        if self.cache_dir is not None:
+            path = self.cache_path(seed)
+            if os.path.exists(path):
+                try:
+                    return pygame.image.load(path)
+                except pygame.error as e:
+                    print(f"Error loading cached background: {e}")
+        background = generate_star_and_planet_background(*self.size, *self.settings, seed=seed)
+        if self.cache_dir is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pygame.image.save(background, path)
+            except (IOError, pygame.error) as e:
+                print(f"Error caching background: {e}")
+        return background
+
+    def request(self, seed):
+        """Starts producing the background for `seed` on a worker thread; `poll()` returns it when done."""
+        if self.worker is not None and self.worker.is_alive():
+            return                                                                  # Keep the background already on its way
+        self.worker = threading.Thread(target=self.work, args=(seed,), daemon=True)
+        self.worker.start()
+
+    def work(self, seed):
+        background = self.load(seed)
+        with self.lock:
+            self.result = background
+
+    def poll(self):
+        """Returns the requested background once it is ready, and None until then."""
+        with self.lock:
+            background, self.result = self.result, None
+        return background
@@ -0,0 +1,185 @@
+"""
+Scenario-driven benchmark suite for simulation and rendering throughput.
+
+Each scenario builds a scripted situation from the game's own classes (a field of asteroids spawned through
+`AsteroidField.spawn`, a swarm of `AlienShip`s, several `BlackHole`s, a shrapnel storm from
+`create_shrapnel`), then runs a fixed number of frames with a fixed seed on the headless pipeline. For every
+scenario it reports frames per second and p50/p95/p99 frame times, broken down into the update, collision
+and draw phases measured by `Game`, and writes everything to a JSON file so runs can be compared over time.
+
+Usage:
+    python3 benchmark.py                                    # Every scenario, results in benchmark_results.json
+    python3 benchmark.py --scenario asteroids_2000 --frames 600 --output before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import time
+import numpy as np
+import pygame
+from constants import *
+from circle_shape import CircleShape
+from black_hole import BlackHole
+from physics_world import WorldBody
+from memory_report import memory_report
+
+PHASES = ('update', 'collision', 'draw')                    # Phases timed by Game for every frame
+
+def random_position():
+    """Returns a random position on screen."""
+    return pygame.Vector2(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT))
+
+def drifting_velocity(min_speed=20, max_speed=80):
+    """Returns a slow velocity in a random direction, so bodies stay on screen for the whole run."""
+    return pygame.Vector2(random.uniform(min_speed, max_speed), 0).rotate(random.uniform(0, 360))
+
+def asteroids(count):
+    """Scenario: `count` asteroids of every kind spawned through AsteroidField.spawn."""
+    def build(game):
+        for _ in range(count):
+            radius = ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS)
+            game.asteroid_field.spawn(radius, random_position(), drifting_velocity())
+    return build
+
+def alien_swarm(count, asteroid_count):
+    """Scenario: `count` alien ships from AlienField.spawn hunting the player through a field of asteroids."""
+    def build(game):
+        asteroids(asteroid_count)(game)
+        for _ in range(count):
+            alien = game.alien_field.spawn()
+            alien.position = random_position()              # Spread the swarm over the screen
+    return build
+
+def black_holes(count, asteroid_count):
+    """Scenario: `count` slow black holes pulling a field of asteroids."""
+    def build(game):
+        asteroids(asteroid_count)(game)
+        for _ in range(count):
+            black_hole = BlackHole()
+            black_hole.position = random_position()
+            black_hole.velocity = drifting_velocity(5, 20)
+    return build
+
+def shrapnel_storm(sources, mass, interval):
+    """Scenario: `sources` objects bursting into shrapnel of `mass` every `interval` frames."""
+    def burst(game):
+        for _ in range(sources):
+            source = CircleShape(*random_position(), ASTEROID_MAX_RADIUS)   # Not in any group, only bursts
+            source.velocity = drifting_velocity(100, 300)
+            source.create_shrapnel(mass)
+    def build(game):
+        burst(game)
+    def every_frame(game, frame):
+        if frame % interval == 0:
+            burst(game)
+    return build, every_frame
+
+def split_cascade(count, destroyed, interval):
+    """Scenario: `count` asteroids, `destroyed` of them blown up every `interval` frames to split into pieces and shrapnel."""
+    def every_frame(game, frame):
+        if frame % interval == 0:
+            targets = game.asteroid_group.sprites()
+            for asteroid in random.sample(targets, min(destroyed, len(targets))):
+                asteroid.shrapnel_obj(asteroid.radius)
+    return asteroids(count), every_frame
+
+SCENARIOS = {
+    'asteroids_500':    asteroids(500),
+    'asteroids_2000':   asteroids(2000),
+    'asteroids_10000':  asteroids(10000),
+    'alien_swarm':      alien_swarm(50, 200),
+    'black_holes':      black_holes(4, 500),
+    'shrapnel_storm':   shrapnel_storm(20, 300, 30),
+    'split_cascade':    split_cascade(500, 40, 10),
+}
+
+def percentiles(samples):
+    """Returns mean, p50, p95, p99 and max of a list of seconds, in milliseconds."""
+    values = np.array(samples) * 1000
+    return {
+        'mean': float(values.mean()),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(values.max()),
+    }
+
+def run_scenario(name, frames, seed, draw=True):
+    """Builds one scenario on a fresh game and runs it for `frames` fixed steps."""
+    from game import Game                                   # Import after the video driver is chosen
+    random.seed(seed)
+    np.random.seed(seed)
+    game = Game()
+    scenario = SCENARIOS[name]
+    build, every_frame = scenario if isinstance(scenario, tuple) else (scenario, None)
+    build(game)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if draw else None
+    dt = 1 / SIMULATION_TICK_RATE
+    entities_start = len(game.updatable)
+    frame_times = []
+    phase_times = {phase: [] for phase in PHASES}
+    for frame in range(frames):
+        if every_frame is not None:
+            every_frame(game, frame)
+        start = time.perf_counter()
+        game.step(dt, [])
+        if surface is not None:
+            game.draw(surface)
+        frame_times.append(time.perf_counter() - start)
+        for phase in PHASES:
+            phase_times[phase].append(game.timings[phase])
+    result = {
+        'frames': frames,
+        'fps': frames / sum(frame_times),
+        'frame_ms': percentiles(frame_times),
+        'phases_ms': {phase: percentiles(times) for phase, times in phase_times.items()},
+        'entities': {'start': entities_start, 'end': len(game.updatable)},
+        'pools': {name: pool.stats() for name, pool in game.pools.items()},
+        'memory': memory_report(game.groups.values(), WorldBody.world),
+    }
+    game.registry.despawn_all()                             # Release everything before the next scenario
+    return result
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulation and rendering throughput.")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="scenario to run, may be repeated (default: all)")
+    parser.add_argument('--frames', type=int, default=300, help="frames per scenario (default: 300)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--no-draw', action='store_true', help="skip the draw phase")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON results file")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')       # No window, even when a display exists
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    results = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'machine': platform.platform(),
+        'seed': args.seed,
+        'frames': args.frames,
+        'draw': not args.no_draw,
+        'scenarios': {},
+    }
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(name, args.frames, args.seed, not args.no_draw)
+        results['scenarios'][name] = result
+        frame_ms = result['frame_ms']
+        phases = ", ".join(f"{phase} {times['p50']:.2f}" for phase, times in result['phases_ms'].items())
+        print(f"{name:16} {result['fps']:8.1f} fps  p50 {frame_ms['p50']:.2f} ms  p95 {frame_ms['p95']:.2f} ms  "
+              f"p99 {frame_ms['p99']:.2f} ms  ({phases} ms p50)")
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,23 @@
 import pygame
 from circle_shape import CircleShape
 from constants import *
+from collision_layers import FIELD
+from physics_world import WorldBody
+from render_scale import view
+from telemetry import telemetry, DEBUG
 
-class BlackHole(CircleShape):
+class BlackHole(WorldBody, CircleShape):
     """ 
     The BLK class represents a black hole object that pulls other objects 
     within its radius and can destroy them if they get too close. Inherits 
-    from CircleShape for physical properties and movement.
+    from CircleShape for physical properties and movement. The pull is applied
+    to everything in range by the area-of-effect pass (`area_effects.py`).
     """
+    collision_kind = FIELD                                                 # Force field, handled by the area-of-effect pass
+    archetype = 'field'                                                    # Shares the table of explosions
+
     def __init__(self):
         super().__init__(BLACK_HOLE_X, BLACK_HOLE_Y, BLACK_HOLE_RADIUS, BLACK_HOLE_FRICTION, BLACK_HOLE_ANGULAR_FRICTION)
-        self.is_explosion = True                                           # Mark the black hole as an explosion type object
         self.color =        BLACK_HOLE_COLOR                               # Set the color of the black hole
         self.health =       BLACK_HOLE_HEALTH                              # Set the initial health for the black hole
         self.radius =       BLACK_HOLE_RADIUS                              # Set the radius for the black hole
@@ -23,44 +30,30 @@ class BlackHole(CircleShape):
         self.far_pull =     BLACK_HOLE_FAR_PULL                            # Pull strength for far range
 
     def update(self, dt):
-        super().update(dt)                                                 # Update the black hole's position and velocity
+        if self.world_row is None:                                         # Attached black holes are moved by the physics world
+            super().update(dt)                                             # Update the black hole's position and velocity
         if self.health < 5000:                                             # Regenerate black hole health if below a threshold
             self.health += 1000
 
-    def collision(self, other):
-        print(f"Black hole swallowed {other}")                             # Log object being pulled by the black hole
-        distance = self.position.distance_to(other.position)               # Calculate the distance between the black hole and another object
-        if distance <= self.far_radius + other.radius:                     # If within the influence range
-            if distance <= self.radius + self.colli_buffer:                # If within the death radius of the black hole
-                other.kill()                                               # Destroy the object
-            if distance <= self.near:                                      # Apply the strongest pull force for near range
-                strength = self.near_pull
-                self.calculate_force(other, strength)
-            elif distance <= self.mid_radius:                              # Apply medium pull force for mid-range
-                strength = self.mid_pull
-                self.calculate_force(other, strength)
-            else:                                                          # Apply the weakest pull force for far range
-                strength = self.far_pull
-                self.calculate_force(other, strength)
-
-        bounce = False                                                     # Disable bounce when colliding with the black hole
+    def field_strengths(self, dt):
+        """Pull strengths are per second, scaled by the length of the step."""
+        return (self.near_pull * dt, self.mid_pull * dt, self.far_pull * dt)
 
-    def calculate_force(self, other, strength):
-        explosion_vector = other.position - self.position                  # Calculate vector direction of the pull
-        if explosion_vector.length() > 0:
-            explosion_vector.normalize_ip()                                # Normalize vector to get the direction
-        force = explosion_vector * strength                                # Multiply by strength to get the pull force
-        other.apply_force(force)                                           # Apply the calculated force to the object
+    def field_applied(self, affected, distances):
+        death_radius = self.radius + self.colli_buffer                     # Anything this close is swallowed
+        for other, distance in zip(affected, distances.tolist()):
+            if distance <= death_radius:
+                if telemetry.enabled('fields', DEBUG):
+                    telemetry.event('fields', DEBUG, 'swallowed', target=type(other).__name__)  # Log object destroyed by the black hole
+                other.kill()                                               # Destroy the object
 
     def draw(self, screen):
-        pygame.draw.circle(screen, (0, 0, 0), (int(self.position.x + 1), int(self.position.y + 1)), self.radius)
-        """FOR debugging only 
-        # Draw the influence radius lines (near, mid, and far radii)
-        for radius in [self.near, self.mid_radius, self.far_radius]:
-            pygame.draw.circle(screen, self.color,  # Use the color for the lines
-                (int(self.position.x + 1), int(self.position.y + 1)),  # Position
-                int(radius), 2  # Radius and thickness of the line
-            )"""
+        center = view.point((int(self.position.x + 1), int(self.position.y + 1)))
+        rect = pygame.draw.circle(screen, (0, 0, 0), center, view.length(self.radius))
+        if BLACK_HOLE_DEBUG_RADII:                                         # Draw the influence radius lines (near, mid, and far radii)
+            for radius in [self.near, self.mid_radius, self.far_radius]:
+                rect = rect.union(pygame.draw.circle(screen, self.color, center, view.length(radius), 2))
+        return rect                                                        # Area drawn, for the dirty-rect renderer
 
     def apply_force(self, force):
         pass                                                               # No additional forces applied by the black hole directly
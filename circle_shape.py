@@ -1,8 +1,16 @@
 import pygame
 import random
-from floating_text import FloatingText
-from constants import GLOBAL_COLLISION_MODIFIER, MIN_SHRAPNEL_SPEED
+from constants import GLOBAL_COLLISION_MODIFIER, MIN_SHRAPNEL_SPEED, SHRAPNEL_FLAME_RATE
 from text_lists import shrapnel_flames
+from collision_layers import ASTEROID, SHRAPNEL
+from physics_world import WorldBody
+from timestep import scaled_friction
+from particles import Emitter, emit
+from render_scale import view
+from contacts import contact_keys
+from pools import Pooled
+from timers import Expiring
+from telemetry import telemetry, DEBUG
 
 class CircleShape(pygame.sprite.Sprite):
     """
@@ -20,13 +28,25 @@ class CircleShape(pygame.sprite.Sprite):
         angular_friction (float): The factor to slow down angular velocity over time.
         health (float): The health of the object, based on its radius.
         destroyed (bool): A flag to determine if the object is destroyed.
+        speed, forward_direction, right_direction, forward_velocity, right_velocity: Derived from the
+            velocity and rotation when read, never stored.
     """
+    collision_kind = ASTEROID                                               # Collision layer, plain bodies behave like asteroids
+    swept_collision = False                                                 # Fast movers of swept classes are tested along their path
+    shrapnel_mass_per_piece = 1                                             # Mass used up per shrapnel piece, raised by the quality governor
+
     def __init__(self, x, y, radius, friction=0.995, angular_friction=0.95):
         if hasattr(self, "containers"):                                     # Initialize sprite and add to groups if containers are set
             super().__init__(self.containers)
         else:
             super().__init__()                                              # Initialize sprite without containers
+        self.reset_body(x, y, radius, friction, angular_friction)
+        self.color = (255, 255, 255)                                        # Default color of the object is white
+
+    def reset_body(self, x, y, radius, friction=0.995, angular_friction=0.95):
+        """Sets the state every new life starts from, also used by pooled objects reused in place."""
         self.destroyed = False                                              # Add a flag to track if the object has been destroyed
+        self.contact_key = next(contact_keys)                               # Identifies the object's contacts, new for every spawn
         self.position = pygame.Vector2(x, y)                                # Set position as a 2D vector
         self.velocity = pygame.Vector2(0, 0)                                # Linear velocity for movement, starts at (0,0)
         self.radius = radius                                                # Set the radius of the object
@@ -34,14 +54,32 @@ class CircleShape(pygame.sprite.Sprite):
         self.rotation = 0                                                   # Current rotation angle, starts at 0
         self.friction = friction                                            # Linear friction factor to reduce velocity over time
         self.angular_friction = angular_friction                            # Rotational friction factor to reduce angular velocity
-        self.speed = self.velocity.length()                                 # Speed is the magnitude (length) of the velocity vector
-        self.health = self.radius * 2                                       # Health is twice the radius
+        self.health = radius * 2                                            # Health is twice the radius
         self.max_health = self.health                                       # Max health is the initial health value
-        self.color = (255, 255, 255)                                        # Default color of the object is white
+
+    @property
+    def speed(self):
+        return self.velocity.length()                                       # Speed is the magnitude (length) of the velocity vector
+
+    @property
+    def forward_direction(self):
+        return pygame.Vector2(0, 1).rotate(self.rotation)                   # Unit vector the object is facing
+
+    @property
+    def right_direction(self):
+        return pygame.Vector2(0, 1).rotate(self.rotation + 90)              # Perpendicular to the forward direction
+
+    @property
+    def forward_velocity(self):
+        return self.velocity.dot(self.forward_direction)                    # Velocity along the facing direction
+
+    @property
+    def right_velocity(self):
+        return self.velocity.dot(self.right_direction)                      # Velocity to the right of the facing direction
 
     def update(self, dt):
-        self.velocity *= self.friction                                      # Apply linear friction to slow down movement over time
-        self.angular_velocity *= self.angular_friction                      # Apply rotational friction to slow down rotation
+        self.velocity *= scaled_friction(self.friction, dt)                 # Apply linear friction to slow down movement over time
+        self.angular_velocity *= scaled_friction(self.angular_friction, dt) # Apply rotational friction to slow down rotation
         self.position += self.velocity * dt                                 # Update position based on velocity (linear inertia)
         self.rotation += self.angular_velocity * dt                         # Update rotation based on angular velocity
         self.rotation %= 360                                                # Keep rotation within 0-360 degrees (optional)
@@ -51,23 +89,23 @@ class CircleShape(pygame.sprite.Sprite):
 
     def apply_torque(self, torque):
         self.angular_velocity += torque                                     # Apply torque to angular velocity for rotation
+
+    def broadphase_radius(self):
+        return self.radius                                                  # Distance at which this object can touch another
         
     def collision(self, other, bounce=True):
-        if hasattr(other, "is_explosion") and other.is_explosion == True:   # Ignore collisions with explosion objects
-            return
+        radius, other_radius = self.radius, other.radius                    # Read once, world bodies build each read
         distance = self.position.distance_to(other.position)                # Check for collision with another CircleShape
-        if self.radius + other.radius > distance:                           # Check if the objects are overlapping
-            if hasattr(other, "is_shot") and other.is_shot == True:         # Handle collisions with shots
-                other.shot_explode(self)
-                return
-            impact_force = (other.radius * other.velocity.length() +        # Calculate damage based on combined
-                            self.radius * self.velocity.length())           # object radius and velocity
-            self.health -= impact_force * GLOBAL_COLLISION_MODIFIER         # Apply damage to `self`
-            other.health -= impact_force * GLOBAL_COLLISION_MODIFIER        # Apply damage to `other`
-            if self.health <= 0 and not self.destroyed:                     # Handle destruction for `self`
-                self.shrapnel_obj(self.radius)
-            if other.health <= 0 and not other.destroyed:                   # Handle destruction for `other`
-                other.shrapnel_obj(other.radius)
+        if radius + other_radius > distance:                                # Check if the objects are overlapping
+            impact_force = (other_radius * other.velocity.length() +        # Calculate damage based on combined
+                            radius * self.velocity.length())                # object radius and velocity
+            damage = impact_force * GLOBAL_COLLISION_MODIFIER
+            self.health = health = self.health - damage                     # Apply damage to `self`
+            other.health = other_health = other.health - damage             # Apply damage to `other`
+            if health <= 0 and not self.destroyed:                          # Handle destruction for `self`
+                self.shrapnel_obj(radius)
+            if other_health <= 0 and not other.destroyed:                   # Handle destruction for `other`
+                other.shrapnel_obj(other_radius)
             if bounce:                                                      # Bounce if enabled
                 self.bounce(other)
 
@@ -111,38 +149,53 @@ class CircleShape(pygame.sprite.Sprite):
         self.create_shrapnel(mass)       
 
     def create_shrapnel(self, mass):
+        x, y = self.position                                                                    # Every piece starts where the object was
+        velocity = self.velocity
         while mass > 3:                                                                         # Mass is either specific or the radius of the originating object
             random_angle = random.uniform(0, 360)                                               # Generate a random angle for the shrapnel direction
-            velocity_a = self.velocity.rotate(random_angle) * random.uniform(0.1, 2)            # Generate random velocity
+            velocity_a = velocity.rotate(random_angle) * random.uniform(0.1, 2)                 # Generate random velocity
             new_radius = random.randrange(1, 3, 1)                                              # Create a random radius for the shrapnel piece
-            shrapnel_piece = Shrapnel(self.position.x, self.position.y, new_radius, self.color) # Create the shrapnel piece
+            shrapnel_piece = Shrapnel.spawn(x, y, new_radius, self.color)                       # Create the shrapnel piece, reusing a pooled one
             if velocity_a.length() == 0:                                                        # Check if velocity is effectively zero
                 velocity_a = pygame.Vector2(1, 0).rotate(random_angle) * MIN_SHRAPNEL_SPEED     # Set minimum velocity if stationary
+            if velocity_a.length() < MIN_SHRAPNEL_SPEED:                                        # Ensure velocity is at least PLAYER_SHOT_SPEED/10
+                velocity_a.scale_to_length(MIN_SHRAPNEL_SPEED)
             shrapnel_piece.velocity = velocity_a                                                # Apply velocity to the shrapnel piece
-            if shrapnel_piece.velocity.length() < MIN_SHRAPNEL_SPEED:                           # Ensure velocity is at least PLAYER_SHOT_SPEED/10
-                shrapnel_piece.velocity.scale_to_length(MIN_SHRAPNEL_SPEED)
-            mass -= new_radius                                                                  # Decrease the remaining mass
-            print(f"New shrapnel from {self}, shrapnel mass {new_radius}, remaining mass is {mass}")
+            mass -= new_radius * self.shrapnel_mass_per_piece                                   # Decrease the remaining mass, faster at lower quality
+            if telemetry.enabled('shrapnel', DEBUG):
+                telemetry.event('shrapnel', DEBUG, 'piece', source=type(self).__name__, mass=new_radius, remaining=mass)
+
+class Shrapnel(Expiring, Pooled, WorldBody, CircleShape):                                 # Cannot move out of CircularShapes because it would result in circular import.
+    collision_kind = SHRAPNEL                                           # Shrapnel never collides with other shrapnel
+    swept_collision = True                                              # Fast shrapnel must not tunnel through small bodies
+    archetype = 'shrapnel'                                              # Registry table of shrapnel
 
-class Shrapnel(CircleShape):                                            # Cannot move out of CircularShapes because it would result in circular import.
     def __init__(self, x, y, radius, RGB=(155, 155, 155)):              # Default shrapnel color eg( asteroid splitting shrapnel)
         super().__init__(x, y, radius)
         self.lifetime = random.randrange(100, 700, 100)                 # Set random lifetime for the shrapnel in milliseconds
-        self.spawn_time = pygame.time.get_ticks()                       # Get the spawn time in ticks
+        self.expire_in(self.lifetime / 1000)                            # Killed by the simulation clock when it runs out
         self.rgb = RGB                                                  # Set the color of the shrapnel (default or passed in)
         self.angular_velocity = 0                                       # Disable angular velocity (no rotation)
+        self.flames = Emitter(SHRAPNEL_FLAME_RATE)                      # Flame particles at a steady rate
+
+    def reset(self, x, y, radius, RGB=(155, 155, 155)):                 # Same arguments as __init__, for pooled reuse
+        self.reset_body(x, y, radius)
+        self.lifetime = random.randrange(100, 700, 100)                 # New random lifetime in milliseconds
+        self.expire_in(self.lifetime / 1000)
+        self.rgb = RGB
+        self.flames.accumulator = 0.0                                   # No flame carried over from the previous life
 
     def update(self, dt):
-        self.position += self.velocity * dt                             # Update position based on velocity and time delta
-        self.velocity *= self.friction                                  # Apply friction to slow down movement
-        current_time = pygame.time.get_ticks()                          # Get current time in ticks
-        if current_time - self.spawn_time > self.lifetime:              # Check if lifetime has expired
-            self.kill()                                                 # Remove shrapnel if its lifetime is over
+        if self.world_row is None:                                      # Attached shrapnel is moved by the physics world
+            self.position += self.velocity * dt                         # Update position based on velocity and time delta
+            self.velocity *= scaled_friction(self.friction, dt)         # Apply friction to slow down movement
+        for _ in range(self.flames.tick(dt)):
+            flame = random.choice(shrapnel_flames)                      # Choose a random floating flame character
+            x, y = self.position
+            emit('flame', x, y, flame, self.rgb)                        # Display a flame particle
 
     def draw(self, screen):                                             # Draw the shrapnel on the screen as a white circle as the shrapnel outline
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.position.x), int(self.position.y)), self.radius)
-        flame = random.choice(shrapnel_flames)                          # Choose a random floating flame character
-        FloatingText(self.position.x, self.position.y, (f"{flame}"), self.rgb, 40) # Display floating flame text
+        return pygame.draw.circle(screen, (255, 255, 255), view.point(self.position), view.length(self.radius))
     
     def apply_torque(self, torque):                                     # Torque is disabled for shrapnel (no rotation)
         pass
\ No newline at end of file
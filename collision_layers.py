@@ -0,0 +1,82 @@
+"""
+Collision layers: which kinds of entities interact, and how each interacting pair is handled.
+
+Every collidable class carries a `collision_kind` class attribute. `COLLISION_MATRIX` declares which kinds
+can affect each other, and `HANDLERS` maps an ordered (kind, kind) pair to the function resolving it.
+Pairs without a handler (shrapnel against shrapnel, loot against anything but the player) are dropped by
+the broadphase before any distance math is done. A handler returns True when the pair is a solid contact
+whose bounce should be resolved by the batched narrowphase.
+
+Force fields never collide pairwise: the area-of-effect pass applies them to every kind in `FIELD_TARGETS`.
+"""
+
+# Entity kinds
+PLAYER = 'player'                                   # The player's ship
+ALIEN = 'alien'                                     # Alien ships
+ASTEROID = 'asteroid'                               # Asteroids of every size
+SHRAPNEL = 'shrapnel'                               # Shrapnel pieces from destroyed objects
+SHOT = 'shot'                                       # Player and alien shots
+LOOT = 'loot'                                       # Loot pickups, a sensor that only detects the player
+FIELD = 'field'                                     # Force fields such as explosions and black holes
+
+BODIES = (PLAYER, ALIEN, ASTEROID, SHRAPNEL)        # Solid objects that damage and bounce off each other
+FIELD_TARGETS = frozenset(BODIES + (SHOT,))         # Kinds pushed and pulled by force fields
+
+# Which kinds interact with which; every entry must be mirrored by the other kind's entry
+COLLISION_MATRIX = {
+    PLAYER:     {PLAYER, ALIEN, ASTEROID, SHRAPNEL, SHOT, LOOT},
+    ALIEN:      {PLAYER, ALIEN, ASTEROID, SHRAPNEL, SHOT},
+    ASTEROID:   {PLAYER, ALIEN, ASTEROID, SHRAPNEL, SHOT},
+    SHRAPNEL:   {PLAYER, ALIEN, ASTEROID, SHOT},
+    SHOT:       {PLAYER, ALIEN, ASTEROID, SHRAPNEL, SHOT},
+    LOOT:       {PLAYER},
+    FIELD:      set(),                              # Fields go through the area-of-effect pass instead
+}
+
+def body_contact(body1, body2):
+    """Two solid bodies touching: one call damages both, the bounce is resolved in the batch."""
+    body1.collision(body2, bounce=False)
+    return True
+
+def shot_hit(shot, other):
+    """A shot reaching any target explodes on it."""
+    shot.collision(other)
+
+def shot_against_shot(shot1, shot2):
+    """Two shots meeting can each explode on the other."""
+    shot1.collision(shot2)
+    shot2.collision(shot1)
+
+def loot_pickup(loot, player):
+    """The player flying over loot collects it."""
+    loot.collision(player)
+
+def build_handlers():
+    """Builds the (kind, kind) -> (handler, swapped) table from the rules below and the matrix."""
+    rules = {}
+    for kind1 in BODIES:
+        for kind2 in BODIES:
+            rules[(kind1, kind2)] = body_contact
+    for kind in BODIES:
+        rules[(SHOT, kind)] = shot_hit
+    rules[(SHOT, SHOT)] = shot_against_shot
+    rules[(LOOT, PLAYER)] = loot_pickup
+    handlers = {}
+    for (kind1, kind2), handler in rules.items():
+        if kind2 not in COLLISION_MATRIX[kind1] or kind1 not in COLLISION_MATRIX[kind2]:
+            continue                                                # The matrix turns this pair off
+        handlers[(kind1, kind2)] = (handler, False)
+        handlers.setdefault((kind2, kind1), (handler, True))       # Mirror entry calls the handler swapped
+    return handlers
+
+HANDLERS = build_handlers()
+
+def dispatch(obj1, obj2):
+    """Resolves a pair with the handler registered for its kinds, returns True if it should bounce."""
+    entry = HANDLERS.get((obj1.collision_kind, obj2.collision_kind))
+    if entry is None:
+        return False                                                # These kinds never interact
+    handler, swapped = entry
+    if swapped:
+        return handler(obj2, obj1)
+    return handler(obj1, obj2)
@@ -17,6 +17,9 @@ ASTEROID_MIN_RADIUS = 20                                        # Minimum astero
 ASTEROID_KINDS = 3                                              # Number of asteroid types
 ASTEROID_SPAWN_RATE = 0.9                                       # Time interval (seconds) between asteroid spawns
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS      # Max size for asteroids
+ASTEROID_COLOR = (150, 150, 150)                                # Default asteroid color
+ASTEROID_TEXTURE_VARIANTS = 4                                   # Pre-baked texture variants per asteroid size and color
+ASTEROID_TEXTURE_CACHE_SIZE = 64                                # Sizes and colors kept in the texture cache
 
 # Player settings
 PLAYER_RADIUS = 20                                              # Radius of the player object
@@ -49,6 +52,7 @@ ALIEN_RADIUS = 25                                               # Radius of the
 ALIEN_HEALTH = ALIEN_RADIUS * 3                                 # Health of the alien
 ALIEN_SPAWN_RATE = 3.0                                          # Time interval for spawning alien ships
 ALIEN_SHOOTING_RANGE = 600                                      # Maximum range at which aliens can shoot
+ALIEN_AVOID_RANGE = 150                                         # Distance at which aliens steer away from asteroids
 ALIEN_TURN_SPEED = PLAYER_TURN_SPEED * 1.5                      # Alien turning speed
 ALIEN_MOVE_SPEED = PLAYER_SPEED * 1.5                           # Alien movement speed
 ALIEN_COLOR = (50, 190, 50)                                     # Alien ship color (green)
@@ -63,6 +67,47 @@ STABILISER_VELOSITY_THRESHOLD = 1                   # Threshold for stabiliser t
 MIN_SHRAPNEL_SPEED = PLAYER_SHOT_SPEED / 10         # Minimum speed for shrapnel pieces, based on player shot speed
 HIGH_SCORE_FILE = 'high_scores.json'                # Path / Name for the high score file
 
+# Simulation timing
+SIMULATION_TICK_RATE = 60                           # Fixed simulation steps per second, independent of the render rate
+MAX_SIMULATION_STEPS = 5                            # Most simulation steps run in one rendered frame (spiral of death guard)
+RENDER_FRAME_CAP = 60                               # Maximum rendered frames per second
+REFERENCE_TICK_RATE = 60                            # Rate at which per-step friction factors were tuned
+
+# Rendering settings
+DIRTY_RECT_RENDERING = False                        # Redraw and update only the changed regions instead of flipping the whole screen
+DIRTY_RECT_FULL_FLIP_FRACTION = 0.35                # Fall back to a full flip when the dirty rects cover more of the screen than this
+DIRTY_RECT_MAX_RECTS = 2000                         # Fall back to a full flip above this many dirty rects
+
+# Render scale settings
+RENDER_SCALE = 1.0                                  # Fraction of the screen resolution the world is drawn at, snapped to a step
+RENDER_SCALE_ADAPTIVE = False                       # Lower or raise the render scale to keep frames under the budget
+RENDER_SCALE_STEPS = (0.5, 0.625, 0.75, 0.875, 1.0) # Render scales the adaptive mode moves between
+RENDER_SCALE_BUDGET = 1 / RENDER_FRAME_CAP          # Frame work time in seconds the adaptive mode aims for
+RENDER_SCALE_HEADROOM = 0.6                         # Step back up when frames average under this fraction of the budget
+RENDER_SCALE_WINDOW = 60                            # Frames averaged before each render scale decision
+RENDER_SCALE_SURFACE_CACHE = 512                    # Resized textures and glyphs kept for the current render scale
+
+# Frame profiler settings
+PROFILER_TOGGLE_KEY = pygame.K_F3                   # Key that shows or hides the frame profiler overlay
+PROFILER_EXPORT_KEY = pygame.K_F4                   # Key that exports the recorded frames as CSV
+PROFILER_CSV_FILE = 'frame_profile.csv'             # Path / Name for the exported frame profile
+PROFILER_HISTORY = 36000                            # Frames kept for CSV export (10 minutes at 60 FPS)
+PROFILER_GRAPH_WIDTH = 420                          # Width of the overlay in pixels, one pixel per frame in the graph
+PROFILER_FONT_SIZE = 24                             # Font size for the overlay text
+
+# Collision broadphase settings
+SPATIAL_HASH_CELL_SIZE = 128                        # Cell size of the collision grid in pixels (about two large asteroids)
+NEIGHBOR_CELL_SIZE = ALIEN_AVOID_RANGE              # Cell size of the AI neighbour index, one cell per avoidance radius
+
+# Continuous collision detection settings
+CCD_MIN_TRAVEL = 1.0                                # Swept objects moving more than this many of their reaches in a step are swept
+CCD_MAX_TRAVEL = SCREEN_WIDTH / 2                   # Longer moves are teleports (wrap, respawn), never swept
+CCD_CONTACT_SLOP = 0.5                              # Overlap in pixels left when a swept object is moved back to its impact
+
+# Physics world settings
+PHYSICS_WORLD_ENABLED = True                        # Integrate passive bodies in one vectorized NumPy pass per frame
+PHYSICS_WORLD_CAPACITY = 1024                       # Initial number of rows in the physics world arrays (grows as needed)
+
 # Explosion settings
 EXPLOSION_NEAR_STRENGTH = 200                       # Explosion strength at close range
 EXPLOSION_MID_STRENGTH = 100                        # Explosion strength at mid-range
@@ -85,19 +130,70 @@ BLACK_HOLE_MID_RADIUS = BLACK_HOLE_FAR_RADIUS / 2   # Mid range pull radius
 BLACK_HOLE_COLOR = (150, 120, 160)                  # Black hole color (purple-ish)
 BLACK_HOLE_HEALTH = 1_000_000                       # Black hole's health
 BLACK_HOLE_COLLI_BUFFER = 15                        # Collision buffer for black hole
-BLACK_HOLE_NEAR_PULL = -100                         # Pull strength near black hole
-BLACK_HOLE_MID_PULL = -10                           # Pull strength mid-range black hole
-BLACK_HOLE_FAR_PULL = -3                            # Pull strength far-range black hole
+BLACK_HOLE_DEBUG_RADII = False                      # Draw the near, mid and far influence radii (debugging only)
+BLACK_HOLE_NEAR_PULL = -6000                        # Pull strength near black hole (per second)
+BLACK_HOLE_MID_PULL = -600                          # Pull strength mid-range black hole (per second)
+BLACK_HOLE_FAR_PULL = -180                          # Pull strength far-range black hole (per second)
+
+# Background settings
+BACKGROUND_STARS = 1000                             # Stars in the background
+BACKGROUND_PLANETS = 3                              # Planets in the background
+BACKGROUND_COLOR_RANGE = (50, 100)                  # Range of each color channel for stars and planets
+BACKGROUND_BLUR_SIGMA = 2                           # Gaussian blur applied to the planets
+BACKGROUND_VARIANTS = 16                            # Backgrounds to pick from, each generated once and cached on disk
+BACKGROUND_CACHE_DIR = 'background_cache'           # Directory for generated backgrounds, None disables the disk cache
 
 # Text settings
 TEXT_COLOR = (250, 200, 100)                        # Color for on-screen text
 LINE_SPACING = 30                                   # Spacing between lines of text
 FONT_SIZE = 34                                      # Font size for in-game text
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024              # Pixel memory for cached rendered text before the oldest is evicted
+
+# Particle settings
+PARTICLE_CAPS = {                                   # Live particles per type, the oldest is replaced when full
+    'thruster': 512,                                # Exhaust glyphs behind thrusting ships
+    'muzzle': 64,                                   # Flashes where shots are fired
+    'trail': 512,                                   # Trails behind shots
+    'flame': 2048,                                  # Flames on burning shrapnel
+}
+PARTICLE_LIFETIMES = {                              # Lifetime of each particle type in seconds
+    'thruster': 0.05,
+    'muzzle': 0.04,
+    'trail': 0.04,
+    'flame': 0.04,
+}
+SHOT_TRAIL_RATE = 60                                # Trail particles per second behind each shot
+SHRAPNEL_FLAME_RATE = 60                            # Flame particles per second on each shrapnel piece
+
+# Object pool settings
+POOL_CAPACITY = 2048                                # Killed objects kept for reuse per pooled class
+
+# Quality governor settings
+QUALITY_TIERS = (                                   # Effects quality tiers, best first; the governor steps down under load
+    {'name': 'high', 'shrapnel_mass_per_piece': 1, 'effects_rate': 1.0, 'explosion_rings': 3,
+     'background_stars': BACKGROUND_STARS, 'background_planets': BACKGROUND_PLANETS},
+    {'name': 'medium', 'shrapnel_mass_per_piece': 2, 'effects_rate': 0.5, 'explosion_rings': 2,
+     'background_stars': BACKGROUND_STARS // 2, 'background_planets': 2},
+    {'name': 'low', 'shrapnel_mass_per_piece': 4, 'effects_rate': 0.25, 'explosion_rings': 1,
+     'background_stars': BACKGROUND_STARS // 4, 'background_planets': 1},
+)
+QUALITY_FRAME_BUDGET = 1 / RENDER_FRAME_CAP         # Frame work time in seconds above which quality is lowered
+QUALITY_ENTITY_BUDGET = 400                         # Collidable objects above which quality is lowered
+QUALITY_RECOVERY = 0.7                              # Quality is raised again once the load stays under this fraction of the budgets
+QUALITY_WINDOW = 30                                 # Frames averaged before each quality decision
+
+# Telemetry settings
+TELEMETRY_LEVEL = 'off'                             # Lowest event level recorded: 'debug', 'info', 'warning', 'error' or 'off'
+TELEMETRY_SUBSYSTEMS = {}                           # Per-subsystem level overrides, e.g. {'combat': 'debug'}
+TELEMETRY_BUFFER = 8192                             # Events kept in the ring buffer between flushes
+TELEMETRY_FILE = 'telemetry.ndjson'                 # Path / Name of the NDJSON event log
+TELEMETRY_FLUSH_INTERVAL = 0.5                      # Seconds between background writes of the buffer
 PLAYER_FIRE_COLOR = (255, 0, 0)                     # Color for player fire effect
 PLAYER_COLOR = (234, 0, 0)                          # Player's color
 
 # Loot constants
 LOOT_HEALTH = 1000000000                            # Infinite health to keep loot until picked up
+LOOT_RADIUS = 20                                    # Radius of loot dropped by aliens
 LOOT_COLLECTION_BUFFER = 10                         # Buffer to make loot easier to collect
 LOOT_MSG_DURATION = 1000                            # Duration in milliseconds for displaying loot effect messages
 
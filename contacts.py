@@ -0,0 +1,95 @@
+"""
+Persistent contacts between touching objects.
+
+The narrowphase reports every touching pair each step. `ContactCache` remembers the pairs that were
+already touching in the previous step, so the collision handler (damage, score, pickup) runs once when a
+contact begins instead of once per step of overlap, which also makes damage independent of the tick rate.
+A contact ends the first step its pair is no longer touching; touching again starts a new contact.
+
+Pairs are keyed by each object's `contact_key`, drawn from `contact_keys` when the object is initialized,
+so an object reused from a pool never inherits the contacts of its previous life.
+
+Because the handler is not asked again while a contact lasts, every handler must treat the pair as hit at
+the reach the broadphase uses (`broadphase_radius()` of both objects). A handler with a shorter hit test
+would see the pair once, out of its range, and never again until the contact ends.
+"""
+
+from itertools import count
+
+contact_keys = count()                          # Unique key per spawned object
+
+class Contact():
+    """
+    A pair of objects that stayed in contact since `started`.
+
+    Attributes:
+        first, second: The two objects, in the order the handler saw them when the contact began.
+        normal (ndarray): Unit normal from the second object to the first, from the latest step.
+        depth (float): Overlap of the reaches in the latest step.
+        solid (bool): Whether the handler reported a solid contact whose bounce is resolved every step.
+        started (int): Step the contact began in.
+        seen (int): Last step the pair was found touching.
+    """
+    __slots__ = ('first', 'second', 'normal', 'depth', 'solid', 'started', 'seen')
+
+    def __init__(self, first, second, step):
+        self.first = first
+        self.second = second
+        self.normal = None
+        self.depth = 0.0
+        self.solid = False
+        self.started = step
+        self.seen = step
+
+class ContactCache():
+    """
+    Keeps the contacts alive from one step to the next, keyed by the unordered pair of objects.
+
+    Attributes:
+        contacts (dict): Maps an unordered pair key to its `Contact`.
+        step (int): Number of steps begun.
+        started (int): Contacts that began in the current step.
+        ended (int): Contacts that ended at the end of the current step.
+    """
+
+    def __init__(self):
+        self.contacts = {}                      # Pair key -> Contact
+        self.step = 0                           # Current step number
+        self.started = 0                        # Contacts begun this step
+        self.ended = 0                          # Contacts ended this step
+
+    def begin_step(self):
+        """Starts a new step, before the narrowphase reports any contact."""
+        self.step += 1
+        self.started = 0
+
+    def touch(self, obj1, obj2, normal, depth):
+        """
+        Records that `obj1` and `obj2` touch in the current step.
+
+        Returns:
+            tuple: (contact, new) where `new` is True when the pair was not touching in the previous step.
+        """
+        key1, key2 = obj1.contact_key, obj2.contact_key
+        key = (key1, key2) if key1 < key2 else (key2, key1)     # Same key in either order
+        contact = self.contacts.get(key)
+        new = contact is None
+        if new:
+            contact = Contact(obj1, obj2, self.step)
+            self.contacts[key] = contact
+            self.started += 1
+        contact.normal = normal
+        contact.depth = depth
+        contact.seen = self.step
+        return contact, new
+
+    def end_step(self):
+        """Drops the contacts whose pair was not touching in this step."""
+        step = self.step
+        ended = [key for key, contact in self.contacts.items() if contact.seen != step]
+        for key in ended:
+            del self.contacts[key]
+        self.ended = len(ended)
+
+    def clear(self):
+        self.contacts.clear()
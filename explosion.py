@@ -3,16 +3,23 @@ Class representing an Explosion in the game, which applies force to nearby objec
 
 The Explosion has a radius that affects nearby objects within different distance thresholds (near, mid, far).
 It can apply varying amounts of force depending on how close the object is to the center of the explosion.
-Once the explosion occurs, it will be removed after applying the force.
+The force is applied once to every object in range by the area-of-effect pass (`area_effects.py`), and the
+explosion is removed on the following step, after it has been drawn.
 """
 
 import pygame
 from constants import *
+from collision_layers import FIELD
+from render_scale import view
+from pools import Pooled
+
+class Explosion(Pooled, pygame.sprite.Sprite):
+    collision_kind = FIELD                                                        # Force field, handled by the area-of-effect pass
+    archetype = 'field'                                                           # Registry table of explosions and black holes
+    rings = 3                                                                     # Rings drawn, lowered by the quality governor
 
-class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y, multiplier=1):
         super().__init__(self.containers if hasattr(self, "containers") else None)  # Automatically add to sprite groups if defined
-        self.is_explosion = True                                                  # Flag to identify explosion
         self.position = pygame.Vector2(x, y)                                      # Set explosion's position
         self.radius = EXPLOSION_INITIAL_RADIUS * multiplier                       # Explosion's radius for detection
         self.near = EXPLOSION_NEAR_RADIUS                                         # Close-range radius for high impact
@@ -20,38 +27,30 @@ class Explosion(pygame.sprite.Sprite):
         self.far_radius = EXPLOSION_FAR_RADIUS                                    # Far-range radius for low impact
         self.color = EXPLOSION_COLOR                                              # Explosion color for visual effects
         self.health = 1                                                           # Health for explosion (optional)
+        self.spent = False                                                        # Set once the blast has pushed everything in range
+
+    def reset(self, x, y, multiplier=1):                                          # Same arguments as __init__, for pooled reuse
+        self.position = pygame.Vector2(x, y)
+        self.radius = EXPLOSION_INITIAL_RADIUS * multiplier
+        self.spent = False
 
     def update(self, dt):
-        pass                                                                      # No update logic for static explosion
-
-    def collision(self, other, bounce=True):
-        print(f"Explosion colliding with {other}")                                # Log explosion collision
-        distance = self.position.distance_to(other.position)                      # Calculate distance to the other object
-        
-        if distance <= self.far_radius + other.radius:                            # Check if object is within far radius
-            if distance <= self.near:                                             # Check if object is within close range
-                strength = EXPLOSION_NEAR_STRENGTH                                # Apply near explosion strength
-                self.calculate_force(other, strength)                             # Calculate and apply force
-            elif distance <= self.mid_radius:                                     # Check if object is within mid range
-                strength = EXPLOSION_MID_STRENGTH                                 # Apply mid explosion strength
-                self.calculate_force(other, strength)                             # Calculate and apply force
-            else:
-                strength = EXPLOSION_FAR_STRENGTH                                 # Apply far explosion strength
-                self.calculate_force(other, strength)                             # Calculate and apply force
-
-    def calculate_force(self, other, strength):
-        explosion_vector = other.position - self.position                         # Calculate direction of the force
-        if explosion_vector.length() > 0:                                         # Normalize the vector if it has length
-            explosion_vector.normalize_ip()                                       # Normalize in place
-        force = explosion_vector * strength                                       # Calculate the force to be applied
-        other.apply_force(force)                                                  # Apply the calculated force to the object
-        self.kill()                                                               # Remove the explosion after applying force
+        if self.spent:                                                            # The blast was applied last step and drawn since
+            self.kill()
+
+    def field_strengths(self, dt):
+        return (EXPLOSION_NEAR_STRENGTH, EXPLOSION_MID_STRENGTH, EXPLOSION_FAR_STRENGTH)   # One push, outwards
+
+    def field_applied(self, affected, distances):
+        self.spent = True                                                         # An explosion pushes only once
 
     def draw(self, screen):
-        for radius in [self.near, self.mid_radius, self.far_radius]:              # Draw concentric circles for explosion effect
-            pygame.draw.circle(screen, self.color, 
-                               (int(self.position.x + 1), int(self.position.y + 1)), 
-                               int(radius), 2)                                    # Draw circle with explosion radii
+        rects = []
+        for radius in [self.near, self.mid_radius, self.far_radius][:self.rings]: # Draw concentric circles for explosion effect
+            rects.append(pygame.draw.circle(screen, self.color, 
+                               view.point((int(self.position.x + 1), int(self.position.y + 1))), 
+                               view.length(radius), 2))                           # Draw circle with explosion radii
+        return rects[0].unionall(rects[1:])                                       # Area drawn, for the dirty-rect renderer
 
     def apply_force(self, other):
         pass                                                                      # Placeholder for force application logic
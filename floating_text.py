@@ -3,14 +3,19 @@ Class for displaying floating text messages on the screen for a limited duration
 
 FloatingText objects are automatically added to sprite groups and handle rendering multi-line
 messages with customizable font size, color, and spacing. The text appears at a specified 
-(x, y) position and disappears after a given duration.
+(x, y) position and disappears after a given duration of simulated time. Lines are rendered through the shared
+text cache, so repeated glyphs are rasterized only once.
 """
 
 import pygame
 from constants import *
+from text_cache import render_text
+from pools import Pooled
+from timers import Expiring
 
-class FloatingText(pygame.sprite.Sprite):
+class FloatingText(Expiring, Pooled, pygame.sprite.Sprite):
     containers = []  # Set to relevant sprite groups in the main loop
+    archetype = 'text'  # Registry table of floating texts
 
     def __init__(self, x, y, message, RGB, duration, line_spacing=LINE_SPACING):
         super().__init__(self.containers)                     # Automatically add to all specified sprite groups
@@ -19,27 +24,35 @@ class FloatingText(pygame.sprite.Sprite):
         self.message = message                                # The message to display
         self.duration = duration                              # Duration for the text to stay visible
         self.RGB = RGB                                        # Text color in RGB format
-        self.start_time = pygame.time.get_ticks()             # Start time for tracking the duration
-        self.font = pygame.font.Font(None, FONT_SIZE)         # Font size for rendering the text
+        self.expire_in(duration / 1000)                       # Removed by the simulation clock after its duration
+        self.font_size = FONT_SIZE                            # Font size for rendering the text
         self.line_spacing = line_spacing                      # Line spacing for multi-line messages
         self.render_lines()                                   # Pre-render the text surfaces
 
+    def reset(self, x, y, message, RGB, duration, line_spacing=LINE_SPACING):  # Same arguments as __init__, for pooled reuse
+        self.x = x
+        self.y = y
+        self.duration = duration
+        self.expire_in(duration / 1000)
+        self.line_spacing = line_spacing
+        if message != self.message or RGB != self.RGB:        # Surfaces of the same text and color are kept
+            self.message = message
+            self.RGB = RGB
+            self.render_lines()
+
     def render_lines(self):
         """Splits the message into multiple lines and creates a surface for each."""
         self.lines = self.message.split('\n')                 # Split message by line breaks
         self.text_surfaces = []                               # List to store rendered text surfaces
         for line in self.lines:
-            text_surface = self.font.render(line, True, self.RGB)  # Render each line of text
+            text_surface = render_text(line, self.RGB, self.font_size)  # Render each line of text, or reuse a cached one
             self.text_surfaces.append(text_surface)           # Add the rendered line to the list
 
-    def update(self, dt):
-        current_time = pygame.time.get_ticks()                # Get current time
-        if current_time - self.start_time > self.duration:    # Check if the text's duration has expired
-            self.kill()                                       # Remove the floating text after its duration
-
     def draw(self, screen):
-        """Draw each line of text with appropriate line spacing."""
+        """Draw each line of text with appropriate line spacing, returns the area drawn."""
+        rects = []
         for i, text_surface in enumerate(self.text_surfaces):     # Loop through each text surface (line)
             line_y = self.y + i * self.line_spacing               # Calculate Y position for each line
             text_rect = text_surface.get_rect(center=(self.x, line_y))  # Center the text at (x, line_y)
-            screen.blit(text_surface, text_rect)                  # Draw the text on the screen
+            rects.append(screen.blit(text_surface, text_rect))    # Draw the text on the screen
+        return rects[0].unionall(rects[1:]) if rects else None
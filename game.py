@@ -0,0 +1,191 @@
+"""
+The game world shared by the windowed game (`main.py`) and the headless runner (`headless.py`).
+
+`Game` creates the entity registry and its group views, wires the class containers, and spawns the state, player and spawn
+fields. It advances the whole simulation by one fixed step with `step()` and draws it with `draw()`, so
+every entry point runs exactly the same pipeline whether or not a display is attached.
+"""
+
+import time
+from constants import *
+from player import Player
+from asteroid import Asteroid
+from asteroid_field import AsteroidField
+from shot import Shot
+from floating_text import FloatingText
+from state import State
+from circle_shape import CircleShape, Shrapnel
+from aliens import AlienShip
+from alien_field import AlienField
+from loot import Loot, LootSpawner
+from explosion import Explosion
+from black_hole import BlackHole
+from spatial_hash import SpatialHash
+from collision_layers import HANDLERS, FIELD
+from narrowphase import collide, sweep_start, step_start
+from contacts import ContactCache
+from area_effects import apply_fields
+from timestep import snapshot_states, interpolated
+from physics_world import PhysicsWorld, WorldBody, gather
+from particles import ParticleSystem
+from asteroid_textures import textures, spawned_texture_keys
+from quality import QualityGovernor
+from pools import Pool
+from registry import Registry, ARCHETYPES
+from telemetry import telemetry
+from timers import SimulationClock
+from neighbors import NeighborIndex
+
+class Game():
+    """
+    Owns every game object and advances them together.
+
+    Objects are stored in the entity registry, one table per archetype. The sprite groups (updatable,
+    drawable, collidable, clearable and the per-kind groups) are views over those tables.
+
+    Attributes:
+        state (State): Game state, including the player, score and background.
+        alien_field (AlienField): Spawner for alien ships.
+        asteroid_field (AsteroidField): Spawner for asteroids and black holes.
+        collision_grid (SpatialHash): Broadphase grid, refilled every step.
+        neighbors (NeighborIndex): Asteroid positions indexed once per step for the alien AI's range queries.
+        particles (ParticleSystem): Pooled cosmetic particles (exhaust, muzzle flashes, trails, flames).
+        contact_cache (ContactCache): Contacts carried over between steps, so damage is dealt once per contact.
+        pools (dict): Object pools of the short-lived classes by name, recycled at the start of every step.
+        clock (SimulationClock): Simulated time, with the lifetimes and spawn timers scheduled on it.
+        governor (QualityGovernor): Effects quality tier, lowered under load by frames recorded from `main()`.
+        registry (Registry): Archetype tables holding every game object.
+        groups (dict): Every sprite group view by name, for reporting.
+        timings (dict): Seconds spent in each phase of the last step and draw: 'state_update', 'sprite_update',
+            'update' (both update phases), 'collision' and 'draw'.
+        pairs_tested (int): Candidate collision pairs tested by the narrowphase in the last step.
+        contacts (int): Confirmed contacts found in the last step.
+        field_hits (int): Objects pushed or pulled by explosions and black holes in the last step.
+    """
+
+    def __init__(self):
+        # Every entity lives in the table of its archetype, the groups are views over the tables
+        self.registry = Registry()
+        world = ('player', 'asteroid', 'alien', 'shot', 'shrapnel', 'loot', 'field')
+        self.updatable = self.registry.view(*ARCHETYPES)
+        self.drawable = self.registry.view(*world)
+        self.overlay = self.registry.view('text')                   # Drawn over the world at full resolution
+        self.asteroid_group = self.registry.view('asteroid')
+        self.shots = self.registry.view('shot')
+        self.all_text = self.registry.view('text')
+        self.shrapnel_group = self.registry.view('shrapnel')
+        self.collidable_group = self.registry.view(*world)
+        self.alien_ships = self.registry.view('alien')
+        self.loot_group = self.registry.view('loot')
+        self.loot_spawner_group = self.registry.view('loot_spawner')
+        self.all_explosions = self.registry.view('field')
+        self.clearable_group = self.registry.view('asteroid', 'alien', 'shot', 'shrapnel', 'loot', 'field', 'text')
+
+        # Assign the archetype table to classes for automatic registration
+        for cls in (Player, AsteroidField, LootSpawner, Asteroid, Shot, Shrapnel, FloatingText,
+                    AlienShip, Loot, Explosion, BlackHole):
+            cls.containers = self.registry.containers(cls.archetype)
+
+        self.clock = SimulationClock()                              # Simulated time, lifetimes and spawn timers
+        SimulationClock.active = self.clock
+        if PHYSICS_WORLD_ENABLED:
+            WorldBody.world = PhysicsWorld()                        # Passive bodies are integrated in one vectorized pass
+        self.particles = ParticleSystem()                           # Cosmetic particles live outside the sprite groups
+        textures.prewarm(spawned_texture_keys())                    # Bake asteroid and loot textures before the first spawn
+        ParticleSystem.active = self.particles
+        self.pools = {'shot': Pool(Shot), 'shrapnel': Pool(Shrapnel), 'explosion': Pool(Explosion),
+                      'floating_text': Pool(FloatingText)}          # Short-lived objects are reused instead of allocated
+        Shot.pool, Shrapnel.pool = self.pools['shot'], self.pools['shrapnel']
+        Explosion.pool, FloatingText.pool = self.pools['explosion'], self.pools['floating_text']
+
+        # Initialize game state, spawn flields, player, background
+        self.state = State(False)
+        self.state.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,)
+        self.alien_field = AlienField(self.state.player, self.asteroid_group)
+        self.asteroid_field = AsteroidField()
+        self.registry.add(self.alien_field)
+        self.collision_grid = SpatialHash()                         # Broadphase grid, refilled every step
+        self.neighbors = NeighborIndex()                            # Asteroid positions for the alien AI, rebuilt every step
+        AlienShip.neighbors = self.neighbors
+        self.contact_cache = ContactCache()                         # Pairs already touching in the previous step
+        self.governor = QualityGovernor()                           # Effects quality, stepped down under load
+        self.governor.subscribe(self.apply_quality)
+        self.apply_quality(None, self.governor.tier, "start")
+        self.groups = {
+            'updatable': self.updatable, 'drawable': self.drawable, 'overlay': self.overlay, 'asteroid_group': self.asteroid_group,
+            'shots': self.shots, 'all_text': self.all_text, 'shrapnel_group': self.shrapnel_group,
+            'collidable_group': self.collidable_group, 'alien_ships': self.alien_ships,
+            'loot_group': self.loot_group, 'loot_spawner_group': self.loot_spawner_group,
+            'all_explosions': self.all_explosions, 'clearable_group': self.clearable_group,
+        }
+        self.timings = {'state_update': 0.0, 'sprite_update': 0.0, 'update': 0.0, 'collision': 0.0, 'draw': 0.0}
+        self.pairs_tested = 0
+        self.contacts = 0
+        self.field_hits = 0
+
+    def apply_quality(self, previous, tier, reason):
+        """Applies a quality tier's settings to shrapnel, particles, explosions and the next background."""
+        CircleShape.shrapnel_mass_per_piece = tier['shrapnel_mass_per_piece']
+        Explosion.rings = tier['explosion_rings']
+        self.particles.rate = tier['effects_rate']
+        loader = self.state.background_loader
+        loader.settings = (tier['background_stars'], tier['background_planets'], loader.settings[2])  # Used from the next respawn
+
+    def step(self, dt, events):
+        """Advances the whole simulation by one fixed step of `dt` seconds."""
+        start = time.perf_counter()
+        telemetry.frame += 1                                        # Events are stamped with the step they happened in
+        for pool in self.pools.values():
+            pool.recycle()                                          # Objects killed last step can be reused from now on
+        snapshot_states(self.drawable)                              # Remember where everything was, for interpolation
+        self.state.update(dt, self.updatable, self.drawable, self.collidable_group, self.clearable_group, events) # Update game state, passing groups for updating
+        state_updated = time.perf_counter()
+        if WorldBody.world is not None:
+            WorldBody.world.integrate(dt)                           # Move every passive body in one vectorized pass
+        self.particles.update(dt)                                   # Age and retire particles before new ones are emitted
+        self.neighbors.rebuild(self.asteroid_group if self.alien_ships else (), WorldBody.world)  # One index shared by every alien
+        for sprite in self.updatable:                               # Update all sprites marked as updatable
+            sprite.update(dt)                                       # Call the update method for each sprite with delta time
+        self.clock.advance(dt)                                      # Expire lifetimes and run spawn timers that are due
+        updated = time.perf_counter()
+        self.collision_grid.clear()                                 # Empty the broadphase grid from the previous step
+        bodies = [sprite for sprite in self.collidable_group if sprite.collision_kind != FIELD]  # Fields act through the area-of-effect pass
+        positions = gather(bodies, 'position', WorldBody.world).tolist()   # One read of the world arrays for every attached body
+        for sprite, position in zip(bodies, positions):             # Register every collidable object with the grid
+            self.collision_grid.insert(sprite, start=sweep_start(sprite, position), position=position,  # Fast movers register their whole path
+                                       previous=step_start(sprite, position))  # Every object moves during a sweep
+        self.contacts = collide(self.collision_grid, HANDLERS, self.contact_cache, WorldBody.world)  # Batch-test pairs sharing a cell and swept paths, resolve new contacts
+        self.pairs_tested = self.collision_grid.last_pair_count
+        self.field_hits = apply_fields(self.all_explosions, self.collision_grid, dt, WorldBody.world)   # Push and pull everything near a field
+        self.timings['state_update'] = state_updated - start
+        self.timings['sprite_update'] = updated - state_updated
+        self.timings['update'] = updated - start
+        self.timings['collision'] = time.perf_counter() - updated
+
+    def draw(self, screen, alpha=1.0, clear=True, scaler=None):
+        """
+        Draws the background (unless `clear` is False), every sprite interpolated by `alpha` between steps,
+        and the game state. Below full render scale, `scaler` supplies a smaller world surface that is
+        upscaled onto the screen before the HUD. Returns the rects drawn, for the dirty-rect renderer.
+        """
+        start = time.perf_counter()
+        world = screen
+        if scaler is not None and scaler.scale < 1.0:
+            world = scaler.begin(self.state.background)             # Smaller surface, already cleared to the background
+        elif clear:
+            screen.blit(self.state.background, (0, 0))              # Wipe the screen with the generated background
+        rects = self.particles.draw(world)                          # Draw every particle in one batch, under the sprites
+        with interpolated(self.drawable, alpha):                    # Draw everything between its last two simulated states
+            for sprite in self.drawable:                            # Loop through all drawable sprites
+                rect = sprite.draw(world)                           # Draw each sprite on the screen
+                if rect is not None:
+                    rects.append(rect)
+        if world is not screen:
+            rects = [scaler.present(screen)]                        # Upscale the world over the whole screen in one step
+        for sprite in self.overlay:
+            rect = sprite.draw(screen)                              # Floating texts stay sharp at any render scale
+            if rect is not None:
+                rects.append(rect)
+        rects += self.state.draw(screen)                            # Draw the HUD once, over the sprites
+        self.timings['draw'] = time.perf_counter() - start
+        return rects
@@ -0,0 +1,103 @@
+"""
+Headless fast-forward runner for soak and throughput testing.
+
+Runs the same `Game` pipeline as `main.py` (State, AsteroidField, AlienField and every sprite group) with
+no window, no frame cap and no keyboard, stepping a fixed dt as fast as the CPU allows. Rendering into an
+offscreen surface is optional, so draw code can be exercised on machines without a GPU or display.
+
+Usage:
+    python3 headless.py --seed 42 --frames 36000 --tick-rate 60 --render
+    python3 headless.py --frames 3600 --telemetry debug --telemetry-file events.ndjson
+"""
+
+import argparse
+import os
+import random
+import time
+import numpy as np
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_TICK_RATE, TELEMETRY_FILE
+from memory_report import memory_report, format_memory_report
+from telemetry import telemetry
+
+def parse_args(argv=None):
+    """Parses the command-line flags of the headless runner."""
+    parser = argparse.ArgumentParser(description="Run the asteroids simulation headless, as fast as possible.")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for a reproducible run (default: 0)")
+    parser.add_argument('--frames', type=int, default=3600, help="number of simulation steps to run (default: 3600)")
+    parser.add_argument('--tick-rate', type=float, default=SIMULATION_TICK_RATE,
+                        help=f"simulation steps per simulated second (default: {SIMULATION_TICK_RATE})")
+    parser.add_argument('--render', action='store_true', help="draw every step into an offscreen surface")
+    parser.add_argument('--memory', action='store_true', help="print the memory used per entity type at the end")
+    parser.add_argument('--telemetry', choices=('debug', 'info', 'warning', 'error'),
+                        help="record events from this level up (default: TELEMETRY_LEVEL)")
+    parser.add_argument('--telemetry-file', default=TELEMETRY_FILE,
+                        help=f"NDJSON file the recorded events are written to (default: {TELEMETRY_FILE})")
+    parser.add_argument('--report-every', type=int, default=0,
+                        help="print a progress line every N steps (default: only at the end)")
+    return parser.parse_args(argv)
+
+def run(frames, tick_rate, seed=0, render=False, report_every=0):
+    """
+    Builds a game and runs it for `frames` fixed steps without a display.
+
+    Returns:
+        dict: Summary of the run, with simulated and wall-clock time and final entity counts.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')               # No window, even when a display exists
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    random.seed(seed)                                               # Same seed, same game
+    np.random.seed(seed)
+    pygame.init()
+    from game import Game                                           # Import after the video driver is chosen
+    from physics_world import WorldBody
+    game = Game()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if render else None
+    dt = 1 / tick_rate
+    start = time.perf_counter()
+    for frame in range(1, frames + 1):
+        game.step(dt, [])                                           # No keyboard, no events
+        if surface is not None:
+            game.draw(surface)
+        if report_every and frame % report_every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"step {frame}: {frame * dt:.1f}s simulated in {elapsed:.1f}s, "
+                  f"{len(game.updatable)} updatable, {len(game.collidable_group)} collidable")
+    elapsed = time.perf_counter() - start
+    telemetry.close()                                               # Write the events still in the buffer
+    summary = {
+        'seed': seed,
+        'frames': frames,
+        'tick_rate': tick_rate,
+        'simulated_seconds': frames * dt,
+        'wall_seconds': elapsed,
+        'steps_per_second': frames / elapsed if elapsed > 0 else float('inf'),
+        'speedup': frames * dt / elapsed if elapsed > 0 else float('inf'),
+        'game_state': game.state.state,
+        'score': game.state.score,
+        'group_sizes': {name: len(group) for name, group in game.groups.items()},
+        'memory': memory_report(game.groups.values(), WorldBody.world),
+        'telemetry': telemetry.stats(),
+    }
+    pygame.quit()
+    return summary
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.telemetry:
+        telemetry.configure(level=args.telemetry, path=args.telemetry_file)
+    summary = run(args.frames, args.tick_rate, args.seed, args.render, args.report_every)
+    print(f"{summary['frames']} steps ({summary['simulated_seconds']:.1f}s simulated) "
+          f"in {summary['wall_seconds']:.2f}s: {summary['steps_per_second']:.0f} steps/s, "
+          f"{summary['speedup']:.1f}x real time")
+    print(f"final state {summary['game_state']}, score {summary['score']}, "
+          + ", ".join(f"{name} {size}" for name, size in summary['group_sizes'].items()))
+    if summary['telemetry']['recorded']:
+        counts = summary['telemetry']
+        print(f"telemetry: {counts['recorded']} events recorded, {counts['written']} written, {counts['dropped']} dropped")
+    if args.memory:
+        for line in format_memory_report(summary['memory']):
+            print(line)
+
+if __name__ == "__main__":
+    main()
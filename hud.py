@@ -0,0 +1,69 @@
+"""
+Cached HUD text blocks.
+
+A `TextBlock` composites several centred lines of text into one surface and keeps it until the lines
+change, so a HUD element costs one blit per frame however many lines it has. The score line, the game over
+and name entry screens, and the leaderboard each own a block and only re-render when their values change.
+"""
+
+import pygame
+from constants import FONT_SIZE, TEXT_COLOR
+from text_cache import get_font
+
+class TextBlock():
+    """
+    Lines of centred text composited into one surface, re-rendered only when the lines change.
+
+    Attributes:
+        color (tuple): Text color.
+        size (int): Font size.
+        header_spacing (float): Line heights between the first line and the second, 1 for even spacing.
+        lines (tuple): Lines the cached surface was composed from.
+        surface (Surface): The composited lines, transparent between the glyphs.
+        renders (int): How many times the block has been composed.
+    """
+
+    def __init__(self, color=TEXT_COLOR, size=FONT_SIZE, header_spacing=1.0):
+        self.color = color
+        self.size = size
+        self.header_spacing = header_spacing
+        self.lines = None
+        self.surface = None
+        self.renders = 0
+
+    def set_lines(self, lines):
+        """Sets the block's text, composing a new surface only if it differs from the cached one."""
+        lines = tuple(lines)
+        if lines != self.lines:
+            self.lines = lines
+            self.surface = self.compose(lines)
+            self.renders += 1
+
+    def compose(self, lines):
+        """Renders every line once and stacks them, centred, on one transparent surface."""
+        font = get_font(self.size)
+        line_height = font.get_linesize()
+        surfaces = [font.render(line, True, self.color) for line in lines]
+        tops = [0]
+        for i in range(1, len(lines)):
+            tops.append(tops[-1] + line_height * (self.header_spacing if i == 1 else 1))
+        width = max((surface.get_width() for surface in surfaces), default=0)
+        height = int(tops[-1]) + line_height
+        block = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        for surface, top in zip(surfaces, tops):
+            rect = surface.get_rect(midtop=(width / 2, top))
+            block.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)  # Copy the glyphs' alpha instead of blending onto nothing
+        return block
+
+    def draw(self, screen, lines, x, y, centred=True):
+        """
+        Draws the lines with the first one centred on (x, y), or with the block's top left corner at (x, y)
+        when `centred` is False. Returns the rect drawn.
+        """
+        self.set_lines(lines)
+        if centred:
+            line_height = get_font(self.size).get_linesize()
+            rect = self.surface.get_rect(midtop=(x, y - line_height / 2))
+        else:
+            rect = self.surface.get_rect(topleft=(x, y))
+        return screen.blit(self.surface, rect)
@@ -1,90 +1,64 @@
 import pygame
+import time
 from constants import *
-from player import Player
-from asteroid import Asteroid
-from asteroid_field import AsteroidField
-from shot import Shot
-from floating_text import FloatingText
-from state import State
-from circle_shape import Shrapnel
-from aliens import AlienShip
-from alien_field import AlienField
-from loot import Loot, LootSpawner
-from explosion import Explosion
-from background import *
-from black_hole import BlackHole
+from game import Game
+from timestep import FixedTimestep
+from profiler import FrameProfiler
+from renderer import Renderer
+from render_scale import ResolutionScaler
+from telemetry import telemetry, INFO
 def main():
     """
-    The main function initializes the Pygame environment, creates game entities and sprite groups,
-    and runs the game loop. It handles events, updates the game state, checks for collisions, and
-    renders all game elements on the screen. The game loop continues until the player exits the game.
+    The main function initializes the Pygame environment, creates the game world and runs the game loop.
+    It handles events, advances the simulation in fixed steps, and renders all game elements on the
+    screen. The game loop continues until the player exits the game.
 
-    Sprite groups include updatable, drawable, collidable, and clearable objects such as the player,
-    asteroids, alien ships, shots, and various effects like explosions and floating text.
+    The sprite groups and game objects live in `Game`, which `headless.py` shares to run the same
+    simulation without a display.
     """
 
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock = pygame.time.Clock()
+    game = Game()                                               # Create sprite groups, state, player and spawn fields
+    state = game.state
+    timestep = FixedTimestep(SIMULATION_TICK_RATE, MAX_SIMULATION_STEPS) # Fixed simulation steps, separate from rendering
+    pending_events = []                                         # Events waiting for the next simulation step
+    profiler = FrameProfiler(game.groups)                       # Per-phase timings, toggled with F3, exported with F4
+    renderer = Renderer(screen)                                 # Full flips, or only the changed regions with DIRTY_RECT_RENDERING
+    scaler = ResolutionScaler(screen.get_size())                # World drawn at RENDER_SCALE, adaptive with RENDER_SCALE_ADAPTIVE
+    game.governor.subscribe(log_quality_change)                 # Report effects quality changes
+    if telemetry.active:
+        telemetry.configure(path=TELEMETRY_FILE)                # Write recorded events in the background
 
-    # Create sprite groups
-    updatable = pygame.sprite.Group()
-    drawable = pygame.sprite.Group()
-    asteroid_group = pygame.sprite.Group()
-    shots = pygame.sprite.Group()
-    all_text = pygame.sprite.Group()
-    shrapnel_group = pygame.sprite.Group()
-    collidable_group = pygame.sprite.Group()
-    alien_ships = pygame.sprite.Group()
-    loot_group = pygame.sprite.Group()
-    loot_spawner_group = pygame.sprite.Group() 
-    all_explosions = pygame.sprite.Group()
-    clearable_group = pygame.sprite.Group()
-
-    # Assign containers to classes for automatic group addition
-    Player.containers = (updatable, drawable, collidable_group)
-    AsteroidField.containers = (updatable)
-    LootSpawner.containers = (updatable, loot_spawner_group)
-    Asteroid.containers = (asteroid_group, updatable, drawable, collidable_group, clearable_group)
-    Shot.containers = (shots, updatable, drawable, collidable_group, clearable_group)
-    Shrapnel.containers = (updatable, drawable, collidable_group, clearable_group)
-    FloatingText.containers = (all_text, updatable, drawable, clearable_group)
-    AlienShip.containers =(updatable, drawable, collidable_group, alien_ships, clearable_group) 
-    Loot.containers = (loot_group, updatable, drawable, collidable_group, clearable_group)
-    Explosion.containers = (updatable, drawable, all_text, collidable_group, clearable_group)
-    BlackHole.containers = (updatable, drawable, collidable_group, clearable_group) 
-
-    # Initialize game state, spawn flields, player, background
-    state = State(False)
-    state.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,)
-    alien_field = AlienField(state.player, asteroid_group)
-    asteroid_field = AsteroidField()
-    drawable.add(state.player)
-    updatable.add(state.player, alien_field, asteroid_field)
-            
     state.running = True                                        # Set game state to running
     while state.running:                                        # Game loop runs while state is active
-        events = pygame.event.get()                             
+        events = pygame.event.get()
         for event in events:                                    # Process all game events
             if event.type == pygame.QUIT:                       # Check if the quit event is triggered
                 return                                          # Exit the game loop if quit is triggered
-        screen.blit(state.background, (0, 0))                   # Wipe the screen with the generated background
-        state.draw(screen)                                      # Draw the game state on the screen
-        dt = clock.tick(60) / 1000                              # Cap the frame rate at 60 FPS and calculate delta time
-        state.update(dt, updatable, drawable, collidable_group, clearable_group, events) # Update game state, passing groups for updating
-        for sprite in updatable:                                # Update all sprites marked as updatable
-            sprite.update(dt)                                   # Call the update method for each sprite with delta time
-        collidable_list = list(collidable_group)                # Create a list of collidable objects
-        for i in range(len(collidable_list)):                   # Loop through each collidable object
-            obj1 = collidable_list[i]                           # First object in the collision pair
-            for j in range(i + 1, len(collidable_list)):        # Loop through the remaining objects to check for collisions
-                obj2 = collidable_list[j]                       # Second object in the collision pair
-                obj1.collision(obj2)                            # Check for a collision between obj1 and obj2
-                obj2.collision(obj1)                            # Check for a collision between obj2 and obj1 (reverse order)
-        for sprite in drawable:                                 # Loop through all drawable sprites
-            sprite.draw(screen)                                 # Draw each sprite on the screen
-        state.draw(screen)                                      # Draw the game state elements on the screen
-        pygame.display.flip()                                   # Update the display with all the new drawings
+        profiler.handle_events(events)                          # Toggle the profiler overlay or export its CSV
+        pending_events.extend(events)                           # Keep events until a simulation step consumes them
+        frame_time = clock.tick(RENDER_FRAME_CAP) / 1000        # Cap the render rate and measure the real frame time
+        frame_start = time.perf_counter()                       # Work time excludes the frame cap's wait
+        for _ in range(timestep.advance(frame_time)):           # Run as many fixed steps as the frame time covers
+            game.step(timestep.dt, pending_events)              # Advance the simulation by one fixed step
+            profiler.record_step(game)                          # Add the step's phase times and collision counters
+            pending_events = []                                 # Events are handled by the first step only
+        renderer.begin(state.background, covered=scaler.scale < 1.0)    # Restore the background where needed
+        renderer.add(game.draw(screen, timestep.alpha, clear=False, scaler=scaler))  # Draw everything between its last two simulated states
+        profiler.record_draw(game)
+        renderer.add([profiler.draw(screen)])                   # Draw the profiler overlay when it is toggled on
+        flip_start = time.perf_counter()
+        renderer.present()                                      # Update the display with all the new drawings
+        profiler.record_flip(time.perf_counter() - flip_start)
+        profiler.end_frame()                                    # Store the frame's totals and group sizes
+        work_time = time.perf_counter() - frame_start
+        scaler.record(work_time)                                # Adapt the render scale to the frame-time budget
+        game.governor.record(work_time, len(game.collidable_group))  # Shed or restore effects with the load
+
+def log_quality_change(previous, tier, reason):
+    telemetry.event('quality', INFO, 'tier_change', previous=previous['name'], tier=tier['name'], reason=reason)
 
 if __name__ == "__main__":                                      # If this script is run as the main program
-    main()                                                      # Call the main function to start the game
\ No newline at end of file
+    main()                                                      # Call the main function to start the game
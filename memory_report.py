@@ -0,0 +1,62 @@
+"""
+Per-type memory report for live sprites.
+
+`entity_bytes` estimates what one sprite costs on its own: the object, its attribute dict (or slots), and
+the attribute values it owns outright, such as its vectors, emitters and group set. Shared values (the
+owner of a shot, cached textures and glyphs, class attributes) are not counted, and neither are the
+rows of attached bodies in the physics world arrays, which are reported once for the whole world.
+"""
+
+import sys
+import pygame
+
+OWNED_TYPES = (pygame.Vector2, float, set, dict, list)                  # Values created per instance
+
+def value_bytes(value):
+    """Returns the size of an attribute value if it belongs to the instance, and 0 if it is shared."""
+    if isinstance(value, OWNED_TYPES):
+        return sys.getsizeof(value)
+    slots = getattr(type(value), '__slots__', None)
+    if slots is not None:                                               # Small per-instance helpers like Emitter
+        return sys.getsizeof(value) + sum(value_bytes(getattr(value, name, None)) for name in slots)
+    return 0
+
+def entity_bytes(obj):
+    """Returns the estimated bytes owned by one sprite."""
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, '__dict__', None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+        size += sum(value_bytes(value) for value in attributes.values())
+    for name in getattr(type(obj), '__slots__', ()):
+        size += value_bytes(getattr(obj, name, None))
+    return size
+
+def memory_report(groups, world=None):
+    """
+    Returns {type name: {'count', 'bytes', 'bytes_each'}} for every distinct sprite in `groups`, plus a
+    'PhysicsWorld' entry with the size of the world arrays and its attached rows when a `world` is given.
+    """
+    sprites = {}
+    for group in groups:
+        for sprite in group:
+            sprites[id(sprite)] = sprite                                # A sprite in several groups counts once
+    report = {}
+    for sprite in sprites.values():
+        entry = report.setdefault(type(sprite).__name__, {'count': 0, 'bytes': 0})
+        entry['count'] += 1
+        entry['bytes'] += entity_bytes(sprite)
+    for entry in report.values():
+        entry['bytes_each'] = entry['bytes'] / entry['count']
+    if world is not None:
+        total = sum(value.nbytes for value in vars(world).values() if hasattr(value, 'nbytes'))  # Every world array
+        report['PhysicsWorld'] = {'count': int(world.active.sum()), 'bytes': total,
+                                  'bytes_each': total / world.capacity}   # Per row, attached or free
+    return report
+
+def format_memory_report(report):
+    """Returns the report as printable lines, largest total first."""
+    lines = [f"{'type':16} {'count':>7} {'bytes each':>11} {'total KB':>9}"]
+    for name, entry in sorted(report.items(), key=lambda item: -item[1]['bytes']):
+        lines.append(f"{name:16} {entry['count']:7} {entry['bytes_each']:11.0f} {entry['bytes'] / 1024:9.1f}")
+    return lines
@@ -0,0 +1,229 @@
+"""
+Batched narrowphase for circle-circle overlap tests.
+
+The broadphase hands over candidate pairs as two arrays of indices into the objects registered with the
+`SpatialHash` this frame. `circle_overlaps` tests all of them in one NumPy call and returns which pairs
+touch, their contact normals and penetration depths. Only the confirmed contacts are dispatched to the
+Python-level damage, score and pickup logic, and elastic bounces between solid bodies are resolved in one
+vectorized pass by `elastic_impulses` instead of one `CircleShape.bounce()` call per contact.
+
+Fast movers (shots and fast shrapnel) are also tested along the path they travelled during the step, so a
+hitch or a low tick rate cannot make them tunnel through a small target. `swept_overlaps` finds the time
+of impact of the relative motion of each pair; the fast mover is moved back to the point of impact before
+its contact is dispatched, so the handlers see the two objects touching as usual.
+"""
+
+import numpy as np
+import pygame
+from constants import CCD_MIN_TRAVEL, CCD_MAX_TRAVEL, CCD_CONTACT_SLOP
+from collision_layers import dispatch
+from physics_world import gather, scatter_add
+
+def circle_overlaps(positions, reaches, first, second):
+    """
+    Tests candidate pairs for overlap.
+
+    Args:
+        positions (ndarray): (n, 2) array of object positions.
+        reaches (ndarray): (n,) array of object reaches (radius plus any buffer).
+        first, second (ndarray): Index arrays of equal length, one entry per candidate pair.
+
+    Returns:
+        tuple: (hits, normals, depths) where `hits` is a boolean mask over the pairs, `normals` the unit
+        vectors pointing from the second object to the first and `depths` how far the reaches overlap.
+    """
+    delta = positions[first] - positions[second]                        # Vector from the second object to the first
+    distance = np.hypot(delta[:, 0], delta[:, 1])                       # Centre distance of every pair
+    depths = reaches[first] + reaches[second] - distance                # Positive when the reaches overlap
+    hits = depths > 0
+    normals = np.empty_like(delta)
+    touching = distance > 0
+    normals[touching] = delta[touching] / distance[touching, None]      # Normalise the line of impact
+    normals[~touching] = (1.0, 0.0)                                     # Concentric circles get an arbitrary normal
+    return hits, normals, depths
+
+def swept_overlaps(starts, ends, reaches, first, second):
+    """
+    Tests candidate pairs for contact at any time during the step, moving both objects in straight lines.
+
+    Args:
+        starts, ends (ndarray): (n, 2) arrays of positions at the start and the end of the step.
+        reaches (ndarray): (n,) array of object reaches.
+        first, second (ndarray): Index arrays of equal length, one entry per candidate pair.
+
+    Returns:
+        tuple: (hits, times, offsets) where `hits` marks pairs whose reaches start to overlap during the
+        step, `times` is the fraction of the step at first contact and `offsets` the vector from the
+        second object to the first at that moment. Pairs already overlapping at the start were resolved
+        in the previous step and are not reported.
+    """
+    offset = starts[first] - starts[second]                             # Relative position at the start of the step
+    motion = (ends[first] - starts[first]) - (ends[second] - starts[second])    # Relative motion over the step
+    reach = reaches[first] + reaches[second]
+    a = np.einsum('ij,ij->i', motion, motion)                           # Solve |offset + t * motion| = reach for t
+    b = 2 * np.einsum('ij,ij->i', offset, motion)
+    c = np.einsum('ij,ij->i', offset, offset) - reach * reach
+    discriminant = b * b - 4 * a * c
+    moving = (a > 0) & (c > 0) & (discriminant >= 0)
+    times = np.full(len(first), np.inf)
+    times[moving] = (-b[moving] - np.sqrt(discriminant[moving])) / (2 * a[moving])  # Earlier root: first touch
+    hits = (times >= 0) & (times <= 1)
+    offsets = offset + motion * np.where(hits, times, 0)[:, None]
+    return hits, times, offsets
+
+def step_start(obj, position=None):
+    """
+    Returns where an object was at the start of the step, or None when it spawned during the step or
+    moved further than `CCD_MAX_TRAVEL` (a teleport rather than a move). `position` is the object's
+    current position when the caller already has it.
+    """
+    start = getattr(obj, 'previous_position', None)                     # Stored by snapshot_states() before the step
+    if start is None:
+        return None
+    if start.distance_to(obj.position if position is None else position) > CCD_MAX_TRAVEL:
+        return None
+    return start
+
+def sweep_start(obj, position=None):
+    """
+    Returns where a fast mover started the step, or None when it does not need a swept test.
+
+    Only classes with `swept_collision` set are swept, and only when they travelled further than
+    `CCD_MIN_TRAVEL` of their reach (otherwise the end-of-step test cannot miss). `position` is the
+    object's current position when the caller already has it.
+    """
+    if not obj.swept_collision:
+        return None
+    if position is None:
+        position = obj.position
+    start = step_start(obj, position)
+    if start is None or start.distance_to(position) <= obj.broadphase_radius() * CCD_MIN_TRAVEL:
+        return None
+    return start
+
+def elastic_impulses(velocities_a, velocities_b, masses_a, masses_b, normals, restitution=1):
+    """
+    Vectorized equivalent of `CircleShape.bounce()` for many contacts at once.
+
+    Args:
+        velocities_a, velocities_b (ndarray): (m, 2) velocities of the two bodies of each contact.
+        masses_a, masses_b (ndarray): (m,) masses of the bodies (the radius, as in `bounce()`).
+        normals (ndarray): (m, 2) unit normals pointing from body b to body a.
+        restitution (float): Elasticity of the collision (1 = elastic).
+
+    Returns:
+        tuple: (delta_a, delta_b) velocity changes for the two bodies of each contact. Separating
+        contacts get zero change. The impulse is along the normal, so it applies no torque.
+    """
+    relative_velocity = velocities_a - velocities_b
+    velocity_along_normal = np.einsum('ij,ij->i', relative_velocity, normals)
+    approaching = velocity_along_normal < 0                             # Do not resolve separating contacts
+    impulse_scalar = -(1 + restitution) * velocity_along_normal
+    impulse_scalar /= (1 / masses_a + 1 / masses_b)                     # Impulse depends on both masses
+    impulse_scalar[~approaching] = 0
+    impulse = normals * impulse_scalar[:, None]
+    return impulse / masses_a[:, None], -impulse / masses_b[:, None]
+
+def bounce_contacts(bodies_a, bodies_b, normals, world=None):
+    """
+    Resolves elastic bounces for lists of touching bodies and applies the resulting velocity changes.
+    Bodies attached to `world` are read and written through its arrays.
+    """
+    if not bodies_a:
+        return
+    bodies = bodies_a + bodies_b
+    m = len(bodies_a)
+    velocities = gather(bodies, 'velocity', world)
+    masses = gather(bodies, 'radius', world)
+    delta_a, delta_b = elastic_impulses(velocities[:m], velocities[m:], masses[:m], masses[m:], normals)
+    deltas = np.concatenate((delta_a, delta_b))
+    changed = np.flatnonzero(np.any(deltas != 0, axis=1)).tolist()     # Separating contacts leave bodies alone
+    scatter_add([bodies[k] for k in changed], 'velocity', deltas[changed], world)
+
+def swept_contacts(grid, positions, reaches, first, second, hits, normals, depths):
+    """
+    Adds the contacts fast movers made along their path to `hits`, `normals` and `depths`, in place.
+
+    Every object moves in a straight line from where it started the step, swept or not, so a fast mover
+    also meets targets that are moving themselves. Each swept object keeps only its earliest impact and is
+    moved back to it, leaving `CCD_CONTACT_SLOP` of overlap so the collision handlers confirm the contact.
+    When the object it hit is swept as well, that one is moved back to the moment of impact too; a slower
+    object stays where it ended the step and the mover is placed against it as they were at impact.
+    """
+    swept = np.array(grid.swept)
+    pending = np.flatnonzero(~hits & (swept[first] | swept[second]))   # Pairs with a fast mover and no contact at the end
+    if len(pending) == 0:
+        return
+    starts = np.column_stack((grid.start_xs, grid.start_ys))
+    impacts, times, offsets = swept_overlaps(starts, positions, reaches, first[pending], second[pending])
+    objects = grid.objects
+    moved = set()
+    for k in np.argsort(times, kind='stable').tolist():                 # Earliest impacts first
+        if not impacts[k]:
+            break                                                       # Misses sort last (infinite time)
+        pair = pending[k]
+        i = int(first[pair])
+        j = int(second[pair])
+        mover, anchor, direction = (i, j, 1) if swept[i] else (j, i, -1)    # Move the swept object back to its impact
+        if mover in moved or (swept[anchor] and anchor in moved):
+            continue                                                    # Stopped by an earlier impact
+        moved.add(mover)
+        offset = offsets[k]
+        distance = np.hypot(offset[0], offset[1])
+        anchor_at = positions[anchor]
+        if swept[anchor]:                                               # Both fast: rewind both to the impact
+            moved.add(anchor)
+            anchor_at = starts[anchor] + (positions[anchor] - starts[anchor]) * times[k]
+            objects[anchor].position = pygame.Vector2(anchor_at.tolist())
+        placed = anchor_at + direction * offset * (1 - CCD_CONTACT_SLOP / distance)
+        objects[mover].position = pygame.Vector2(placed.tolist())
+        hits[pair] = True
+        normals[pair] = offset / distance
+        depths[pair] = CCD_CONTACT_SLOP                                 # The overlap left by the placement
+
+def collide(grid, layers, cache=None, world=None):
+    """
+    Runs the narrowphase for everything registered with `grid` this frame.
+
+    Candidate pairs of interacting kinds are tested in one batch, fast movers are also tested along
+    their swept path, confirmed contacts are dispatched to their collision handlers, and handlers that
+    report a solid contact have their bounce resolved in one vectorized pass afterwards. Each unordered
+    pair is resolved once. With a `ContactCache`, the handler only runs when a contact begins; pairs
+    that stay in contact keep their bounce but take no further damage. Bounces of bodies attached to
+    `world` are applied to its arrays directly. Returns the number of confirmed contacts.
+    """
+    if cache is not None:
+        cache.begin_step()
+    first, second = grid.candidate_indices(layers)
+    if len(first) == 0:
+        if cache is not None:
+            cache.end_step()                                            # Every contact ended
+        return 0
+    positions = np.column_stack((grid.xs, grid.ys))
+    reaches = np.array(grid.reaches, dtype=float)
+    hits, normals, depths = circle_overlaps(positions, reaches, first, second)
+    if grid.swept_count:
+        swept_contacts(grid, positions, reaches, first, second, hits, normals, depths)
+    objects = grid.objects
+    bodies_a = []
+    bodies_b = []
+    bounce_normals = []
+    for i, j, normal, depth in zip(first[hits].tolist(), second[hits].tolist(), normals[hits], depths[hits].tolist()):
+        obj1 = objects[i]
+        obj2 = objects[j]
+        if cache is None:
+            solid = dispatch(obj1, obj2)
+        else:
+            contact, new = cache.touch(obj1, obj2, normal, depth)
+            if new:
+                contact.solid = bool(dispatch(obj1, obj2))              # Damage, score and pickups once per contact
+            solid = contact.solid
+        if solid:                                                       # Handler asked for a bounce
+            bodies_a.append(obj1)
+            bodies_b.append(obj2)
+            bounce_normals.append(normal)
+    if cache is not None:
+        cache.end_step()
+    if bodies_a:
+        bounce_contacts(bodies_a, bodies_b, np.array(bounce_normals), world)
+    return int(hits.sum())
@@ -0,0 +1,113 @@
+"""
+Per-frame spatial index for neighbour queries from the AI.
+
+Alien ships look for asteroids to dodge and to shoot every step. Scanning the whole asteroid group from
+every alien costs aliens x asteroids distance checks, so the `Game` rebuilds one `NeighborIndex` over the
+asteroids at the start of the sprite update pass and the aliens query it instead.
+
+The index sorts the positions by grid cell into NumPy arrays, so a query only gathers the cells its circle
+overlaps and tests their positions in one vectorized pass. Results are returned in the order the objects
+were indexed (the group order), or nearest first for `nearest()`.
+"""
+
+import numpy as np
+from constants import NEIGHBOR_CELL_SIZE
+
+class NeighborIndex():
+    """
+    Uniform grid over a snapshot of object positions, rebuilt once per step.
+
+    Attributes:
+        cell_size (float): Width and height of a grid cell in pixels.
+        objects (list): Objects indexed by the last `rebuild()`, in group order.
+        positions (ndarray): (n, 2) positions of `objects` at the rebuild.
+        cells (dict): Maps a (cell_x, cell_y) tuple to the (start, end) slice of `order` for that cell.
+        order (ndarray): Object indices sorted by cell.
+        queries (int): Queries answered since the last rebuild.
+    """
+
+    def __init__(self, cell_size=NEIGHBOR_CELL_SIZE):
+        self.cell_size = cell_size
+        self.objects = []
+        self.positions = np.zeros((0, 2))
+        self.cells = {}
+        self.order = np.zeros(0, dtype=np.intp)
+        self.queries = 0
+
+    def rebuild(self, objects, world=None):
+        """Indexes the current positions of `objects`, read straight from the world arrays when attached."""
+        self.objects = objects = list(objects)
+        self.queries = 0
+        rows = [obj.world_row for obj in objects] if world is not None else None
+        if rows and None not in rows:
+            self.positions = world.position[rows]                          # One gather, no Vector2 per object
+        else:
+            self.positions = np.array([tuple(obj.position) for obj in objects], dtype=float).reshape(-1, 2)
+        cells = np.floor(self.positions / self.cell_size).astype(np.int64)
+        self.order = np.lexsort((cells[:, 1], cells[:, 0]))               # Objects of one cell are contiguous
+        sorted_cells = cells[self.order]
+        if len(sorted_cells):
+            changes = np.flatnonzero(np.any(sorted_cells[1:] != sorted_cells[:-1], axis=1)) + 1
+            starts = np.concatenate(([0], changes)).tolist()
+            ends = starts[1:] + [len(sorted_cells)]
+            keys = sorted_cells[starts].tolist()
+            self.cells = {(cx, cy): (start, end) for (cx, cy), start, end in zip(keys, starts, ends)}
+        else:
+            self.cells = {}
+
+    def candidates(self, x, y, radius):
+        """Returns the indices of the objects in the cells overlapped by a circle of `radius` around (x, y)."""
+        size = self.cell_size
+        cells = self.cells
+        order = self.order
+        slices = []
+        for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                span = cells.get((cx, cy))
+                if span is not None:
+                    slices.append(order[span[0]:span[1]])
+        if not slices:
+            return order[:0]
+        return np.concatenate(slices)
+
+    def distances_squared(self, indices, x, y):
+        offsets = self.positions[indices] - (x, y)
+        return np.einsum('ij,ij->i', offsets, offsets)
+
+    def within(self, position, radius):
+        """Returns the objects closer than `radius` to `position`, in group order."""
+        self.queries += 1
+        x, y = position
+        indices = self.candidates(x, y, radius)
+        indices = np.sort(indices[self.distances_squared(indices, x, y) < radius * radius])
+        objects = self.objects
+        return [objects[i] for i in indices.tolist()]
+
+    def nearest(self, position, k=None, radius=None):
+        """
+        Returns up to `k` objects nearest to `position`, nearest first. With a `radius`, only objects closer
+        than it are considered; without one, the search widens ring by ring until `k` objects are found.
+        """
+        self.queries += 1
+        x, y = position
+        if radius is None:
+            radius = self.cell_size
+            limit = np.abs(self.positions - (x, y)).max() * 1.5 if len(self.objects) else 0  # Covers every object
+            while True:
+                indices = self.candidates(x, y, radius)
+                distances = self.distances_squared(indices, x, y)
+                inside = distances < radius * radius
+                if k is not None and inside.sum() >= k or radius > limit:
+                    break
+                radius *= 2
+        else:
+            indices = self.candidates(x, y, radius)
+            distances = self.distances_squared(indices, x, y)
+            inside = distances < radius * radius
+        indices, distances = indices[inside], distances[inside]
+        closest = np.argsort(distances, kind='stable')[:k]
+        objects = self.objects
+        return [objects[i] for i in indices[closest].tolist()]
+
+    def __len__(self):
+        return len(self.objects)
@@ -0,0 +1,141 @@
+"""
+Pooled, array-backed particle system for short-lived cosmetic glyphs.
+
+Thruster exhaust, muzzle flashes, shot trails and shrapnel flames are not sprites. Each particle is a row
+in a handful of NumPy arrays, so it never joins a sprite group or the update loop. Every particle type owns
+a fixed slice of the pool, used as a ring. When the slice is full, a new particle replaces the oldest one
+of the same type. Glyphs are rendered once through the shared text cache and drawn in one `blits()` call.
+
+Objects emit with `emit()`, which does nothing until a `ParticleSystem` is made active (the `Game` does
+this), and use an `Emitter` to emit at a steady rate per simulated second rather than per draw call.
+"""
+
+import numpy as np
+from constants import PARTICLE_CAPS, PARTICLE_LIFETIMES
+from text_cache import render_text
+from render_scale import view
+
+class Emitter():
+    """
+    Turns an emission rate into a whole number of particles per simulation step.
+
+    Attributes:
+        rate (float): Particles per simulated second.
+        accumulator (float): Fraction of a particle carried over to the next step.
+    """
+    __slots__ = ('rate', 'accumulator')                                 # One per shot and shrapnel piece
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.accumulator = 0.0
+
+    def tick(self, dt):
+        """Returns how many particles to emit for a step of `dt` seconds."""
+        self.accumulator += self.rate * dt
+        count = int(self.accumulator)
+        self.accumulator -= count
+        return count
+
+class ParticleSystem():
+    """
+    Fixed-capacity pool of glyph particles, one ring per particle type.
+
+    Attributes:
+        active (ParticleSystem): Class attribute, the system `emit()` adds particles to, None disables it.
+        capacity (int): Total number of particle slots, the sum of the per-type caps.
+        slices (dict): Particle type -> (first slot, cap, lifetime in seconds).
+        x, y, age (ndarray): Position and age in seconds of every slot.
+        glyph (ndarray): Index into the glyph table of every slot.
+        alive (ndarray): Which slots hold a live particle.
+        rate (float): Fraction of emitted particles kept, lowered by the quality governor.
+    """
+    active = None                                                       # System used by emit(), set by Game
+
+    def __init__(self, caps=PARTICLE_CAPS, lifetimes=PARTICLE_LIFETIMES):
+        self.slices = {}
+        first = 0
+        for kind, cap in caps.items():
+            self.slices[kind] = (first, cap, lifetimes[kind])           # Each type owns a contiguous ring
+            first += cap
+        self.capacity = first
+        self.cursors = {kind: 0 for kind in caps}                       # Next slot to write in each ring
+        self.x = np.zeros(self.capacity)
+        self.y = np.zeros(self.capacity)
+        self.age = np.zeros(self.capacity)
+        self.lifetime = np.zeros(self.capacity)
+        for first, cap, lifetime in self.slices.values():
+            self.lifetime[first:first + cap] = lifetime
+        self.glyph = np.zeros(self.capacity, dtype=np.intp)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        self.glyphs = {}                                                # (text, color) -> glyph index
+        self.surfaces = []                                              # Rendered surface of each glyph
+        self.half_sizes = []                                            # Half width and height of each glyph, to centre it
+        self.rate = 1.0
+        self.credit = {kind: 0.0 for kind in caps}                      # Fraction of a particle owed to each type
+
+    def glyph_index(self, text, color):
+        """Returns the index of a glyph, rendering it the first time it is used."""
+        key = (text, tuple(color))
+        index = self.glyphs.get(key)
+        if index is None:
+            surface = render_text(text, color)
+            index = len(self.surfaces)
+            self.glyphs[key] = index
+            self.surfaces.append(surface)
+            self.half_sizes.append((surface.get_width() / 2, surface.get_height() / 2))
+        return index
+
+    def emit(self, kind, x, y, text, color):
+        """
+        Adds one particle of `kind`, replacing the oldest one of that kind when its ring is full. Below full
+        `rate`, only that fraction of each type's emissions is kept, evenly spaced.
+        """
+        credit = self.credit[kind] + self.rate
+        if credit < 1.0:
+            self.credit[kind] = credit
+            return
+        self.credit[kind] = credit - 1.0
+        first, cap, _ = self.slices[kind]
+        cursor = self.cursors[kind]
+        slot = first + cursor
+        self.cursors[kind] = (cursor + 1) % cap                         # Same lifetime per kind: the next slot is the oldest
+        self.x[slot] = x
+        self.y[slot] = y
+        self.age[slot] = 0.0
+        self.glyph[slot] = self.glyph_index(text, color)
+        self.alive[slot] = True
+
+    def update(self, dt):
+        """Ages every particle by `dt` seconds and retires the expired ones."""
+        self.age += dt
+        self.alive &= self.age <= self.lifetime
+
+    def draw(self, screen):
+        """Draws every live particle centred on its position, in one batched blit, returns the areas drawn."""
+        slots = np.flatnonzero(self.alive)
+        if len(slots) == 0:
+            return []
+        scale = view.scale
+        surfaces = [view.surface(surface) for surface in self.surfaces]        # Glyphs resized to the render scale
+        half_sizes = [(w * scale, h * scale) for w, h in self.half_sizes]
+        glyphs = self.glyph[slots].tolist()
+        xs = (self.x[slots] * scale).tolist()
+        ys = (self.y[slots] * scale).tolist()
+        return screen.blits([(surfaces[g], (x - half_sizes[g][0], y - half_sizes[g][1]))
+                             for g, x, y in zip(glyphs, xs, ys)])
+
+    def count(self, kind=None):
+        """Returns the number of live particles, of one kind or of all kinds."""
+        if kind is None:
+            return int(self.alive.sum())
+        first, cap, _ = self.slices[kind]
+        return int(self.alive[first:first + cap].sum())
+
+    def clear(self):
+        self.alive[:] = False
+
+def emit(kind, x, y, text, color):
+    """Emits a particle into the active system, if there is one."""
+    system = ParticleSystem.active
+    if system is not None:
+        system.emit(kind, x, y, text, color)
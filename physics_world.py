@@ -0,0 +1,241 @@
+"""
+Optional structure-of-arrays physics world for passive bodies.
+
+The `PhysicsWorld` keeps position, velocity, rotation, angular velocity, friction, radius and health of
+every attached body in contiguous NumPy arrays, one row per body, and integrates all of them in a single
+vectorized pass per frame instead of one `update()` call per object.
+
+Classes that mix in `WorldBody` (asteroids, shrapnel, shots and black holes) become thin handles onto
+their row while attached. When no world is set, or after the body is killed, the same attributes live on
+the instance as before, so the rest of the game is unaffected. Either way, reading a vector field returns a
+copy and only assignment (including `+=` and `-=`) changes the body.
+
+Reading a field through the descriptor builds a Python object per read. Loops over many bodies should use
+`gather()` and `scatter_add()` instead, which read and write the rows of all attached bodies in one NumPy
+call and only fall back to the attributes for detached ones.
+"""
+
+import numpy as np
+import pygame
+from constants import PHYSICS_WORLD_CAPACITY, REFERENCE_TICK_RATE
+
+class WorldField():
+    """Attribute stored in the body's world row while attached, or on the instance otherwise."""
+
+    def __init__(self, vector=False):
+        self.vector = vector                                            # True for 2D vectors, False for scalars
+
+    def __set_name__(self, owner, name):
+        self.name = name                                                # Name of the matching world array
+        self.slot = '_' + name                                          # Instance attribute used while detached
+
+    def __get__(self, body, owner=None):
+        if body is None:
+            return self
+        row = body.world_row
+        if row is None:
+            value = body.__dict__[self.slot]                            # Detached: plain instance attribute
+            return pygame.Vector2(value) if self.vector else value      # Copy, as when attached
+        array = getattr(body.world, self.name)
+        if self.vector:
+            return pygame.Vector2(array.item(row, 0), array.item(row, 1))   # Copy of the row as a Vector2
+        return array.item(row)
+
+    def __set__(self, body, value):
+        row = body.world_row
+        if row is None:
+            body.__dict__[self.slot] = value
+        elif self.vector:
+            getattr(body.world, self.name)[row] = (value[0], value[1])
+        else:
+            getattr(body.world, self.name)[row] = value
+
+class WorldBody():
+    """
+    Mixin for CircleShape subclasses whose motion is integrated by the shared `PhysicsWorld`.
+
+    Set `WorldBody.world` to a `PhysicsWorld` before spawning bodies to enable it. A body attaches
+    itself when created and detaches, copying its state back onto the instance, when killed.
+
+    Reads of `position` and `velocity` always return a new `pygame.Vector2`, attached or not, so an
+    in-place edit such as `body.velocity.x = 0` or `body.velocity.scale_to_length(s)` never reaches the
+    body. Assign the result instead (`body.velocity = v`, `body.velocity *= f`).
+    """
+    world = None                                                        # Shared PhysicsWorld, None disables it
+    world_row = None                                                    # Row of this body in the world arrays
+
+    position = WorldField(vector=True)
+    velocity = WorldField(vector=True)
+    angular_velocity = WorldField()
+    rotation = WorldField()
+    friction = WorldField()
+    angular_friction = WorldField()
+    radius = WorldField()
+    health = WorldField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.world is not None:
+            self.world.add(self)                                        # Move the state into the world arrays
+
+    def kill(self):
+        super().kill()
+        row = self.world_row
+        if row is not None and self.world.active[row]:
+            if getattr(self, 'lease', None) is not None:
+                self.world.park(self)                                   # Pooled: the row waits for the next life
+            else:
+                self.world.remove(self)                                 # Free the row, keep the final state
+
+class PhysicsWorld():
+    """
+    Contiguous NumPy storage and vectorized integration for passive bodies.
+
+    Attributes:
+        position (ndarray): (capacity, 2) array of body positions.
+        velocity (ndarray): (capacity, 2) array of body velocities.
+        angular_velocity (ndarray): Angular velocity of each body in degrees per second.
+        rotation (ndarray): Rotation of each body in degrees.
+        friction (ndarray): Linear friction factor per step at REFERENCE_TICK_RATE.
+        angular_friction (ndarray): Angular friction factor per step at REFERENCE_TICK_RATE.
+        radius (ndarray): Radius of each body.
+        health (ndarray): Health of each body.
+        active (ndarray): True for rows holding a live body.
+        bodies (list): The body object owning each row, or None for free rows.
+        count (int): Number of rows in use, including freed rows waiting for reuse.
+    """
+    fields = ('position', 'velocity', 'angular_velocity', 'rotation', 'friction', 'angular_friction', 'radius', 'health')
+
+    def __init__(self, capacity=PHYSICS_WORLD_CAPACITY):
+        self.capacity = capacity
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.angular_velocity = np.zeros(capacity)
+        self.rotation = np.zeros(capacity)
+        self.friction = np.ones(capacity)
+        self.angular_friction = np.ones(capacity)
+        self.radius = np.zeros(capacity)
+        self.health = np.zeros(capacity)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.bodies = [None] * capacity
+        self.count = 0                                                  # High-water mark of used rows
+        self.free_rows = []                                             # Freed rows ready for reuse
+
+    def grow(self):
+        """Doubles the capacity of every array."""
+        new_capacity = self.capacity * 2
+        for name in self.fields + ('active',):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.bodies.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def add(self, body):
+        """Attaches a body, moving its detached instance state into a free row."""
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.count == self.capacity:
+                self.grow()
+            row = self.count
+            self.count += 1
+        for name in self.fields:
+            value = body.__dict__.pop('_' + name)
+            if name in ('position', 'velocity'):
+                getattr(self, name)[row] = (value[0], value[1])
+            else:
+                getattr(self, name)[row] = value
+        self.active[row] = True
+        self.bodies[row] = body
+        body.world_row = row
+
+    def remove(self, body):
+        """Detaches a body, copying its row back onto the instance and freeing the row."""
+        row = body.world_row
+        for name in self.fields:
+            array = getattr(self, name)
+            if name in ('position', 'velocity'):
+                body.__dict__['_' + name] = pygame.Vector2(array.item(row, 0), array.item(row, 1))
+            else:
+                body.__dict__['_' + name] = array.item(row)
+        body.world_row = None
+        self.active[row] = False
+        self.velocity[row] = 0                                          # A free row must not drift
+        self.angular_velocity[row] = 0
+        self.bodies[row] = None
+        self.free_rows.append(row)
+
+    def park(self, body):
+        """
+        Marks a killed pooled body's row inactive but leaves it assigned, so reusing the body writes its new
+        state straight into the row instead of copying the state out and back in. The final state stays
+        readable for the rest of the step. A parked row keeps integrating until it is reused; reuse
+        overwrites every field, so nothing reads that drift.
+        """
+        self.active[body.world_row] = False
+
+    def unpark(self, body):
+        """Makes a parked row live again, once the body's new state has been written into it."""
+        self.active[body.world_row] = True
+
+    def integrate(self, dt):
+        """Applies friction and integrates position and rotation for every row in one pass."""
+        n = self.count
+        if n == 0:
+            return
+        steps = dt * REFERENCE_TICK_RATE                                # Friction is tuned per reference step
+        velocity = self.velocity[:n]
+        velocity *= np.power(self.friction[:n], steps)[:, None]         # Linear friction
+        self.position[:n] += velocity * dt                              # Linear inertia
+        angular_velocity = self.angular_velocity[:n]
+        angular_velocity *= np.power(self.angular_friction[:n], steps)  # Rotational friction
+        rotation = self.rotation[:n]
+        rotation += angular_velocity * dt                               # Rotational inertia
+        np.remainder(rotation, 360, out=rotation)                       # Keep rotation within 0-360 degrees
+
+def gather(bodies, name, world=None):
+    """
+    Returns field `name` of every body as an array, (n, 2) for vectors and (n,) for scalars.
+
+    Rows of bodies attached to `world` are read in one NumPy gather. Other bodies, including classes
+    that are not `WorldBody`s, are read through their attribute.
+    """
+    vector = name in ('position', 'velocity')
+    if world is None:
+        rows = [None] * len(bodies)
+    else:
+        rows = [getattr(body, 'world_row', None) for body in bodies]
+        if None not in rows:
+            return getattr(world, name)[rows]                           # Every body attached, one gather
+    values = np.empty((len(bodies), 2) if vector else len(bodies))
+    attached = [k for k, row in enumerate(rows) if row is not None]
+    if attached:
+        values[attached] = getattr(world, name)[[rows[k] for k in attached]]
+    for k, row in enumerate(rows):
+        if row is None:
+            value = getattr(bodies[k], name)
+            values[k] = (value[0], value[1]) if vector else value
+    return values
+
+def scatter_add(bodies, name, values, world=None):
+    """
+    Adds `values[k]` to field `name` of `bodies[k]`. A body listed more than once gets every value.
+
+    Rows of bodies attached to `world` are updated in one NumPy call, other bodies through their attribute.
+    """
+    vector = name in ('position', 'velocity')
+    rows = []
+    row_values = []
+    for body, value in zip(bodies, values):
+        row = getattr(body, 'world_row', None) if world is not None else None
+        if row is not None:
+            rows.append(row)
+            row_values.append(value)
+        elif vector:
+            setattr(body, name, getattr(body, name) + pygame.Vector2(value.tolist()))
+        else:
+            setattr(body, name, getattr(body, name) + float(value))
+    if rows:
+        np.add.at(getattr(world, name), rows, np.array(row_values))   # Unbuffered, repeated rows add up
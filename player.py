@@ -6,6 +6,10 @@ from shot import Shot
 from floating_text import FloatingText
 from explosion import Explosion
 from text_lists import player_death_screams
+from collision_layers import PLAYER
+from timestep import scaled_friction
+from particles import emit
+from render_scale import view
 
 class Player(CircleShape):
     """
@@ -13,6 +17,9 @@ class Player(CircleShape):
     It handles movement, shooting, scoring, and interaction with game elements such as asteroids.
     The player can move, rotate, shoot projectiles, and is affected by friction and stabilisers.
     """
+    collision_kind = PLAYER                                                     # Collision layer for the player
+    archetype = 'player'                                                        # Registry table of the player
+
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER_RADIUS)                                   # Initialize the player with position and radius
         self.velocity = pygame.Vector2(0, 0)                                    # Linear velocity for movement
@@ -23,17 +30,11 @@ class Player(CircleShape):
         self.time = 0                                                           # Track the player's time in the game
         self.asteroids_destroyed = 0                                            # Track the number of asteroids destroyed
         self.health = self.radius * 2                                           # Set health based on player radius
-        self.speed = self.velocity.length()                                     # Speed is the magnitude of the velocity
-        self.is_player = True                                                   # Flag to identify the object as a player
         self.shot_cooldown = PLAYER_SHOOT_COOLDOWN                              # Set the cooldown time between shots
         self.shot_damage = PLAYER_SHOT_DMG                                      # Set the damage caused by player's shot
         self.move_speed = PLAYER_SPEED                                          # Set the player's movement speed
         self.turn_speed = PLAYER_TURN_SPEED                                     # Set the player's turning speed
-        self.forward_direction = pygame.Vector2(0, 1).rotate(self.rotation)     # Forward direction vector based on current rotation
-        self.right_direction = self.forward_direction.rotate(90)                # Right direction vector (perpendicular to forward)       
         self.stabiliser_str = STABILISER_STR                                    # Set the strength of the stabilisers
-        self.forward_velocity = self.velocity.dot(self.forward_direction)       # Calculate forward velocity relative to direction
-        self.right_velocity = self.velocity.dot(self.right_direction)           # Calculate right velocity relative to direction
         self.stabiliser_velocity_threshold = STABILISER_VELOSITY_THRESHOLD      # Threshold for stabilising velocity
         self.color = PLAYER_COLOR                                               # Set the player's color
 
@@ -47,15 +48,11 @@ class Player(CircleShape):
    
     def draw(self, screen):                                                     # Draw the player as a triangle
         points = self.triangle()
-        pygame.draw.polygon(screen, (200, 180, 190), points)
+        return pygame.draw.polygon(screen, (200, 180, 190), view.points(points)) # Area drawn, for the dirty-rect renderer
 
     def update(self, dt):
-        self.forward_direction = pygame.Vector2(0, 1).rotate(self.rotation)     # Set the forward direction based on rotation
-        self.right_direction = self.forward_direction.rotate(90)                # Set the right direction (perpendicular to forward)
-        self.velocity *= self.friction                                          # Apply linear friction to reduce movement over time
-        self.angular_velocity *= self.angular_friction                          # Apply rotational friction to slow down turning
-        self.forward_velocity = self.velocity.dot(self.forward_direction)       # Calculate forward velocity relative to facing direction
-        self.right_velocity = self.velocity.dot(self.right_direction)           # Calculate rightward velocity relative to facing direction
+        self.velocity *= scaled_friction(self.friction, dt)                     # Apply linear friction to reduce movement over time
+        self.angular_velocity *= scaled_friction(self.angular_friction, dt)     # Apply rotational friction to slow down turning
         self.position += self.velocity * dt                                     # Update position based on velocity and time delta
         self.rotation += self.angular_velocity * dt                             # Update rotation based on angular velocity
         self.wrap_around_screen()                                               # Ensure player wraps around screen edges
@@ -106,21 +103,23 @@ class Player(CircleShape):
             key_turn_right (bool): Whether the 'turn right' key is pressed.
         """
         # Apply thresholds to stop small movements
-        if abs(self.forward_velocity) < self.stabiliser_velocity_threshold:       # Check forward velocity
-            self.forward_velocity = 0
-        if abs(self.right_velocity) < self.stabiliser_velocity_threshold:         # Check rightward velocity
-            self.right_velocity = 0
+        forward_velocity = self.forward_velocity                                  # Derived from the velocity, read once
+        right_velocity = self.right_velocity
+        if abs(forward_velocity) < self.stabiliser_velocity_threshold:            # Check forward velocity
+            forward_velocity = 0                                                  # Too small to stabilise
+        if abs(right_velocity) < self.stabiliser_velocity_threshold:              # Check rightward velocity
+            right_velocity = 0
         if abs(self.angular_velocity) < self.stabiliser_velocity_threshold:       # Check angular velocity
             self.angular_velocity = 0
         # Apply forward/backward stabilisers
-        if not key_up and self.forward_velocity > 0:                              # No forward input, moving forward
+        if not key_up and forward_velocity > 0:                                   # No forward input, moving forward
             self.move(-self.move_speed * dt * self.stabiliser_str)                # Slow down forward movement
-        if not key_down and self.forward_velocity < 0:                            # No backward input, moving backward
+        if not key_down and forward_velocity < 0:                                 # No backward input, moving backward
             self.move(self.move_speed * dt * self.stabiliser_str)                 # Slow down backward movement
         # Apply strafe stabilisers
-        if not key_strafe_left and self.right_velocity < 0:                       # No strafe left input, moving left
+        if not key_strafe_left and right_velocity < 0:                            # No strafe left input, moving left
             self.move_x(self.move_speed * dt * self.stabiliser_str)               # Slow down leftward movement
-        if not key_strafe_right and self.right_velocity > 0:                      # No strafe right input, moving right
+        if not key_strafe_right and right_velocity > 0:                           # No strafe right input, moving right
             self.move_x(-self.move_speed * dt * self.stabiliser_str)              # Slow down rightward movement
         # Apply rotational stabilisers
         if not key_turn_left and self.angular_velocity < 0:                       # No turn left input, rotating left
@@ -129,29 +128,25 @@ class Player(CircleShape):
             self.apply_torque(-self.turn_speed * dt * self.stabiliser_str)        # Reduce rightward rotation
 
     def move(self, force_magnitude):
-        force = self.forward_direction * force_magnitude                          # Calculate force in forward direction
+        forward = self.forward_direction
+        force = forward * force_magnitude                                         # Calculate force in forward direction
         self.velocity += force                                                    # Apply the force to the player's velocity
-        right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5  # Right offset for visual effect
-        b = self.position - self.forward_direction * self.radius - right          # Left-side effect position
-        c = self.position - self.forward_direction * self.radius + right          # Right-side effect position
-        FloatingText(b.x, b.y, "^", PLAYER_FIRE_COLOR, 50)                        # Show left-side visual effect
-        FloatingText(c.x, c.y, "^", PLAYER_FIRE_COLOR, 50)                        # Show right-side visual effect
+        right = self.right_direction * self.radius / 1.5                          # Right offset for visual effect
+        b = self.position - forward * self.radius - right                         # Left-side effect position
+        c = self.position - forward * self.radius + right                         # Right-side effect position
+        emit('thruster', b.x, b.y, "^", PLAYER_FIRE_COLOR)                        # Show left-side visual effect
+        emit('thruster', c.x, c.y, "^", PLAYER_FIRE_COLOR)                        # Show right-side visual effect
 
     def move_x(self, force_magnitude):
-        force = self.right_direction * force_magnitude                            # Calculate force in right direction
+        forward, right_direction = self.forward_direction, self.right_direction
+        force = right_direction * force_magnitude                                 # Calculate force in right direction
         self.velocity += force                                                    # Apply force to player's velocity
-        self.right_velocity                                                       # Right velocity relative to facing direction
-        if force_magnitude > 0:                                                   # Moving right
-            force = self.right_direction * force_magnitude                        # Adjust movement to the right
-            visual_char = ">"                                                     # Show right movement effect
-        else:                                                                     # Moving left
-            force = -self.right_direction * abs(force_magnitude)                  # Adjust movement to the left
-            visual_char = "<"                                                     # Show left movement effect
-        right = self.right_direction * self.radius / 1.5                          # Right offset for visual effect
-        b = self.position - self.forward_direction * self.radius - right          # Left-side effect position
-        c = self.position - self.forward_direction * self.radius + right          # Right-side effect position
-        FloatingText(b.x, b.y, visual_char, PLAYER_FIRE_COLOR, 50)                # Show left-side visual effect
-        FloatingText(c.x, c.y, visual_char, PLAYER_FIRE_COLOR, 50)                # Show right-side visual effect
+        visual_char = ">" if force_magnitude > 0 else "<"                         # Show right or left movement effect
+        right = right_direction * self.radius / 1.5                               # Right offset for visual effect
+        b = self.position - forward * self.radius - right                         # Left-side effect position
+        c = self.position - forward * self.radius + right                         # Right-side effect position
+        emit('thruster', b.x, b.y, visual_char, PLAYER_FIRE_COLOR)                # Show left-side visual effect
+        emit('thruster', c.x, c.y, visual_char, PLAYER_FIRE_COLOR)                # Show right-side visual effect
 
 
     def wrap_around_screen(self):
@@ -168,18 +163,19 @@ class Player(CircleShape):
     def shoot(self):
         # Create a new shot in the direction the player is facing
         shot_position = self.position + self.forward_direction * (self.radius + 10) # +10 forward from the ship to avoid collision
-        new_shot = Shot((shot_position.x), (shot_position.y), SHOT_RADIUS, self) 
+        new_shot = Shot.spawn((shot_position.x), (shot_position.y), SHOT_RADIUS, self) 
         # Incorporate the player's velocity into the shot's velocity
-        new_shot.velocity = PLAYER_SHOT_SPEED * self.forward_direction + self.velocity #add player velocity to shot
-        if new_shot.velocity.length() < PLAYER_SHOT_SPEED:
-            new_shot.velocity.scale_to_length(PLAYER_SHOT_SPEED) 
-        FloatingText(shot_position.x, shot_position.y, "ø", (255, 0, 0), 40)    # Create visual effect when shooting
+        shot_velocity = PLAYER_SHOT_SPEED * self.forward_direction + self.velocity #add player velocity to shot
+        if shot_velocity.length() < PLAYER_SHOT_SPEED:
+            shot_velocity.scale_to_length(PLAYER_SHOT_SPEED) 
+        new_shot.velocity = shot_velocity
+        emit('muzzle', shot_position.x, shot_position.y, "ø", (255, 0, 0))      # Create visual effect when shooting
         self.timer = self.shot_cooldown                                         # Reset the shooting timer
 
     def death(self):
         scream = random.choice(player_death_screams)                               # Choose a random death scream
-        FloatingText(self.position.x, self.position.y, scream, (250, 200, 100), 2000) # Display floating text at player's position
-        player_explosion = Explosion(self.position.x, self.position.y, 400)       # Create an explosion at player's position
+        FloatingText.spawn(self.position.x, self.position.y, scream, (250, 200, 100), 2000)  # Display floating text at player's position
+        player_explosion = Explosion.spawn(self.position.x, self.position.y, 400) # Create an explosion at player's position
         self.kill()                                                               # Remove the player object from the game
 
     def shrapnel_obj(self, mass):
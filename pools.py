@@ -0,0 +1,116 @@
+"""
+Object pools for short-lived sprites.
+
+Shots, shrapnel, explosions and floating texts are spawned and killed by the hundred during asteroid split
+cascades and alien deaths. Classes that mix in `Pooled` are created with `spawn()`, which takes an object
+from the class's `Pool` and resets it, and go back to the pool when they are killed.
+
+A reused object is reset in place: each pooled class's `reset()` takes the constructor's arguments and sets
+only the fields a new life changes (position, velocity, health, lifetime, owner, emitter state and a new
+contact key), keeping its instance dict, emitters and rendered surfaces. The pool then forgets the previous
+position used for interpolation and swept collision and puts the object back into its registry table.
+Pooled world bodies keep their `PhysicsWorld` row while they wait in the pool (`PhysicsWorld.park`), so
+the reset writes the new state straight into the row. Released objects only become available at the next `recycle()`, which the `Game` runs
+at the start of every step, so an object killed during a collision pass is never reused within that pass.
+"""
+
+from constants import POOL_CAPACITY
+
+class Pool():
+    """
+    Free list of killed objects of one class, reused by `acquire` instead of allocating new ones.
+
+    Attributes:
+        cls (type): Class the pool creates.
+        capacity (int): Free objects kept, released objects beyond it are left to the garbage collector.
+        free (list): Objects ready to be reused.
+        released (list): Objects killed since the last `recycle()`.
+        live (int): Objects acquired and not yet released.
+        high_water (int): Most objects live at once.
+        acquired (int): Objects handed out.
+        misses (int): Acquires that found no free object and allocated one.
+    """
+
+    def __init__(self, cls, capacity=POOL_CAPACITY):
+        self.cls = cls
+        self.capacity = capacity
+        self.free = []
+        self.released = []
+        self.live = 0
+        self.high_water = 0
+        self.acquired = 0
+        self.misses = 0
+
+    def acquire(self, *args, **kwargs):
+        """Returns a reset object built from the arguments of the class's constructor."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)                          # Same state as a new object
+            obj.revive()
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        obj.lease = self                                        # Returned to this pool when killed
+        self.acquired += 1
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return obj
+
+    def release(self, obj):
+        """Takes back a killed object; it can be reused after the next `recycle()`."""
+        obj.lease = None
+        self.live -= 1
+        if len(self.free) + len(self.released) < self.capacity:
+            self.released.append(obj)
+        elif getattr(obj, 'world_row', None) is not None:
+            obj.world.remove(obj)                               # Not kept, so its parked world row is freed
+
+    def recycle(self):
+        """Makes the objects released since the last call available to `acquire`."""
+        self.free.extend(self.released)
+        self.released.clear()
+
+    def stats(self):
+        """Returns the pool counters, for benchmarks."""
+        return {
+            'live': self.live,
+            'free': len(self.free) + len(self.released),
+            'high_water': self.high_water,
+            'acquired': self.acquired,
+            'misses': self.misses,
+            'hit_rate': 1 - self.misses / self.acquired if self.acquired else 0.0,
+        }
+
+class Pooled():
+    """
+    Mixin for sprites spawned from a pool. Set the class's `pool` (the `Game` does) to enable it;
+    `spawn()` falls back to plain construction when there is none.
+    """
+    pool = None                                                 # Pool of this class, None allocates every time
+    lease = None                                                # Pool the object was acquired from, until it is killed
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        """Creates an object, reusing a killed one from the class's pool when possible."""
+        if cls.pool is None:
+            return cls(*args, **kwargs)
+        return cls.pool.acquire(*args, **kwargs)
+
+    def reset(self, *args, **kwargs):
+        """Sets the fields a new life changes, from the arguments of `__init__`. Pooled classes override it."""
+        raise NotImplementedError(f"{type(self).__name__} must implement reset() to be pooled")
+
+    def revive(self):
+        """Returns a reset object to the game: no interpolation from its last life, back in its groups and world."""
+        self.__dict__.pop('previous_position', None)
+        self.__dict__.pop('previous_rotation', None)
+        self.add(self.containers)
+        if getattr(self, 'world_row', None) is not None:
+            self.world.unpark(self)                             # `reset()` already wrote the new state into the row
+        elif getattr(self, 'world', None) is not None:
+            self.world.add(self)                                # Detached while pooled, take a row again
+
+    def kill(self):
+        super().kill()
+        if self.lease is not None:
+            self.lease.release(self)                            # Killed objects may be killed again, released only once
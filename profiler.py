@@ -0,0 +1,126 @@
+"""
+Per-phase frame profiler with an on-screen overlay and CSV export.
+
+`FrameProfiler` collects, for every rendered frame, the time spent in `state.update`, the sprite update
+pass, the collision pass, the draw pass and `display.flip`, the number of collision pairs tested against
+contacts found, and the size of every sprite group. A toggleable overlay shows the latest numbers with a
+rolling frame-time graph, and the whole history can be exported as CSV.
+"""
+
+import csv
+import time
+from collections import deque
+import pygame
+from constants import *
+from text_cache import get_font, text_cache
+
+PHASES = ('state_update', 'sprite_update', 'collision', 'draw', 'flip')    # Phases timed every frame
+
+class FrameProfiler():
+    """
+    Records per-frame phase timings, collision counters and sprite group sizes.
+
+    Attributes:
+        visible (bool): Whether the overlay is drawn.
+        history (deque): One row (dict) per recorded frame, oldest first, at most PROFILER_HISTORY rows.
+        current (dict): The row being filled for the frame in progress.
+    """
+
+    def __init__(self, groups, history=PROFILER_HISTORY):
+        self.groups = groups                                    # Sprite groups to report, by name
+        self.history = deque(maxlen=history)                    # Rolling history of finished frames
+        self.frame_times = deque(maxlen=PROFILER_GRAPH_WIDTH)   # Recent frame times for the graph
+        self.visible = False                                    # Overlay starts hidden
+        self.font = None                                        # Overlay font, created when first shown
+        self.frame = 0                                          # Number of frames recorded
+        self.frame_start = time.perf_counter()
+        self.current = self.new_row()
+
+    def new_row(self):
+        row = {phase: 0.0 for phase in PHASES}
+        row.update({'frame': self.frame, 'frame_time': 0.0, 'steps': 0, 'pairs_tested': 0, 'contacts': 0})
+        return row
+
+    def handle_events(self, events):
+        """Toggles the overlay and exports the history on their keys."""
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == PROFILER_TOGGLE_KEY:
+                    self.visible = not self.visible
+                elif event.key == PROFILER_EXPORT_KEY:
+                    self.export_csv(PROFILER_CSV_FILE)
+
+    def record_step(self, game):
+        """Adds one simulation step's phase times and collision counters to the current frame."""
+        row = self.current
+        row['state_update'] += game.timings['state_update']
+        row['sprite_update'] += game.timings['sprite_update']
+        row['collision'] += game.timings['collision']
+        row['pairs_tested'] += game.pairs_tested
+        row['contacts'] += game.contacts
+        row['steps'] += 1
+
+    def record_draw(self, game):
+        self.current['draw'] = game.timings['draw']
+
+    def record_flip(self, seconds):
+        self.current['flip'] = seconds
+
+    def end_frame(self):
+        """Closes the current frame: stores its total time and group sizes and starts a new row."""
+        now = time.perf_counter()
+        row = self.current
+        row['frame_time'] = now - self.frame_start
+        for name, group in self.groups.items():
+            row[name] = len(group)
+        self.history.append(row)
+        self.frame_times.append(row['frame_time'])
+        self.frame += 1
+        self.frame_start = now
+        self.current = self.new_row()
+
+    def export_csv(self, path):
+        """Writes the recorded history to `path` as CSV, times in milliseconds."""
+        columns = ['frame', 'frame_time', 'steps'] + list(PHASES) + ['pairs_tested', 'contacts'] + list(self.groups)
+        timed = set(PHASES) | {'frame_time'}
+        try:
+            with open(path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow([f"{column}_ms" if column in timed else column for column in columns])
+                for row in self.history:
+                    writer.writerow([round(row[column] * 1000, 3) if column in timed else row[column] for column in columns])
+        except IOError as e:
+            print(f"Error exporting frame profile: {e}")
+
+    def draw(self, screen):
+        """Draws the overlay: latest phase times, counters, group sizes and a rolling frame-time graph, returns its rect."""
+        if not self.visible or not self.history:
+            return None
+        if self.font is None:
+            self.font = get_font(PROFILER_FONT_SIZE)
+        last = self.history[-1]
+        lines = [f"frame {last['frame_time'] * 1000:6.2f} ms  ({last['steps']} steps)"]
+        lines += [f"{phase:14} {last[phase] * 1000:6.2f} ms" for phase in PHASES]
+        lines.append(f"pairs {last['pairs_tested']}  contacts {last['contacts']}")
+        cache = text_cache.stats()
+        lines.append(f"text cache {cache['entries']} ({cache['bytes'] // 1024} KB)  hit rate {cache['hit_rate']:.0%}")
+        lines += [f"{name:18} {last[name]}" for name in self.groups]
+        line_height = self.font.get_linesize()
+        graph_height = 80
+        width = PROFILER_GRAPH_WIDTH
+        height = line_height * len(lines) + graph_height + 30
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))                                                  # Translucent backdrop
+        for i, line in enumerate(lines):
+            panel.blit(self.font.render(line, True, TEXT_COLOR), (10, 10 + i * line_height))
+        graph_bottom = height - 10
+        budget_ms = 1000 / RENDER_FRAME_CAP                                         # Frame budget at the render cap
+        scale = graph_height / (budget_ms * 2)                                      # Budget line sits halfway up
+        budget_y = graph_bottom - budget_ms * scale
+        pygame.draw.line(panel, (200, 60, 60), (0, budget_y), (width, budget_y), 1)
+        start = width - len(self.frame_times)                                      # Newest frame on the right edge
+        points = [(start + x, graph_bottom - min(frame_time * 1000 * scale, graph_height))
+                  for x, frame_time in enumerate(self.frame_times)]
+        if len(points) > 1:
+            pygame.draw.lines(panel, (100, 220, 100), False, points, 1)
+        return screen.blit(panel, (SCREEN_WIDTH - width - 20, 20))
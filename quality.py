@@ -0,0 +1,75 @@
+"""
+Adaptive effects quality.
+
+`QualityGovernor` watches a rolling window of frame work times and collidable object counts and moves
+through `QUALITY_TIERS`: one tier down when either load is over its budget, one tier back up once both
+have stayed well under it. Each tier sets how much mass a shrapnel piece takes, what fraction of cosmetic
+particles are emitted, how many explosion rings are drawn and how detailed the next background is.
+
+The governor only decides. Listeners registered with `subscribe` are told about every change and apply
+it (the `Game` does) or log it.
+"""
+
+from collections import deque
+from constants import *
+
+class QualityGovernor():
+    """
+    Steps through quality tiers from frame time and entity counts.
+
+    Attributes:
+        tiers (tuple): Tier settings, best first.
+        index (int): Current tier in `tiers`.
+        frame_budget (float): Frame work time in seconds the governor aims to stay under.
+        entity_budget (int): Collidable objects the governor aims to stay under.
+        frame_times (deque): Rolling window of frame work times.
+        entities (deque): Rolling window of collidable object counts.
+        frame (int): Frames recorded.
+        changes (list): Every tier change as (frame, previous tier name, new tier name, reason).
+        listeners (list): Callables run with (previous tier, new tier, reason) on every change.
+    """
+
+    def __init__(self, tiers=QUALITY_TIERS, frame_budget=QUALITY_FRAME_BUDGET, entity_budget=QUALITY_ENTITY_BUDGET,
+                 window=QUALITY_WINDOW):
+        self.tiers = tiers
+        self.index = 0                                                  # Start at the best quality
+        self.frame_budget = frame_budget
+        self.entity_budget = entity_budget
+        self.frame_times = deque(maxlen=window)
+        self.entities = deque(maxlen=window)
+        self.frame = 0
+        self.changes = []
+        self.listeners = []
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def record(self, frame_time, entities):
+        """Adds a frame's work time and collidable count and changes tier once a full window calls for it."""
+        self.frame += 1
+        self.frame_times.append(frame_time)
+        self.entities.append(entities)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+        frame_load = sum(self.frame_times) / len(self.frame_times) / self.frame_budget
+        entity_load = sum(self.entities) / len(self.entities) / self.entity_budget
+        if frame_load > 1 and self.index < len(self.tiers) - 1:
+            self.set_tier(self.index + 1, f"frame time at {frame_load:.0%} of budget")
+        elif entity_load > 1 and self.index < len(self.tiers) - 1:
+            self.set_tier(self.index + 1, f"entities at {entity_load:.0%} of budget")
+        elif max(frame_load, entity_load) < QUALITY_RECOVERY and self.index > 0:
+            self.set_tier(self.index - 1, "load recovered")             # Both loads well under budget
+
+    def set_tier(self, index, reason):
+        """Moves to tier `index`, records the change and tells every listener."""
+        previous = self.tier
+        self.index = index
+        self.frame_times.clear()                                        # Judge the new tier on its own frames
+        self.entities.clear()
+        self.changes.append((self.frame, previous['name'], self.tier['name'], reason))
+        for listener in self.listeners:
+            listener(previous, self.tier, reason)
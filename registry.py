@@ -0,0 +1,157 @@
+"""
+Entity registry with one dense table per archetype.
+
+Every entity belongs to exactly one `ArchetypeTable`, picked by its class's `archetype` tag, instead of
+four to six sprite groups. A table is a dense list: spawning appends, despawning swaps the last entity
+into the freed index (O(1)), and a whole table, or the whole world, is cleared in bulk. Tables implement
+the pygame group protocol, so they work as `containers` and `Sprite.kill()` keeps removing entities.
+
+`RegistryView` is the compatibility shim for the old groups: `game.updatable`, `game.collidable_group`
+and the rest are views over several tables. They iterate, count, test membership and add like a
+`pygame.sprite.Group`, so code written against groups keeps working while systems move to the tables.
+"""
+
+from itertools import chain
+import pygame
+
+ARCHETYPES = ('player', 'spawner', 'loot_spawner', 'asteroid', 'alien', 'shot', 'shrapnel', 'loot', 'field', 'text')
+
+class ArchetypeTable(pygame.sprite.AbstractGroup):
+    """
+    Dense, unordered table of the live entities of one archetype.
+
+    Attributes:
+        name (str): Archetype stored in the table.
+        entities (list): Live entities; each stores its index as `registry_index`.
+    """
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.entities = []
+
+    def add_internal(self, sprite, layer=None):
+        sprite.registry_index = len(self.entities)
+        self.entities.append(sprite)
+
+    def has_internal(self, sprite):
+        index = getattr(sprite, 'registry_index', None)
+        return index is not None and index < len(self.entities) and self.entities[index] is sprite
+
+    def remove_internal(self, sprite):
+        """Removes an entity in O(1) by moving the last entity into its index."""
+        if not self.has_internal(sprite):
+            return                                                      # Already cleared in bulk
+        index = sprite.registry_index
+        last = self.entities.pop()
+        if last is not sprite:
+            self.entities[index] = last
+            last.registry_index = index
+
+    def sprites(self):
+        return list(self.entities)
+
+    def __iter__(self):
+        return iter(list(self.entities))                                # Entities may spawn or die while iterating
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __bool__(self):
+        return bool(self.entities)
+
+    def __contains__(self, sprite):
+        return self.has_internal(sprite)
+
+    def despawn_all(self):
+        """Kills every entity of the table in bulk."""
+        entities, self.entities = self.entities, []                     # Empty the table first, kill() skips it
+        for sprite in entities:
+            sprite.kill()                                               # Other groups, world rows and pools still let go
+
+class Registry():
+    """
+    Owns one `ArchetypeTable` per archetype.
+
+    Attributes:
+        tables (dict): Archetype name -> ArchetypeTable.
+    """
+
+    def __init__(self, archetypes=ARCHETYPES):
+        self.tables = {name: ArchetypeTable(name) for name in archetypes}
+
+    def containers(self, archetype):
+        """Returns the `containers` tuple for a class of `archetype`."""
+        return (self.tables[archetype],)
+
+    def add(self, sprite):
+        """Registers an entity in the table of its archetype."""
+        sprite.add(self.tables[sprite.archetype])
+
+    def view(self, *archetypes):
+        """Returns a group-like view over the tables of `archetypes`."""
+        return RegistryView(self, archetypes)
+
+    def despawn_all(self, *archetypes):
+        """Kills every entity of `archetypes` in bulk, or of every archetype."""
+        for name in archetypes or self.tables:
+            self.tables[name].despawn_all()
+
+    def counts(self):
+        return {name: len(table) for name, table in self.tables.items()}
+
+class RegistryView(pygame.sprite.AbstractGroup):
+    """
+    `pygame.sprite.Group` compatible view over several archetype tables.
+
+    Attributes:
+        registry (Registry): Registry the tables belong to.
+        archetypes (tuple): Archetypes in the view, in iteration order.
+    """
+
+    def __init__(self, registry, archetypes):
+        super().__init__()
+        self.registry = registry
+        self.archetypes = archetypes
+        self.tables = [registry.tables[name] for name in archetypes]
+
+    def table_of(self, sprite):
+        if sprite.archetype not in self.archetypes:
+            raise ValueError(f"{type(sprite).__name__} ({sprite.archetype}) does not belong in this view")
+        return self.registry.tables[sprite.archetype]
+
+    def add(self, *sprites):
+        for sprite in sprites:
+            sprite.add(self.table_of(sprite))                           # The entity joins its table, not the view
+
+    def remove(self, *sprites):
+        for sprite in sprites:
+            sprite.remove(self.table_of(sprite))
+
+    def has_internal(self, sprite):
+        return any(table.has_internal(sprite) for table in self.tables)
+
+    def sprites(self):
+        return list(chain.from_iterable(table.entities for table in self.tables))
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self):
+        return sum(len(table.entities) for table in self.tables)
+
+    def __bool__(self):
+        return any(table.entities for table in self.tables)
+
+    def __contains__(self, sprite):
+        return self.has_internal(sprite)
+
+    def empty(self):
+        for table in self.tables:
+            for sprite in table.sprites():
+                sprite.remove(table)
+
+    def despawn_all(self):
+        """Kills every entity in the view, one table at a time."""
+        for table in self.tables:
+            table.despawn_all()
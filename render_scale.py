@@ -0,0 +1,132 @@
+"""
+Render-scale mode: draw the world at a fraction of the output resolution and upscale it in one step.
+
+The simulation always runs in screen coordinates. Draw code maps positions, radii and surfaces through the
+shared `view`, which is the identity at full scale, so gameplay is the same at every scale. Below full
+scale, `ResolutionScaler` hands out a smaller world surface with a matching downscaled background, and
+`present` stretches it over the screen. The HUD and floating texts are drawn afterwards, at full
+resolution, straight onto the screen.
+
+With `RENDER_SCALE_ADAPTIVE` on, the scaler steps through `RENDER_SCALE_STEPS` from a rolling window of
+frame times: down a step when the frames run over `RENDER_SCALE_BUDGET`, up a step when they have clear
+headroom. Scales are quantized to those steps so the scaled surface caches stay small.
+"""
+
+from collections import deque
+import pygame
+from constants import *
+
+class View():
+    """
+    Maps simulation coordinates onto the surface the world is being drawn on.
+
+    Attributes:
+        scale (float): Surface pixels per simulation pixel, 1 when drawing straight to the screen.
+        scaled (dict): Surface -> copy resized to `scaled_at`, for textures and glyphs.
+        scaled_at (float): Scale of the copies in `scaled`.
+    """
+
+    def __init__(self):
+        self.scale = 1.0
+        self.scaled = {}
+        self.scaled_at = 1.0
+
+    def set_scale(self, scale):
+        self.scale = scale
+
+    def point(self, position):
+        """Returns a simulation position on the drawing surface."""
+        return (position[0] * self.scale, position[1] * self.scale)
+
+    def points(self, points):
+        return [self.point(point) for point in points]
+
+    def length(self, length):
+        """Returns a simulation length (a radius) on the drawing surface, at least one pixel."""
+        return max(1, int(length * self.scale))
+
+    def surface(self, surface):
+        """Returns `surface` resized to the current scale, cached until the scale changes."""
+        if self.scale == 1.0:
+            return surface
+        if self.scale != self.scaled_at:
+            self.scaled.clear()                                         # Copies at the old scale are useless now
+            self.scaled_at = self.scale
+        scaled = self.scaled.get(surface)
+        if scaled is None:
+            if len(self.scaled) >= RENDER_SCALE_SURFACE_CACHE:
+                self.scaled.clear()                                     # Textures evicted upstream leave stale copies behind
+            width, height = surface.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            scaled = pygame.transform.smoothscale(surface, size)
+            self.scaled[surface] = scaled
+        return scaled
+
+view = View()                                                           # Shared by every draw() method
+
+class ResolutionScaler():
+    """
+    Chooses the render scale and owns the reduced-size world surface.
+
+    Attributes:
+        output_size (tuple): Size of the screen the world is upscaled to.
+        steps (tuple): Allowed scales, ascending and ending at full scale.
+        index (int): Current step in `steps`.
+        adaptive (bool): Whether the scale follows the frame-time budget.
+        budget (float): Frame time in seconds the adaptive scale aims to stay under.
+        frame_times (deque): Rolling window of recent frame work times.
+        changes (int): How many times the scale has changed.
+    """
+
+    def __init__(self, output_size, scale=RENDER_SCALE, adaptive=RENDER_SCALE_ADAPTIVE,
+                 budget=RENDER_SCALE_BUDGET, steps=RENDER_SCALE_STEPS):
+        self.output_size = tuple(output_size)
+        self.steps = tuple(sorted(steps))
+        self.index = min(range(len(self.steps)), key=lambda i: abs(self.steps[i] - scale))  # Nearest allowed step
+        self.adaptive = adaptive
+        self.budget = budget
+        self.frame_times = deque(maxlen=RENDER_SCALE_WINDOW)
+        self.changes = 0
+        self.world = None                                               # World surface at the current scale
+        self.source = None                                              # Background the scaled background was made from
+        self.background = None                                          # Background resized to the world surface
+
+    @property
+    def scale(self):
+        return self.steps[self.index]
+
+    def record(self, frame_time):
+        """Adds a frame's work time and moves one step down or up once a full window is over or well under budget."""
+        self.frame_times.append(frame_time)
+        if not self.adaptive or len(self.frame_times) < self.frame_times.maxlen:
+            return
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > self.budget and self.index > 0:
+            self.set_index(self.index - 1)                              # Over budget: draw fewer pixels
+        elif average < self.budget * RENDER_SCALE_HEADROOM and self.index < len(self.steps) - 1:
+            self.set_index(self.index + 1)                              # Clear headroom: sharpen again
+
+    def set_index(self, index):
+        self.index = index
+        self.frame_times.clear()                                        # Judge the new scale on its own frames
+        self.changes += 1
+
+    def begin(self, background):
+        """Sets the view to the current scale and returns the world surface, cleared to the scaled background."""
+        scale = self.scale
+        size = (round(self.output_size[0] * scale), round(self.output_size[1] * scale))
+        if self.world is None or self.world.get_size() != size:
+            self.world = pygame.Surface(size)
+            self.source = None
+        if background is not self.source:
+            self.background = pygame.transform.smoothscale(background, size)
+            self.source = background
+        view.set_scale(scale)
+        self.world.blit(self.background, (0, 0))
+        return self.world
+
+    def present(self, screen):
+        """Stretches the world surface over the screen in one step and resets the view to full scale."""
+        view.set_scale(1.0)
+        pygame.transform.scale(self.world, self.output_size, screen)
+        return screen.get_rect()
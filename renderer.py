@@ -0,0 +1,83 @@
+"""
+Frame presentation with an optional dirty-rectangle mode.
+
+In full mode every frame starts from the whole background and ends with `pygame.display.flip()`. In
+dirty-rect mode the renderer remembers the rects drawn in the previous frame (each `draw()` returns the
+area it touched), restores only those regions from the background, and pushes the old and new rects with
+`pygame.display.update(rects)`. Frames where the dirty area grows past a fraction of the screen, the
+background changes, or a caller invalidates the screen fall back to a full flip automatically.
+"""
+
+import pygame
+from constants import DIRTY_RECT_RENDERING, DIRTY_RECT_FULL_FLIP_FRACTION, DIRTY_RECT_MAX_RECTS
+
+class Renderer():
+    """
+    Prepares the screen for each frame and presents it.
+
+    Attributes:
+        dirty_rects (bool): Whether only changed regions are restored and updated.
+        threshold (float): Fraction of the screen above which a frame is flipped whole.
+        previous_rects (list): Rects drawn in the last frame, restored from the background in the next one.
+        full_frames (int): Frames presented with a full flip.
+        partial_frames (int): Frames presented with `display.update(rects)`.
+        dirty_fraction (float): Fraction of the screen covered by the last frame's dirty rects.
+    """
+
+    def __init__(self, screen, dirty_rects=DIRTY_RECT_RENDERING, threshold=DIRTY_RECT_FULL_FLIP_FRACTION):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.dirty_rects = dirty_rects
+        self.threshold = threshold
+        self.background = None                  # Background the screen was last restored from
+        self.previous_rects = []
+        self.rects = []                         # Rects drawn in the frame in progress
+        self.full = True                        # Whether the frame in progress redraws the whole screen
+        self.invalid = True                     # Forces the next frame to be drawn whole
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.dirty_fraction = 1.0
+
+    def invalidate(self):
+        """Makes the next frame redraw and present the whole screen."""
+        self.invalid = True
+
+    def begin(self, background, covered=False):
+        """
+        Restores the background under everything drawn last frame, or the whole background. A frame that
+        will be `covered` entirely, like an upscaled world, skips the restore and is flipped whole.
+        """
+        self.full = not self.dirty_rects or self.invalid or covered or background is not self.background
+        self.background = background
+        if covered:
+            pass                                                            # The frame overwrites every pixel anyway
+        elif self.full:
+            self.screen.blit(background, (0, 0))                            # Wipe the screen with the background
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(background, rect, rect)                    # Erase only where something was drawn
+        self.rects = []
+
+    def add(self, rects):
+        """Records rects drawn this frame; None entries (nothing drawn) are ignored."""
+        self.rects.extend(rect for rect in rects if rect)
+
+    def present(self):
+        """Pushes the frame to the display, with a full flip or an update of the dirty rects."""
+        current = [rect.clip(self.screen_rect) for rect in self.rects]
+        if not self.full:
+            dirty = self.previous_rects + current
+            area = sum(rect.width * rect.height for rect in dirty)         # Overlaps count twice, erring towards a flip
+            self.dirty_fraction = area / (self.screen_rect.width * self.screen_rect.height)
+            if self.dirty_fraction > self.threshold or len(dirty) > DIRTY_RECT_MAX_RECTS:
+                self.full = True                                            # Cheaper to push the whole screen
+        if self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+            if not self.dirty_rects or self.invalid:
+                self.dirty_fraction = 1.0
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self.previous_rects = current
+        self.invalid = False
@@ -0,0 +1,171 @@
+"""
+Uniform-grid spatial hash used as the collision broadphase.
+
+Every frame the collidable objects register themselves with the grid. Each object is stored in every
+cell its reach overlaps, where the reach is the distance at which the object can affect another one
+(its radius, plus any collision buffer, or the far influence radius for explosions and black holes).
+Only pairs of objects that share at least one cell are handed on to the narrowphase, which turns the
+all-pairs loop into a near-linear pass for evenly spread objects.
+
+Fast movers can register with the position they started the step from as well. They are then stored in
+every cell their swept path covers, so the narrowphase can test the whole path instead of the end point.
+"""
+
+import numpy as np
+from constants import SPATIAL_HASH_CELL_SIZE
+
+class SpatialHash():
+    """
+    A uniform grid that maps integer cell coordinates to the objects overlapping that cell.
+
+    Attributes:
+        cell_size (float): Width and height of a single grid cell in pixels.
+        cells (dict): Maps a (cell_x, cell_y) tuple to the list of objects overlapping that cell.
+        objects (list): Objects registered this frame, in registration order.
+        xs, ys, reaches (list): Position and reach of each registered object, by registration index.
+        start_xs, start_ys (list): Where each object started the step; the current position when not known.
+        swept (list): Whether each registered object was registered with its swept path.
+        swept_count (int): Number of swept objects registered this frame.
+        last_pair_count (int): Number of candidate pairs produced by the last `candidate_indices()` pass.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size                  # Size of a grid cell in pixels
+        self.cells = {}                             # Cell coordinate -> list of objects in that cell
+        self.objects = []                           # Objects registered this frame
+        self.xs = []                                # X position of each registered object
+        self.ys = []                                # Y position of each registered object
+        self.reaches = []                           # Reach of each registered object
+        self.start_xs = []                          # X position at the start of the step
+        self.start_ys = []                          # Y position at the start of the step
+        self.swept = []                             # True for objects registered with their swept path
+        self.swept_count = 0                        # Swept objects registered this frame
+        self.order = {}                             # id(object) -> registration index, keeps pair order stable
+        self.last_pair_count = 0                    # Candidate pairs produced by the last pass
+
+    def clear(self):
+        """Empties the grid, called once per frame before objects register again."""
+        self.cells.clear()
+        self.objects.clear()
+        self.xs.clear()
+        self.ys.clear()
+        self.reaches.clear()
+        self.start_xs.clear()
+        self.start_ys.clear()
+        self.swept.clear()
+        self.swept_count = 0
+        self.order.clear()
+
+    def cell_range(self, x, y, reach):
+        """Returns the inclusive cell coordinate bounds covered by a circle of `reach` around (x, y)."""
+        size = self.cell_size
+        return (int((x - reach) // size), int((y - reach) // size),
+                int((x + reach) // size), int((y + reach) // size))
+
+    def insert(self, obj, reach=None, start=None, position=None, previous=None):
+        """
+        Registers an object in every cell its reach overlaps.
+
+        When `start` (the position the object moved from this step) is given, the object is registered
+        along its whole swept path so pairs it passed through are still handed to the narrowphase.
+        Objects that are not swept can pass where they were at the start of the step as `previous`, so
+        a fast mover tested against them sees them moving too; without it they count as standing still.
+        `position` is the object's current (x, y) when the caller has already gathered it.
+        """
+        if reach is None:
+            reach = obj.broadphase_radius()                                 # Ask the object how far it can reach
+        x, y = obj.position if position is None else position
+        self.order[id(obj)] = len(self.objects)                             # Remember registration order
+        self.objects.append(obj)
+        self.xs.append(x)                                                   # Keep the state the narrowphase needs
+        self.ys.append(y)
+        self.reaches.append(reach)
+        min_x, min_y, max_x, max_y = self.cell_range(x, y, reach)
+        if start is None:
+            start_x, start_y = (x, y) if previous is None else previous
+            self.start_xs.append(start_x)
+            self.start_ys.append(start_y)
+            self.swept.append(False)
+        else:
+            self.start_xs.append(start.x)
+            self.start_ys.append(start.y)
+            self.swept.append(True)
+            self.swept_count += 1
+            start_min_x, start_min_y, start_max_x, start_max_y = self.cell_range(start.x, start.y, reach)
+            min_x, min_y = min(min_x, start_min_x), min(min_y, start_min_y)  # Cover the box around the whole path
+            max_x, max_y = max(max_x, start_max_x), max(max_y, start_max_y)
+        cells = self.cells
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]                                 # First object in this cell
+                else:
+                    bucket.append(obj)
+
+    def candidate_indices(self, layers=None):
+        """
+        Returns the unique pairs of objects sharing at least one cell, as two arrays of registration indices.
+
+        Objects with a large reach (black holes, explosions) cover many cells and would meet the same
+        neighbour in several of them, so pairs are de-duplicated. Each pair is ordered by registration
+        order so the collision pass sees objects in the same order as the sprite group. When `layers`
+        is given (a collection of interacting (kind, kind) tuples), pairs whose `collision_kind`s do
+        not interact are dropped here.
+        """
+        order = self.order
+        seen = set()
+        pairs = []
+        for bucket in self.cells.values():
+            count = len(bucket)
+            if count < 2:
+                continue                                                    # A lone object has nobody to hit
+            for i in range(count - 1):
+                obj1 = bucket[i]
+                index1 = order[id(obj1)]
+                for j in range(i + 1, count):
+                    obj2 = bucket[j]
+                    index2 = order[id(obj2)]
+                    key = (index1, index2) if index1 < index2 else (index2, index1)
+                    if key in seen:
+                        continue                                            # Pair already met in another cell
+                    if layers is not None and (obj1.collision_kind, obj2.collision_kind) not in layers:
+                        continue                                            # These kinds never interact
+                    seen.add(key)
+                    pairs.append(key)
+        pairs.sort()                                                        # Keep the collision order deterministic
+        self.last_pair_count = len(pairs)
+        indices = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+        return indices[:, 0], indices[:, 1]
+
+    def candidate_pairs(self, layers=None):
+        """Returns the unique candidate pairs as (object, object) tuples, see `candidate_indices()`."""
+        first, second = self.candidate_indices(layers)
+        objects = self.objects
+        return [(objects[i], objects[j]) for i, j in zip(first.tolist(), second.tolist())]
+
+    def query(self, position, radius):
+        """Returns every registered object stored in the cells overlapped by a circle around `position`."""
+        min_x, min_y, max_x, max_y = self.cell_range(position.x, position.y, radius)
+        found = {}
+        cells = self.cells
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                for obj in cells.get((cx, cy), ()):
+                    found[id(obj)] = obj                                    # Objects spanning cells are reported once
+        return list(found.values())
+
+    def stats(self):
+        """Returns occupancy statistics used to tune the cell size."""
+        occupancy = [len(bucket) for bucket in self.cells.values()]
+        occupied = len(occupancy)
+        return {
+            'cell_size': self.cell_size,                                    # Current cell size in pixels
+            'objects': len(self.objects),                                   # Objects registered this frame
+            'occupied_cells': occupied,                                     # Cells holding at least one object
+            'cell_entries': sum(occupancy),                                 # Total object-in-cell entries
+            'max_per_cell': max(occupancy) if occupied else 0,              # Most crowded cell
+            'mean_per_cell': sum(occupancy) / occupied if occupied else 0,  # Average load of an occupied cell
+            'candidate_pairs': self.last_pair_count,                        # Pairs handed to the narrowphase
+            'swept_objects': self.swept_count,                              # Fast movers registered with their path
+        }
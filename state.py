@@ -5,8 +5,9 @@ from constants import *
 from player import Player
 from floating_text import FloatingText
 from text_lists import start_messages
-from asteroid_field import AsteroidField
-from background import generate_star_and_planet_background
+from background import BackgroundLoader
+from hud import TextBlock
+from physics_world import WorldBody, gather
 
 class State():
     """
@@ -17,6 +18,7 @@ class State():
 
     Attributes:
         background (Surface): The star and planet background generated for the game.
+        background_loader (BackgroundLoader): Loads or generates backgrounds, off the main thread on respawn.
         player_dead (bool): Indicates if the player is currently dead.
         player (Player): The player object, initialized when the game starts or respawns.
         running (bool): Flag indicating if the game is currently running.
@@ -28,10 +30,13 @@ class State():
         high_scores (list): List of high score entries loaded from file.
         player_name (str): The name entered by the player upon game over.
         floating_texts (pygame.sprite.Group): Group of floating text sprites to display.
+        stats_text, game_over_text, name_entry_text, leaderboard (TextBlock): Cached HUD text, re-rendered on change.
     """
 
     def __init__(self, player_dead):
-        self.background = generate_star_and_planet_background(SCREEN_WIDTH, SCREEN_HEIGHT, 1000, 3, (50, 100))
+        self.background_loader = BackgroundLoader(SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_STARS,
+                                                  BACKGROUND_PLANETS, BACKGROUND_COLOR_RANGE)
+        self.background = self.background_loader.load(random.randrange(BACKGROUND_VARIANTS))  # First background is needed right away
         self.player_dead = player_dead        # Initial player death state
         self.player = None                    # Player is not initialized at the start
         self.running = True                   # The game starts in a running state
@@ -44,6 +49,10 @@ class State():
         self.name_entered = False             # Flag to indicate if the name has been entered
         self.state = 'PLAYING'                # Possible states: 'PLAYING', 'GAME_OVER', 'NAME_ENTRY', 'RESPAWN_WAIT'
         self.floating_texts = pygame.sprite.Group()  # Group to manage floating text sprites
+        self.stats_text = TextBlock()         # Score and time line
+        self.game_over_text = TextBlock()     # Game over summary
+        self.name_entry_text = TextBlock()    # Name entry prompt
+        self.leaderboard = TextBlock(header_spacing=1.5)  # Title and high score lines
         self.new_game()                       # Start a new game
 
     def update(self, dt, updatable, drawable, collidable_group, clearable_group, events):
@@ -64,6 +73,9 @@ class State():
                 self.save_score()                                             # Save the player's score
                 self.player_respawn(clearable_group)                          # Respawn player for a new game
                 self.state = 'PLAYING'                                        # Change state back to PLAYING
+        background = self.background_loader.poll()
+        if background is not None:
+            self.background = background                                      # Swap in a background finished by the worker
         self.floating_texts.update(dt)                                        # Update any floating text animations
         self.cull_offscreen_objects(collidable_group)                         # Remove objects that have moved off-screen
 
@@ -75,32 +87,37 @@ class State():
             self.health = self.player.health             # Update the player's health
 
     def draw(self, screen):
+        """Draws the HUD or the current screen, returns the rects drawn."""
+        rects = []
         if self.state == 'PLAYING':
-            self.draw_stats(screen)                                         # Draw player stats (health, score, etc.)
+            rects += self.draw_stats(screen)                                # Draw player stats (health, score, etc.)
             for floating_text in self.floating_texts:
-                floating_text.draw(screen)                                  # Draw any floating texts on the screen
+                rects.append(floating_text.draw(screen))                    # Draw any floating texts on the screen
         elif self.state == 'GAME_OVER':
-            self.draw_game_over(screen)                                     # Draw the game over screen
+            rects += self.draw_game_over(screen)                            # Draw the game over screen
         elif self.state == 'NAME_ENTRY':
-            self.draw_name_entry(screen)                                    # Draw the name entry screen
-            self.floating_texts.draw(screen)                                # Always draw floating texts in name entry state
+            rects += self.draw_name_entry(screen)                           # Draw the name entry screen
+            for floating_text in self.floating_texts:
+                rects.append(floating_text.draw(screen))                    # Always draw floating texts in name entry state
+        return [rect for rect in rects if rect is not None]
 
     def draw_stats(self, screen):
         health_bar_width = self.health
         health_bar_y_position = SCREEN_HEIGHT - 100                           # Position health bar slightly up from the bottom
-        pygame.draw.rect(screen, (0, 250, 0), (SCREEN_WIDTH / 2, health_bar_y_position, health_bar_width, 10))  # Draw the actual health bar
-        font = pygame.font.SysFont(None, FONT_SIZE)                           # Load the font for rendering text
+        bar_rect = pygame.draw.rect(screen, (0, 250, 0), (SCREEN_WIDTH / 2, health_bar_y_position, health_bar_width, 10))  # Draw the actual health bar
         score_time_text = f"Score: {self.score} | Time: {self.play_time}s"    # Prepare the score and time text
-        score_time_surface = font.render(score_time_text, True, TEXT_COLOR)   # Render the score and time surface
         padding = 40                                                          # Define padding for score and time placement
-        screen.blit(score_time_surface, (padding, padding))                   # Draw score and time text in the top left corner
+        text_rect = self.stats_text.draw(screen, [score_time_text], padding, padding, centred=False)  # Re-rendered only when the text changes
+        return [bar_rect, text_rect]
 
     def cull_offscreen_objects(self, collidable_group):
         """Removes objects that are off-screen by a certain margin."""
         off_screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)    # Create a rectangle covering the screen
         inflated_rect = off_screen_rect.inflate(125, 125)                   # Inflate rectangle to add margin
-        for item in collidable_group:
-            if not inflated_rect.collidepoint(item.position):
+        items = collidable_group.sprites()
+        positions = gather(items, 'position', WorldBody.world).tolist()     # One read of the world arrays for every attached body
+        for item, position in zip(items, positions):
+            if not inflated_rect.collidepoint(position):
                 item.kill()                                                 # Remove the object if it's outside the margin
 
     def input_player_name(self, events):
@@ -124,13 +141,12 @@ class State():
         save_high_scores(self.high_scores)                                                  # Save high scores to storage
 
     def player_respawn(self, clearable_group):
-        """Respawns the player, resets the background, and clears relevant game objects."""
+        """Respawns the player, requests a new background, and clears relevant game objects."""
         self.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-        self.background = generate_star_and_planet_background(SCREEN_WIDTH, SCREEN_HEIGHT, 1000, 3, (50, 100))
+        self.background_loader.request(random.randrange(BACKGROUND_VARIANTS))  # Old background stays until the new one is ready
         self.name_entered = False
         self.player_name = ""
-        for obj in clearable_group:
-            obj.kill()
+        clearable_group.despawn_all()                                                       # Clear the world table by table
         self.new_game()
 
     def new_game(self):
@@ -147,8 +163,8 @@ class State():
             f"Time Played: {self.play_time}s",
             "Press Return to enter your name"
         ]
-        self.display_multiline_text(screen, lines, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 100)
-        self.display_high_scores_on_screen(screen)
+        text_rect = self.game_over_text.draw(screen, lines, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 100)
+        return [text_rect, self.display_high_scores_on_screen(screen)]
 
     def draw_name_entry(self, screen):
         """Draws the name entry screen with instructions."""
@@ -157,34 +173,15 @@ class State():
             self.player_name,
             "Press Return when done to respawn and start a new game"
         ]
-        self.display_multiline_text(screen, lines, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50)
-
-    def display_multiline_text(self, screen, lines, x, y):
-        """Helper method to display multiple lines of text."""
-        font = pygame.font.Font(None, FONT_SIZE)
-        line_height = font.get_linesize()
-        for i, line in enumerate(lines):
-            text_surface = font.render(line, True, TEXT_COLOR)
-            rect = text_surface.get_rect(center=(x, y + i * line_height))
-            screen.blit(text_surface, rect)
+        return [self.name_entry_text.draw(screen, lines, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50)]
 
     def display_high_scores_on_screen(self, screen):
-        """Displays the high scores on the screen."""
-        font = pygame.font.Font(None, FONT_SIZE)
-        line_height = font.get_linesize()
-        x = SCREEN_WIDTH / 2
-        y = SCREEN_HEIGHT / 2 + 50
-        title_surface = font.render("High Scores:", True, TEXT_COLOR)
-        title_rect = title_surface.get_rect(center=(x, y))
-        screen.blit(title_surface, title_rect)
-        y += line_height * 1.5
+        """Displays the high scores as one cached block, re-rendered only when the scores change, returns its rect."""
+        lines = ["High Scores:"]
         for entry in self.high_scores:
             if len(entry['name']) >= 1:
-                line = f"{entry['name']} - {entry['score']} pts, {entry['time']}s"
-                text_surface = font.render(line, True, TEXT_COLOR)
-                rect = text_surface.get_rect(center=(x, y))
-                screen.blit(text_surface, rect)
-                y += line_height
+                lines.append(f"{entry['name']} - {entry['score']} pts, {entry['time']}s")
+        return self.leaderboard.draw(screen, lines, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
 
 def load_high_scores():
     """Load high scores from a file or create a default one if not found."""
@@ -0,0 +1,128 @@
+"""
+Leveled event telemetry with per-subsystem filters.
+
+Game code reports events with `telemetry.event(subsystem, level, name, **fields)` instead of printing. An
+event below the level of its subsystem is dropped by `enabled()` before any fields are built, so call sites
+in hot paths guard with it and cost one dict lookup when telemetry is off, which is the default.
+
+Accepted events go into an in-memory ring buffer. When a file is configured, a background thread drains
+the buffer every `TELEMETRY_FLUSH_INTERVAL` seconds and appends the events as NDJSON, one JSON object per
+line, so frames never wait on disk. When the buffer fills up between flushes, the oldest events are lost
+and counted in `dropped`.
+"""
+
+import atexit
+import json
+import threading
+import time
+from collections import deque
+from constants import *
+
+DEBUG, INFO, WARNING, ERROR, OFF = 10, 20, 30, 40, 100
+LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'off': OFF}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+class Telemetry():
+    """
+    Filters events by level and subsystem and buffers them for the NDJSON writer.
+
+    Attributes:
+        level (int): Lowest level recorded for subsystems without an override.
+        thresholds (dict): Subsystem -> lowest level recorded, overriding `level`.
+        buffer (deque): Ring buffer of event records waiting to be written, or kept when there is no file.
+        path (str): NDJSON file the events are appended to, None keeps them in memory only.
+        frame (int): Simulation step counter stamped on every event, advanced by the `Game`.
+        recorded (int): Events accepted since the start.
+        dropped (int): Events lost because the buffer was full.
+        written (int): Events written to the file.
+    """
+
+    def __init__(self, level=TELEMETRY_LEVEL, subsystems=TELEMETRY_SUBSYSTEMS, capacity=TELEMETRY_BUFFER):
+        self.buffer = deque(maxlen=capacity)
+        self.path = None
+        self.frame = 0
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.start = time.perf_counter()
+        self.writer = None                                      # Background flush thread, started with a file
+        self.stopping = threading.Event()
+        self.set_levels(level, subsystems)
+
+    def set_levels(self, level, subsystems=None):
+        """Sets the default level and the per-subsystem overrides, by name or number."""
+        self.level = LEVELS.get(level, level)
+        self.thresholds = {name: LEVELS.get(value, value) for name, value in (subsystems or {}).items()}
+
+    def configure(self, level=None, subsystems=None, path=None, flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        """Changes the filters and, when `path` is given, starts writing events to that NDJSON file."""
+        if level is not None or subsystems is not None:
+            self.set_levels(self.level if level is None else level, subsystems if subsystems is not None else self.thresholds)
+        if path is not None and self.writer is None:
+            self.path = path
+            self.writer = threading.Thread(target=self.run_writer, args=(flush_interval,), name="telemetry", daemon=True)
+            self.writer.start()
+            atexit.register(self.close)                         # Write what is left when the program ends
+
+    @property
+    def active(self):
+        """Whether any subsystem records events."""
+        return self.level < OFF or any(level < OFF for level in self.thresholds.values())
+
+    def enabled(self, subsystem, level):
+        """Whether an event of `level` from `subsystem` would be recorded."""
+        return level >= self.thresholds.get(subsystem, self.level)
+
+    def event(self, subsystem, level, name, **fields):
+        """Records an event; `fields` must be JSON serializable values, not game objects."""
+        if level < self.thresholds.get(subsystem, self.level):
+            return
+        record = {'t': round(time.perf_counter() - self.start, 6), 'frame': self.frame,
+                  'level': LEVEL_NAMES.get(level, level), 'subsystem': subsystem, 'event': name}
+        record.update(fields)
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1                                   # The append below pushes out the oldest event
+        self.buffer.append(record)
+        self.recorded += 1
+
+    def recent(self, count=None):
+        """Returns the buffered events, oldest first, or only the last `count`."""
+        events = list(self.buffer)
+        return events if count is None else events[-count:]
+
+    def run_writer(self, flush_interval):
+        while not self.stopping.wait(flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Appends the buffered events to the file; does nothing without one."""
+        if self.path is None or not self.buffer:
+            return
+        lines = []
+        while self.buffer:
+            try:
+                lines.append(json.dumps(self.buffer.popleft(), default=str))
+            except IndexError:                                  # Drained by the other thread
+                break
+        if not lines:
+            return
+        try:
+            with open(self.path, 'a') as file:
+                file.write('\n'.join(lines) + '\n')
+            self.written += len(lines)
+        except Exception as e:
+            print(f"Error writing telemetry: {e}")
+
+    def close(self):
+        """Stops the writer thread and writes the remaining events."""
+        if self.writer is not None:
+            self.stopping.set()
+            self.writer.join()
+            self.writer = None
+        self.flush()
+
+    def stats(self):
+        """Returns the telemetry counters, for run summaries."""
+        return {'recorded': self.recorded, 'dropped': self.dropped, 'written': self.written, 'buffered': len(self.buffer)}
+
+telemetry = Telemetry()                                         # Shared by every subsystem
@@ -0,0 +1,65 @@
+import numpy as np
+import pygame
+from area_effects import band_forces, apply_fields
+from circle_shape import CircleShape
+from collision_layers import FIELD, SHRAPNEL
+from physics_world import PhysicsWorld, WorldBody
+from spatial_hash import SpatialHash
+
+BANDS = (10, 50, 100)                                               # Near, mid and far radii
+STRENGTHS = (-3.0, -2.0, -1.0)                                      # Pull, strongest near the centre
+
+class Body(WorldBody, CircleShape):
+    pass
+
+class Field():
+    collision_kind = FIELD
+    near, mid_radius, far_radius = BANDS
+
+    def __init__(self, x, y):
+        self.position = pygame.Vector2(x, y)
+        self.applied = None
+
+    def broadphase_radius(self):
+        return self.far_radius
+
+    def field_strengths(self, dt):
+        return STRENGTHS
+
+    def field_applied(self, objects, distances):
+        self.applied = (objects, distances.tolist())
+
+def test_band_forces_follow_the_near_mid_and_far_bands():
+    positions = np.array([[5, 0], [0, 30], [-80, 0], [0, -104], [0, -120], [0, 0]], dtype=float)
+    radii = np.array([1, 1, 1, 5, 5, 1], dtype=float)
+    forces, distances, affected = band_forces((0, 0), positions, radii, BANDS, STRENGTHS)
+    assert distances.tolist() == [5, 30, 80, 104, 120, 0]
+    assert affected.tolist() == [True, True, True, True, False, True]   # Reaching into the far band counts
+    assert forces.tolist() == [[-3, 0], [0, -2], [1, 0], [0, 1], [0, 0], [0, 0]]  # Towards the centre, none at it
+
+def test_apply_fields_pushes_attached_and_detached_bodies(monkeypatch):
+    world = PhysicsWorld(capacity=4)
+    monkeypatch.setattr(WorldBody, 'world', world)
+    attached = Body(30, 0, 1)
+    detached = CircleShape(0, 80, 1)
+    shrapnel = CircleShape(-5, 0, 1)
+    shrapnel.collision_kind = SHRAPNEL
+    far = CircleShape(300, 0, 1)
+    field = Field(0, 0)
+    grid = SpatialHash(cell_size=20)
+    for obj in (field, attached, detached, shrapnel, far):
+        grid.insert(obj)
+    assert apply_fields([field], grid, 1 / 60, world) == 3
+    assert tuple(attached.velocity) == (-2, 0)                      # Written into its world row
+    assert tuple(detached.velocity) == (0, -1)
+    assert tuple(shrapnel.velocity) == (3, 0)
+    assert tuple(far.velocity) == (0, 0)
+    objects, distances = field.applied
+    assert set(objects) == {attached, detached, shrapnel} and sorted(distances) == [5, 30, 80]
+
+def test_field_without_targets_is_told_so():
+    field = Field(0, 0)
+    grid = SpatialHash(cell_size=20)
+    grid.insert(field)
+    assert apply_fields([field], grid, 1 / 60) == 0
+    assert field.applied == ([], [])
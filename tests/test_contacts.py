@@ -0,0 +1,76 @@
+import pygame
+import pytest
+from contacts import ContactCache, contact_keys
+from spatial_hash import SpatialHash
+from narrowphase import collide
+from collision_layers import HANDLERS
+from constants import SHOT_RADIUS, SHOT_EXPLOSION_BUFFER
+from shot import Shot
+from explosion import Explosion
+from timers import SimulationClock
+
+class Owner():
+    shot_damage = 10
+    score = 0
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimulationClock()
+    monkeypatch.setattr(SimulationClock, 'active', clock)
+    monkeypatch.setattr(Explosion, 'containers', pygame.sprite.Group(), raising=False)   # Exploding shots spawn one
+    return clock
+
+def collide_step(objects, cache):
+    grid = SpatialHash()
+    for obj in objects:
+        grid.insert(obj)
+    return collide(grid, HANDLERS, cache)
+
+class Pair():
+    collision_kind = 'asteroid'
+
+    def __init__(self, x):
+        self.position = pygame.Vector2(x, 0)
+        self.velocity = pygame.Vector2(0, 0)
+        self.radius = 10
+        self.destroyed = False
+        self.contact_key = next(contact_keys)
+
+    def broadphase_radius(self):
+        return self.radius
+
+def test_contact_begins_once_and_ends_when_apart():
+    cache = ContactCache()
+    a, b = Pair(0), Pair(15)
+    hits = []
+    a.collision = lambda other, bounce=True: hits.append(other)
+    for _ in range(3):
+        collide_step([a, b], cache)
+    assert hits == [b]                                              # Handler ran when the contact began only
+    assert len(cache.contacts) == 1 and cache.started == 0
+    b.position = pygame.Vector2(100, 0)
+    collide_step([a, b], cache)
+    assert cache.contacts == {} and cache.ended == 1
+    b.position = pygame.Vector2(15, 0)
+    collide_step([a, b], cache)
+    assert hits == [b, b] and cache.started == 1                    # Touching again is a new contact
+
+def test_shots_meeting_at_the_edge_of_their_reach_explode(clock):
+    gap = 2 * (SHOT_RADIUS + SHOT_EXPLOSION_BUFFER) - 1            # Inside the broadphase reach of both shots
+    first = Shot(0, 0, SHOT_RADIUS, Owner())
+    second = Shot(gap, 0, SHOT_RADIUS, Owner())
+    collide_step([first, second], ContactCache())
+    assert first.destroyed and second.destroyed
+
+def test_approaching_shots_do_not_pass_through_each_other(clock):
+    first = Shot(0, 0, SHOT_RADIUS, Owner())
+    second = Shot(200, 0, SHOT_RADIUS, Owner())
+    first.velocity = pygame.Vector2(150, 0)
+    second.velocity = pygame.Vector2(-150, 0)
+    cache = ContactCache()
+    for _ in range(40):
+        for shot in (first, second):
+            shot.update(1 / 60)
+        collide_step([shot for shot in (first, second) if not shot.destroyed], cache)
+        clock.advance(1 / 60)
+    assert first.destroyed and second.destroyed
@@ -0,0 +1,83 @@
+import random
+import numpy as np
+import pygame
+import pytest
+from circle_shape import CircleShape
+from narrowphase import circle_overlaps, elastic_impulses, bounce_contacts
+from physics_world import PhysicsWorld, WorldBody
+
+class Ball(WorldBody, CircleShape):
+    pass
+
+def random_balls(rng, count, cls=CircleShape):
+    balls = []
+    for _ in range(count):
+        ball = cls(rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(2, 30))
+        ball.velocity = pygame.Vector2(rng.uniform(-300, 300), rng.uniform(-300, 300))
+        balls.append(ball)
+    return balls
+
+def test_circle_overlaps_matches_the_scalar_distance_test():
+    rng = random.Random(1)
+    balls = random_balls(rng, 40)
+    positions = np.array([tuple(ball.position) for ball in balls])
+    reaches = np.array([ball.radius for ball in balls])
+    first, second = np.triu_indices(len(balls), 1)
+    hits, normals, depths = circle_overlaps(positions, reaches, first, second)
+    for k, (i, j) in enumerate(zip(first.tolist(), second.tolist())):
+        a, b = balls[i], balls[j]
+        distance = a.position.distance_to(b.position)
+        assert hits[k] == (a.radius + b.radius > distance)          # Same condition as CircleShape.collision()
+        assert depths[k] == pytest.approx(a.radius + b.radius - distance)
+        assert tuple(normals[k]) == pytest.approx(tuple((a.position - b.position) / distance))
+
+def test_circle_overlaps_gives_concentric_circles_a_unit_normal():
+    hits, normals, depths = circle_overlaps(np.zeros((2, 2)), np.ones(2), np.array([0]), np.array([1]))
+    assert hits[0] and depths[0] == 2
+    assert np.hypot(*normals[0]) == pytest.approx(1)
+
+def test_elastic_impulses_match_scalar_bounce():
+    rng = random.Random(2)
+    balls = random_balls(rng, 60)
+    pairs = list(zip(balls[0::2], balls[1::2]))
+    velocities_a = np.array([tuple(a.velocity) for a, b in pairs])
+    velocities_b = np.array([tuple(b.velocity) for a, b in pairs])
+    masses_a = np.array([a.radius for a, b in pairs])
+    masses_b = np.array([b.radius for a, b in pairs])
+    normals = np.array([tuple((a.position - b.position).normalize()) for a, b in pairs])
+    delta_a, delta_b = elastic_impulses(velocities_a, velocities_b, masses_a, masses_b, normals)
+    separating = 0
+    for k, (a, b) in enumerate(pairs):
+        a.bounce(b)
+        assert tuple(a.velocity) == pytest.approx(tuple(velocities_a[k] + delta_a[k]))
+        assert tuple(b.velocity) == pytest.approx(tuple(velocities_b[k] + delta_b[k]))
+        separating += not delta_a[k].any()
+    assert 0 < separating < len(pairs)                              # Both branches of bounce() were exercised
+
+@pytest.mark.parametrize('attached', [False, True])
+def test_bounce_contacts_matches_scalar_bounce(monkeypatch, attached):
+    world = PhysicsWorld(capacity=8) if attached else None
+    monkeypatch.setattr(WorldBody, 'world', world)
+    rng = random.Random(3)
+    batched = random_balls(rng, 20, Ball)
+    rng = random.Random(3)
+    scalar = random_balls(rng, 20)
+    bodies_a, bodies_b = batched[0::2], batched[1::2]
+    normals = np.array([tuple((a.position - b.position).normalize()) for a, b in zip(bodies_a, bodies_b)])
+    bounce_contacts(bodies_a, bodies_b, normals, world)
+    for a, b in zip(scalar[0::2], scalar[1::2]):
+        a.bounce(b)
+    for ball, expected in zip(batched, scalar):
+        assert (ball.world_row is not None) == attached
+        assert tuple(ball.velocity) == pytest.approx(tuple(expected.velocity))
+
+def test_bounce_contacts_adds_every_contact_of_a_body(monkeypatch):
+    world = PhysicsWorld(capacity=4)
+    monkeypatch.setattr(WorldBody, 'world', world)
+    middle, left, right = Ball(0, 0, 10), Ball(-15, 0, 10), Ball(15, 0, 10)
+    left.velocity = pygame.Vector2(100, 0)
+    right.velocity = pygame.Vector2(-100, 0)
+    bounce_contacts([middle, middle], [left, right], np.array([(1.0, 0.0), (-1.0, 0.0)]), world)
+    assert tuple(middle.velocity) == pytest.approx((0, 0))          # Equal and opposite pushes cancel
+    assert tuple(left.velocity) == pytest.approx((0, 0))
+    assert tuple(right.velocity) == pytest.approx((0, 0))
@@ -0,0 +1,55 @@
+import random
+import pygame
+from neighbors import NeighborIndex
+from physics_world import PhysicsWorld
+
+class Body():
+    world_row = None
+
+    def __init__(self, x, y):
+        self.position = pygame.Vector2(x, y)
+
+def scattered(count, seed=0):
+    rng = random.Random(seed)
+    return [Body(rng.uniform(-300, 900), rng.uniform(-300, 700)) for _ in range(count)]
+
+def brute_within(bodies, position, radius):
+    return [body for body in bodies if body.position.distance_to(position) < radius]
+
+def brute_nearest(bodies, position):
+    return sorted(bodies, key=lambda body: body.position.distance_squared_to(position))
+
+def test_within_matches_a_full_scan_in_group_order():
+    bodies = scattered(400)
+    index = NeighborIndex(cell_size=50)
+    index.rebuild(bodies)
+    for position, radius in (((0, 0), 150), ((450, 200), 37), ((-290, 690), 300), ((5000, 0), 100)):
+        assert index.within(position, radius) == brute_within(bodies, pygame.Vector2(position), radius)
+    assert index.queries == 4
+
+def test_nearest_matches_a_full_scan():
+    bodies = scattered(300, seed=1)
+    index = NeighborIndex(cell_size=40)
+    index.rebuild(bodies)
+    for position in ((0, 0), (600, 400), (-1000, -1000)):
+        by_distance = brute_nearest(bodies, pygame.Vector2(position))
+        assert index.nearest(position, k=5) == by_distance[:5]     # Widens until five are found
+        inside = [body for body in by_distance if body.position.distance_to(position) < 120]
+        assert index.nearest(position, k=3, radius=120) == inside[:3]
+    assert index.nearest((0, 0)) == brute_nearest(bodies, pygame.Vector2(0, 0))
+
+def test_rebuild_reads_attached_positions_from_the_world():
+    world = PhysicsWorld(capacity=4)
+    bodies = [Body(0, 0), Body(0, 0)]
+    for row, body in enumerate(bodies):
+        body.world_row = row
+    world.position[:2] = ((10, 10), (200, 200))                     # The instances' own positions are stale
+    index = NeighborIndex(cell_size=50)
+    index.rebuild(bodies, world)
+    assert index.within((0, 0), 50) == [bodies[0]]
+
+def test_empty_index_finds_nothing():
+    index = NeighborIndex()
+    index.rebuild([])
+    assert len(index) == 0
+    assert index.within((0, 0), 100) == [] and index.nearest((0, 0), k=3) == []
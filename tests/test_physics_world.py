@@ -0,0 +1,60 @@
+import numpy as np
+import pygame
+import pytest
+from circle_shape import CircleShape
+from physics_world import PhysicsWorld, WorldBody, gather, scatter_add
+
+class Body(WorldBody, CircleShape):
+    pass
+
+@pytest.fixture
+def world(monkeypatch):
+    world = PhysicsWorld(capacity=2)
+    monkeypatch.setattr(WorldBody, 'world', world)
+    return world
+
+def test_gather_and_scatter_add_mix_attached_and_detached_bodies(world):
+    attached = Body(1, 2, 3)
+    detached = Body(4, 5, 6)
+    detached.kill()
+    plain = CircleShape(7, 8, 9)                                    # Not a WorldBody at all
+    bodies = [attached, detached, plain]
+    assert gather(bodies, 'position', world).tolist() == [[1, 2], [4, 5], [7, 8]]
+    assert gather(bodies, 'radius', world).tolist() == [3, 6, 9]
+    scatter_add(bodies + [attached], 'velocity', np.array([[1, 0], [0, 2], [3, 3], [1, 0]]), world)
+    assert world.velocity[attached.world_row].tolist() == [2, 0]    # Listed twice, both values added
+    assert tuple(detached.velocity) == (0, 2) and tuple(plain.velocity) == (3, 3)
+    scatter_add([attached, plain], 'health', np.array([-1.0, -2.0]), world)
+    assert attached.health == 5 and plain.health == 16
+
+def test_removed_body_keeps_its_state_and_its_row_is_reused(world):
+    a, b = Body(0, 0, 1), Body(10, 0, 2)
+    b.velocity = pygame.Vector2(5, 0)
+    row = b.world_row
+    b.kill()
+    assert b.world_row is None and not world.active[row] and world.free_rows == [row]
+    assert tuple(b.position) == (10, 0) and tuple(b.velocity) == (5, 0)   # Copied back onto the instance
+    assert tuple(world.velocity[row]) == (0, 0)                     # A free row does not drift
+    c = Body(20, 0, 3)
+    assert c.world_row == row and world.active[row] and world.count == 2
+    assert tuple(c.position) == (20, 0) and c.radius == 3 and a.world_row == 0
+
+def test_world_grows_past_its_capacity(world):
+    bodies = [Body(k, 0, 1) for k in range(5)]
+    assert world.capacity == 8 and world.count == 5
+    assert [tuple(body.position) for body in bodies] == [(k, 0) for k in range(5)]
+
+def test_integrate_matches_the_per_object_update(world):
+    body = Body(0, 0, 1, friction=0.9, angular_friction=0.5)
+    body.velocity = pygame.Vector2(60, -30)
+    body.angular_velocity = 720
+    body.rotation = 350
+    reference = CircleShape(0, 0, 1, friction=0.9, angular_friction=0.5)
+    reference.velocity = pygame.Vector2(60, -30)
+    reference.angular_velocity = 720
+    reference.rotation = 350
+    world.integrate(1 / 60)
+    reference.update(1 / 60)
+    assert body.position.distance_to(reference.position) < 1e-9
+    assert body.velocity.distance_to(reference.velocity) < 1e-9
+    assert body.rotation == pytest.approx(reference.rotation)
@@ -0,0 +1,68 @@
+import pygame
+import pytest
+import circle_shape
+from circle_shape import Shrapnel
+from physics_world import PhysicsWorld, WorldBody
+from pools import Pool
+from timers import SimulationClock
+
+@pytest.fixture
+def pool(monkeypatch):
+    clock = SimulationClock()
+    monkeypatch.setattr(SimulationClock, 'active', clock)
+    monkeypatch.setattr(WorldBody, 'world', PhysicsWorld(capacity=8))
+    monkeypatch.setattr(Shrapnel, 'containers', pygame.sprite.Group(), raising=False)
+    pool = Pool(Shrapnel, capacity=2)
+    monkeypatch.setattr(Shrapnel, 'pool', pool)
+    return pool
+
+def test_killed_objects_are_reused_after_recycle(pool):
+    first = Shrapnel.spawn(1, 2, 2)
+    first.kill()
+    assert Shrapnel.spawn(1, 2, 2) is not first                     # Not within the step it died in
+    pool.recycle()
+    assert Shrapnel.spawn(3, 4, 1) is first
+    stats = pool.stats()
+    assert (stats['acquired'], stats['misses'], stats['high_water'], stats['live']) == (3, 2, 2, 2)
+
+def test_reused_object_starts_like_a_new_one(pool):
+    world = WorldBody.world
+    old = Shrapnel.spawn(10, 20, 2, (1, 2, 3))
+    old.velocity = pygame.Vector2(300, 0)
+    old.health = -5
+    old.destroyed = True
+    old.previous_position = pygame.Vector2(0, 0)
+    old_key, row = old.contact_key, old.world_row
+    old.kill()
+    assert old.world_row == row and not world.active[row]           # Parked, final state still readable
+    assert tuple(old.velocity) == (300, 0)
+    pool.recycle()
+    new = Shrapnel.spawn(50, 60, 1, (4, 5, 6))
+    assert new is old and new.world_row == row and world.active[row]
+    assert tuple(new.position) == (50, 60) and tuple(new.velocity) == (0, 0)
+    assert new.radius == 1 and new.health == 2 and not new.destroyed
+    assert new.rgb == (4, 5, 6) and new.contact_key != old_key
+    assert not hasattr(new, 'previous_position')
+    assert new.alive() and new.lease is pool
+
+def test_reused_object_is_not_expired_by_its_previous_life(pool, monkeypatch):
+    lifetimes = iter((100, 600))                                    # Milliseconds, first life shorter than the second
+    monkeypatch.setattr(circle_shape.random, 'randrange', lambda *args: next(lifetimes))
+    clock = SimulationClock.active
+    shrapnel = Shrapnel.spawn(0, 0, 2)
+    clock.advance(0.05)
+    shrapnel.kill()                                                 # Dies before its first lifetime ends
+    pool.recycle()
+    assert Shrapnel.spawn(0, 0, 2) is shrapnel
+    clock.advance(0.25)                                             # Past the first lifetime
+    assert shrapnel.alive()
+    clock.advance(0.4)                                              # Past the second one
+    assert not shrapnel.alive()
+
+def test_objects_beyond_capacity_free_their_world_row(pool):
+    world = WorldBody.world
+    pieces = [Shrapnel.spawn(0, 0, 2) for _ in range(3)]
+    for piece in pieces:
+        piece.kill()
+    assert [piece.world_row is None for piece in pieces] == [False, False, True]
+    assert len(world.free_rows) == 1
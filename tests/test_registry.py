@@ -0,0 +1,60 @@
+import pygame
+from registry import Registry
+
+class Entity(pygame.sprite.Sprite):
+    archetype = 'asteroid'
+
+def spawn(registry, count):
+    entities = []
+    for _ in range(count):
+        entity = Entity()
+        registry.add(entity)
+        entities.append(entity)
+    return entities
+
+def assert_indices(table):
+    for index, entity in enumerate(table.entities):
+        assert entity.registry_index == index
+
+def test_swap_remove_moves_last_entity_into_the_freed_index():
+    registry = Registry()
+    table = registry.tables['asteroid']
+    a, b, c, d = spawn(registry, 4)
+    b.kill()
+    assert table.entities == [a, d, c]
+    assert_indices(table)
+    assert b not in table and d in table
+
+def test_removing_the_last_entity_moves_nothing():
+    registry = Registry()
+    table = registry.tables['asteroid']
+    a, b, c = spawn(registry, 3)
+    c.kill()
+    assert table.entities == [a, b]
+    assert_indices(table)
+
+def test_indices_stay_consistent_through_many_removals():
+    registry = Registry()
+    table = registry.tables['asteroid']
+    entities = spawn(registry, 50)
+    for entity in entities[::3] + entities[1::7]:
+        entity.kill()
+        assert_indices(table)
+    alive = [entity for entity in entities if entity.alive()]
+    assert sorted(map(id, table.entities)) == sorted(map(id, alive))
+
+def test_killing_twice_does_not_remove_the_entity_moved_into_its_index():
+    registry = Registry()
+    table = registry.tables['asteroid']
+    a, b, c = spawn(registry, 3)
+    a.kill()
+    table.remove_internal(a)                                        # Stale index now points at c
+    assert table.entities == [c, b]
+    assert_indices(table)
+
+def test_despawn_all_empties_the_table_and_kills_everything():
+    registry = Registry()
+    entities = spawn(registry, 5)
+    registry.despawn_all('asteroid')
+    assert len(registry.tables['asteroid']) == 0
+    assert not any(entity.alive() for entity in entities)
@@ -0,0 +1,55 @@
+import random
+import pygame
+from spatial_hash import SpatialHash
+from collision_layers import HANDLERS, ASTEROID, SHRAPNEL
+
+class Body():
+    def __init__(self, x, y, reach, kind=ASTEROID):
+        self.position = pygame.Vector2(x, y)
+        self.reach = reach
+        self.collision_kind = kind
+
+    def broadphase_radius(self):
+        return self.reach
+
+def cells_of(grid, body):
+    min_x, min_y, max_x, max_y = grid.cell_range(body.position.x, body.position.y, body.reach)
+    return {(cx, cy) for cx in range(min_x, max_x + 1) for cy in range(min_y, max_y + 1)}
+
+def pairs(grid, layers=None):
+    first, second = grid.candidate_indices(layers)
+    return list(zip(first.tolist(), second.tolist()))
+
+def test_two_large_bodies_sharing_many_cells_make_one_pair():
+    grid = SpatialHash(cell_size=10)
+    grid.insert(Body(50, 50, 45))
+    grid.insert(Body(55, 50, 45))
+    assert pairs(grid) == [(0, 1)]
+
+def test_large_reach_meets_neighbours_in_different_cells_once_each():
+    grid = SpatialHash(cell_size=10)
+    grid.insert(Body(0, 0, 100))                                    # Covers 21 x 21 cells
+    for x, y in ((-80, -80), (80, 80), (5, 5), (6, 5), (-95, 40)):
+        grid.insert(Body(x, y, 1))
+    result = pairs(grid)
+    assert len(result) == len(set(result))
+    assert [pair for pair in result if pair[0] == 0] == [(0, k) for k in range(1, 6)]
+    assert (3, 4) in result                                         # The small neighbours share a cell too
+
+def test_candidates_match_brute_force_cell_sharing():
+    rng = random.Random(7)
+    grid = SpatialHash(cell_size=32)
+    bodies = [Body(rng.uniform(0, 400), rng.uniform(0, 400), rng.choice((2, 5, 20, 90))) for _ in range(120)]
+    for body in bodies:
+        grid.insert(body)
+    cells = [cells_of(grid, body) for body in bodies]
+    expected = [(i, j) for i in range(len(bodies)) for j in range(i + 1, len(bodies)) if cells[i] & cells[j]]
+    assert pairs(grid) == expected
+    assert grid.last_pair_count == len(expected)
+
+def test_layers_drop_pairs_that_never_interact():
+    grid = SpatialHash(cell_size=10)
+    grid.insert(Body(0, 0, 50, SHRAPNEL))
+    grid.insert(Body(1, 0, 50, SHRAPNEL))
+    grid.insert(Body(2, 0, 50, ASTEROID))
+    assert pairs(grid, HANDLERS) == [(0, 2), (1, 2)]
@@ -0,0 +1,77 @@
+import numpy as np
+import pygame
+import pytest
+from constants import CCD_CONTACT_SLOP
+from narrowphase import swept_overlaps, swept_contacts, circle_overlaps, sweep_start, step_start
+from spatial_hash import SpatialHash
+
+class Body():
+    collision_kind = 'shot'
+    swept_collision = True
+
+    def __init__(self, start, end, reach):
+        self.previous_position = pygame.Vector2(start)
+        self.position = pygame.Vector2(end)
+        self.reach = reach
+
+    def broadphase_radius(self):
+        return self.reach
+
+def sweep(starts, ends, reaches, pairs):
+    first, second = (np.array(side) for side in zip(*pairs))
+    return swept_overlaps(np.array(starts, dtype=float), np.array(ends, dtype=float),
+                          np.array(reaches, dtype=float), first, second)
+
+def test_time_of_impact_against_a_standing_target():
+    hits, times, offsets = sweep([(0, 0), (50, 0)], [(100, 0), (50, 0)], [5, 5], [(0, 1)])
+    assert hits[0] and times[0] == pytest.approx(0.4)               # Touches after 40 of 100 px
+    assert tuple(offsets[0]) == pytest.approx((-10, 0))
+
+def test_time_of_impact_when_both_move():
+    hits, times, offsets = sweep([(0, 0), (100, 0)], [(100, 0), (0, 0)], [5, 5], [(0, 1)])
+    assert hits[0] and times[0] == pytest.approx(0.45)              # 90 px of gap closed at 200 px per step
+    assert tuple(offsets[0]) == pytest.approx((-10, 0))
+
+def test_crossing_paths_hit_only_when_the_target_motion_is_known():
+    starts, ends = [(0, 0), (50, -50)], [(100, 0), (50, 50)]
+    hits, times, _ = sweep(starts, ends, [5, 5], [(0, 1)])
+    assert hits[0] and times[0] == pytest.approx(0.5 - 10 / np.hypot(100, 100))
+    hits, _, _ = sweep([starts[0], ends[1]], ends, [5, 5], [(0, 1)])  # Target assumed standing at its end
+    assert not hits[0]
+
+def test_pairs_overlapping_at_the_start_or_never_meeting_are_not_reported():
+    hits, times, _ = sweep([(0, 0), (5, 0), (0, 100)], [(100, 0), (5, 0), (100, 100)], [5, 5, 5], [(0, 1), (0, 2)])
+    assert not hits.any() and np.isinf(times).all()
+
+def register(grid, bodies, swept):
+    for body, fast in zip(bodies, swept):
+        position = tuple(body.position)
+        start = sweep_start(body, position) if fast else None
+        grid.insert(body, start=start, position=position, previous=step_start(body, position))
+
+def run_swept_contacts(bodies, swept):
+    grid = SpatialHash()
+    register(grid, bodies, swept)
+    first, second = grid.candidate_indices()
+    positions = np.column_stack((grid.xs, grid.ys))
+    reaches = np.array(grid.reaches, dtype=float)
+    hits, normals, depths = circle_overlaps(positions, reaches, first, second)
+    swept_contacts(grid, positions, reaches, first, second, hits, normals, depths)
+    return hits, normals, depths
+
+def test_fast_mover_hits_a_target_crossing_its_path():
+    shot = Body((0, 0), (100, 0), 5)
+    target = Body((50, -50), (50, 50), 5)                           # Not swept, misses the shot's path at its end
+    hits, normals, depths = run_swept_contacts([shot, target], [True, False])
+    assert hits[0] and depths[0] == pytest.approx(CCD_CONTACT_SLOP)
+    assert tuple(target.position) == (50, 50)                       # The unswept object stays where it ended
+    assert shot.position.distance_to(target.position) == pytest.approx(10 - CCD_CONTACT_SLOP)
+
+def test_two_fast_movers_are_both_placed_at_the_impact():
+    first = Body((0, 0), (100, 0), 5)
+    second = Body((100, 0), (0, 0), 5)                              # They pass through each other in one step
+    hits, normals, depths = run_swept_contacts([first, second], [True, True])
+    assert hits[0] and depths[0] > 0
+    assert tuple(normals[0]) == pytest.approx((-1, 0))
+    assert tuple(second.position) == pytest.approx((55, 0))         # Where it was at t = 0.45
+    assert tuple(first.position) == pytest.approx((45 + CCD_CONTACT_SLOP, 0))
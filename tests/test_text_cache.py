@@ -0,0 +1,46 @@
+import pygame
+import pytest
+from constants import FONT_SIZE
+from text_cache import TextCache
+
+WHITE = (255, 255, 255)
+
+@pytest.fixture(autouse=True)
+def fonts():
+    pygame.font.init()
+
+def size_of(surface):
+    return surface.get_pitch() * surface.get_height()
+
+def test_repeated_renders_return_the_cached_surface():
+    cache = TextCache()
+    surface = cache.render("*", WHITE)
+    assert cache.render("*", [255, 255, 255]) is surface           # Colors given as lists share the key
+    assert cache.render("*", WHITE, size=40) is not surface
+    stats = cache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['bytes']) == (2, 1, 2, cache.bytes)
+
+def test_least_recently_used_surface_is_evicted_at_the_byte_cap():
+    probe = TextCache()
+    one = size_of(probe.render("a", WHITE))
+    cache = TextCache(max_bytes=one * 2)                            # Room for two one-glyph surfaces
+    a = cache.render("a", WHITE)
+    cache.render("a", (0, 0, 0))
+    cache.render("a", WHITE)                                        # White is now the most recently used
+    cache.render("a", (255, 0, 0))
+    assert list(cache.surfaces) == [("a", WHITE, FONT_SIZE), ("a", (255, 0, 0), FONT_SIZE)]
+    assert cache.surfaces[("a", WHITE, FONT_SIZE)] is a
+    assert cache.evictions == 1 and cache.bytes == one * 2 <= cache.max_bytes
+
+def test_surface_larger_than_the_cap_is_still_returned_and_kept_alone():
+    cache = TextCache(max_bytes=1)
+    cache.render("a", WHITE)
+    surface = cache.render("a long line of text", WHITE)
+    assert list(cache.surfaces.values()) == [surface]
+    assert cache.evictions == 1 and cache.bytes == size_of(surface)
+
+def test_clear_empties_the_cache():
+    cache = TextCache()
+    cache.render("^", WHITE)
+    cache.clear()
+    assert cache.stats()['entries'] == 0 and cache.bytes == 0
@@ -0,0 +1,73 @@
+import pygame
+import pytest
+from timers import SimulationClock, Expiring, schedule, every
+
+class Spark(Expiring, pygame.sprite.Sprite):
+    pass
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimulationClock()
+    monkeypatch.setattr(SimulationClock, 'active', clock)
+    return clock
+
+def test_scheduling_without_an_active_clock_raises(monkeypatch):
+    monkeypatch.setattr(SimulationClock, 'active', None)
+    with pytest.raises(RuntimeError):
+        schedule(1, lambda: None)
+    with pytest.raises(RuntimeError):
+        every(1, lambda: None)
+
+def test_one_shot_fires_once_when_due(clock):
+    fired = []
+    schedule(0.5, lambda: fired.append(clock.now))
+    clock.advance(0.25)
+    assert fired == []
+    clock.advance(0.25)
+    clock.advance(1)
+    assert fired == [0.5]
+
+def test_repeating_timer_stops_when_cancelled_by_its_callback(clock):
+    fired = []
+    def tick():
+        fired.append(clock.now)
+        if len(fired) == 3:
+            timer.cancel()
+    timer = every(1, tick)
+    for _ in range(6):
+        clock.advance(1)
+    assert fired == [1, 2, 3]
+
+def test_killing_cancels_the_expiry(clock):
+    group = pygame.sprite.Group()
+    spark = Spark(group)
+    spark.expire_in(1)
+    timer = spark.expiry
+    spark.kill()
+    assert timer.callback is None and spark.expiry is None
+    clock.advance(2)
+    assert clock.fired == 0
+
+def test_respawned_sprite_is_not_killed_by_its_previous_life(clock):
+    group = pygame.sprite.Group()
+    spark = Spark(group)
+    spark.expire_in(1)
+    clock.advance(0.5)
+    spark.kill()                                                    # Dies early, then comes back
+    spark.add(group)
+    spark.expire_in(1)
+    clock.advance(0.75)                                             # Past the first lifetime
+    assert spark.alive()
+    clock.advance(0.5)                                              # Past the second one
+    assert not spark.alive()
+    assert spark.expiry is None
+
+def test_expiry_kills_each_sprite_at_its_own_time(clock):
+    group = pygame.sprite.Group()
+    sparks = [Spark(group) for _ in range(3)]
+    for lifetime, spark in zip((0.3, 0.1, 0.2), sparks):
+        spark.expire_in(lifetime)
+    clock.advance(0.15)
+    assert [spark.alive() for spark in sparks] == [True, False, True]
+    clock.advance(0.1)
+    assert [spark.alive() for spark in sparks] == [True, False, False]
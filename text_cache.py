@@ -0,0 +1,84 @@
+"""
+Shared fonts and a least-recently-used cache of rendered text surfaces.
+
+Fonts are created once per size by `get_font` and shared by everything that draws text. `render_text`
+returns the surface for a (text, color, size) key, rasterizing it only on a cache miss, so the thruster,
+trail and shrapnel glyphs that are drawn hundreds of times a second are rendered once. The cache evicts
+the least recently used surfaces once their pixel memory exceeds `TEXT_CACHE_MAX_BYTES`.
+
+Cached surfaces are shared between callers and must only be blitted, never drawn on.
+"""
+
+from collections import OrderedDict
+import pygame
+from constants import FONT_SIZE, TEXT_CACHE_MAX_BYTES
+
+fonts = {}                                                  # Font size -> shared pygame Font
+
+def get_font(size=FONT_SIZE):
+    """Returns the shared default font of `size`, creating it on first use."""
+    font = fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        fonts[size] = font
+    return font
+
+class TextCache():
+    """
+    LRU cache of antialiased text surfaces keyed by (text, color, size).
+
+    Attributes:
+        max_bytes (int): Pixel memory the cached surfaces may use before the oldest are evicted.
+        bytes (int): Pixel memory used by the cached surfaces.
+        hits (int): Renders served from the cache.
+        misses (int): Renders that had to rasterize the text.
+        evictions (int): Surfaces dropped to stay under `max_bytes`.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()                       # Key -> surface, least recently used first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, color, size=FONT_SIZE):
+        """Returns the rendered surface for `text` in `color` at font `size`."""
+        key = (text, tuple(color), size)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)                  # Most recently used goes last
+            return surface
+        self.misses += 1
+        surface = get_font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)  # Drop the least recently used surface
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Returns the cache counters, for the profiler and benchmarks."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.surfaces),                  # Surfaces currently cached
+            'bytes': self.bytes,                            # Pixel memory in use
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+text_cache = TextCache()                                    # Shared by FloatingText, State and the profiler
+
+def render_text(text, color, size=FONT_SIZE):
+    """Renders `text` through the shared cache, see `TextCache.render()`."""
+    return text_cache.render(text, color, size)
@@ -0,0 +1,120 @@
+"""
+Simulation clock with scheduled events.
+
+The `Game` owns one `SimulationClock` and advances it by the fixed step `dt`, so timed events follow
+simulated time: they stop while the simulation is not stepped and run faster in a fast-forwarded
+headless run. Events are kept in a min-heap ordered by due time. `advance()` pops only the events that
+are due, so an object whose lifetime has not run out costs nothing per step.
+
+Lifetimes of shots, shrapnel and floating texts are scheduled through the `Expiring` mixin, which cancels
+the event when the object dies early. The loot spawner delay and the asteroid, black hole and alien spawn
+intervals are scheduled events as well.
+"""
+
+import heapq
+from itertools import count
+
+class Timer():
+    """
+    Handle of one scheduled event, used to cancel it.
+
+    Attributes:
+        due (float): Simulated time the event fires at, in seconds.
+        callback (callable): Called without arguments when due, None once cancelled or fired.
+        interval (float): Seconds between repeats, None for a one-shot event.
+    """
+    __slots__ = ('due', 'callback', 'interval')
+
+    def __init__(self, due, callback, interval=None):
+        self.due = due
+        self.callback = callback
+        self.interval = interval
+
+    def cancel(self):
+        self.callback = None                                    # Left in the heap, skipped when it comes up
+
+class SimulationClock():
+    """
+    Simulated time and the events scheduled on it.
+
+    Attributes:
+        now (float): Simulated seconds since the clock was created.
+        queue (list): Heap of (due, sequence, Timer), earliest first.
+        fired (int): Events fired by the last `advance()`.
+    """
+    active = None                                               # Clock of the running game, set by the `Game`
+
+    def __init__(self):
+        self.now = 0.0
+        self.queue = []
+        self.sequence = count()                                 # Keeps events due at the same time in scheduling order
+        self.fired = 0
+
+    def push(self, timer):
+        heapq.heappush(self.queue, (timer.due, next(self.sequence), timer))
+        return timer
+
+    def schedule(self, delay, callback):
+        """Calls `callback` once `delay` simulated seconds have passed, returns its `Timer`."""
+        return self.push(Timer(self.now + delay, callback))
+
+    def every(self, interval, callback):
+        """Calls `callback` every `interval` simulated seconds until the returned `Timer` is cancelled."""
+        return self.push(Timer(self.now + interval, callback, interval))
+
+    def advance(self, dt):
+        """Moves the clock forward by `dt` seconds and fires every event that became due, in order."""
+        self.now += dt
+        queue = self.queue
+        fired = 0
+        while queue and queue[0][0] <= self.now:
+            timer = heapq.heappop(queue)[2]
+            callback = timer.callback
+            if callback is None:
+                continue                                        # Cancelled
+            if timer.interval is None:
+                timer.callback = None                           # One-shot events fire once
+            callback()
+            fired += 1
+            if timer.interval is not None and timer.callback is not None:   # Not cancelled by its own callback
+                timer.due += timer.interval
+                self.push(timer)
+        self.fired = fired
+
+    def __len__(self):
+        return len(self.queue)
+
+def active_clock():
+    """Returns the active clock. Without one, nothing would ever fire, so that is an error."""
+    clock = SimulationClock.active
+    if clock is None:
+        raise RuntimeError("No active SimulationClock: create a Game, or set SimulationClock.active, before spawning timed objects")
+    return clock
+
+def schedule(delay, callback):
+    """Schedules an event on the active clock, returns its `Timer`."""
+    return active_clock().schedule(delay, callback)
+
+def every(interval, callback):
+    """Schedules a repeating event on the active clock, returns its `Timer`."""
+    return active_clock().every(interval, callback)
+
+class Expiring():
+    """
+    Mixin for sprites killed after a lifetime in simulated seconds. The expiry is cancelled when the
+    sprite is killed earlier, so a pooled object reused later is never killed by its previous life.
+    """
+    expiry = None                                               # Timer of the scheduled death
+
+    def expire_in(self, seconds):
+        self.expiry = schedule(seconds, self.expire)
+
+    def expire(self):
+        self.expiry = None
+        self.kill()
+
+    def kill(self):
+        if self.expiry is not None:
+            self.expiry.cancel()
+            self.expiry = None
+        super().kill()
@@ -0,0 +1,91 @@
+"""
+Fixed-timestep simulation helpers.
+
+The game loop renders as often as the display allows but advances the simulation in fixed steps of
+`1 / SIMULATION_TICK_RATE` seconds, so physics behaves the same at any frame rate. `FixedTimestep` keeps
+the time accumulator and caps catch-up steps to avoid the spiral of death on slow frames. Between two
+simulation steps, drawing interpolates every sprite between its previous and current state.
+"""
+
+import pygame
+from contextlib import contextmanager
+from constants import REFERENCE_TICK_RATE, SCREEN_WIDTH
+
+def scaled_friction(friction, dt):
+    """Converts a per-frame friction factor tuned at REFERENCE_TICK_RATE into the factor for a step of `dt`."""
+    return friction ** (dt * REFERENCE_TICK_RATE)
+
+class FixedTimestep():
+    """
+    Accumulates real frame time and hands it out as fixed simulation steps.
+
+    Attributes:
+        dt (float): Length of one simulation step in seconds.
+        max_steps (int): Most steps run in one frame, excess time is dropped beyond it.
+        accumulator (float): Real time not yet simulated.
+        dropped_time (float): Total time discarded by the catch-up cap.
+    """
+
+    def __init__(self, tick_rate, max_steps):
+        self.dt = 1 / tick_rate                 # Fixed simulation step in seconds
+        self.max_steps = max_steps              # Cap on catch-up steps per frame
+        self.accumulator = 0.0                  # Frame time waiting to be simulated
+        self.dropped_time = 0.0                 # Time skipped to escape the spiral of death
+
+    def advance(self, frame_time):
+        """Adds a frame's real duration and returns how many simulation steps to run now."""
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.dt     # Give up on time we cannot catch up
+            steps = self.max_steps
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step between the last simulated state and the next one, used to interpolate."""
+        return min(self.accumulator / self.dt, 1.0)
+
+def snapshot_states(sprites):
+    """Stores every sprite's position and rotation before a simulation step, for render interpolation."""
+    for sprite in sprites:
+        position = getattr(sprite, 'position', None)
+        if position is not None:
+            sprite.previous_position = pygame.Vector2(position)
+            sprite.previous_rotation = getattr(sprite, 'rotation', None)
+
+@contextmanager
+def interpolated(sprites, alpha):
+    """
+    Temporarily moves sprites to their interpolated state for drawing and restores them afterwards.
+
+    Sprites that have not been stepped yet, or that jumped further than half the screen (wrapping
+    around an edge), are drawn at their current state.
+    """
+    saved = []
+    max_jump = SCREEN_WIDTH / 2
+    for sprite in sprites:
+        previous = getattr(sprite, 'previous_position', None)
+        if previous is None:
+            continue
+        current = sprite.position
+        rotation = getattr(sprite, 'rotation', None)
+        if previous == current and rotation == sprite.previous_rotation:
+            continue                                                    # Nothing moved, nothing to blend
+        if previous.distance_to(current) > max_jump:
+            continue                                                    # Wrapped around the screen, do not smear
+        saved.append((sprite, current, rotation))
+        sprite.position = previous.lerp(current, alpha)
+        if rotation is not None:
+            turn = (rotation - sprite.previous_rotation + 180) % 360 - 180  # Shortest way round between the rotations
+            sprite.rotation = (sprite.previous_rotation + turn * alpha) % 360
+    try:
+        yield
+    finally:
+        for sprite, position, rotation in saved:
+            sprite.position = position
+            if rotation is not None:
+                sprite.rotation = rotation